@@ -0,0 +1,64 @@
+# ===== BACKEND/APP/API/V1/ENDPOINTS/ADMIN.PY =====
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from ....models.schemas import ModelReloadRequest
+from ....core.admin import require_admin
+from ....core.profiling import profile_store
+from ....core.responses import ORJSONResponse
+from ....services import model_registry
+from ....services.ml_service import loaded_ml_service
+from ....services.model_reload import model_reloader
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+def _model_status():
+    service = loaded_ml_service()
+    return {
+        'active_version': service.artifact_version if service else None,
+        'model_version': service.model_version if service else None,
+        'promoted_version': model_registry.current_version(),
+        'available_versions': model_registry.list_versions(),
+        'reload': model_reloader.status,
+        'last_shadow_report': model_reloader.last_shadow_report
+    }
+
+@router.get("/models")
+async def get_model_status():
+    """
+    Active, promoted and available model versions plus the last reload result
+    """
+    try:
+        return _model_status()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error reading model status: {str(e)}")
+
+@router.post("/models/reload", status_code=202)
+async def reload_models(request: ModelReloadRequest):
+    """
+    Load a model version in the background and swap it in without downtime.
+    With shadow=true the version is only compared against the live model.
+    """
+    if request.version is not None and not model_registry.version_exists(request.version):
+        raise HTTPException(status_code=404, detail=f"Unknown model version: {request.version}")
+    if not model_reloader.start(request.version, shadow=request.shadow):
+        raise HTTPException(status_code=409, detail="A model reload is already in progress")
+    return ORJSONResponse(_model_status(), status_code=202)
+
+@router.get("/profiles")
+async def list_profiles():
+    """
+    Recently profiled requests (send X-Profile: 1 with the admin token to profile one)
+    """
+    return {'profiles': profile_store.list()}
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str, profile_format: str = Query("json", alias="format", pattern="^(json|collapsed)$")):
+    """
+    One request profile; format=collapsed returns flamegraph-ready collapsed stacks
+    """
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Unknown profile: {profile_id}")
+    if profile_format == "collapsed":
+        return PlainTextResponse(profile['collapsed'])
+    return profile
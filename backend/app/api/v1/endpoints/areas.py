@@ -1,23 +1,93 @@
 # ===== BACKEND/APP/API/V1/ENDPOINTS/AREAS.PY =====
-from fastapi import APIRouter, HTTPException
-from ...models.schemas import TopAreasResponse
-from ...services.ml_service import MLService
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from ....models.schemas import TopAreasResponse, SimilarMarketsResponse, CountyHistoryResponse
+from ....models.database import County
+from ....core.database import get_db
+from ....core.config import settings
+from ....core.http_cache import make_etag, is_not_modified, cache_headers, not_modified_response
+from ....core.responses import ORJSONResponse
+from ....services.ml_service import MLService, get_ml_service
+from ....services.result_cache import result_cache
+from ....services.rollups import get_county_monthly_stats
+from ....services.singleflight import SingleFlight
 from datetime import datetime
+from typing import Optional
 
 router = APIRouter()
-ml_service = MLService()
+areas_flight = SingleFlight("areas")
 
 @router.get("/top", response_model=TopAreasResponse)
-async def get_top_areas():
+async def get_top_areas(request: Request, ml_service: MLService = Depends(get_ml_service)):
     """
     Get top 5 investment areas in California
     """
     try:
-        areas_data = ml_service.get_top_investment_areas()
-        return TopAreasResponse(
-            areas=areas_data,
-            last_updated=datetime.now()
+        data_version = await run_in_threadpool(ml_service.current_data_version)
+        etag = make_etag("areas/top", ml_service.model_version, data_version)
+        if is_not_modified(request, etag, ml_service.updated_at):
+            return not_modified_response(etag, ml_service.updated_at, settings.HTTP_CACHE_MAX_AGE)
+        
+        # The SQLite cache lookup (and the compute on a miss) runs in the threadpool, shared by concurrent callers
+        areas_data = await areas_flight.run(
+            etag, result_cache.get_or_compute, "areas/top", etag, ml_service.get_top_investment_areas
+        )
+        return ORJSONResponse(
+            {'areas': areas_data, 'last_updated': ml_service.updated_at},
+            headers=cache_headers(etag, ml_service.updated_at, settings.HTTP_CACHE_MAX_AGE)
         )
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading top areas: {str(e)}")
+
+@router.get("/{county}/similar", response_model=SimilarMarketsResponse)
+async def get_similar_areas(
+    county: str,
+    k: int = Query(5, ge=1, le=50),
+    ml_service: MLService = Depends(get_ml_service)
+):
+    """
+    Get the k markets most similar to a county by investment features
+    """
+    try:
+        # The first call after a data change rebuilds the KD-tree and investment table; keep it off the event loop
+        similar = await run_in_threadpool(ml_service.find_similar_markets, county, k)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error finding similar areas: {str(e)}")
+    
+    if similar is None:
+        raise HTTPException(status_code=404, detail=f"Unknown county: {county}")
+    return {'county': county, 'similar': similar}
+
+@router.get("/{county}/history", response_model=CountyHistoryResponse)
+async def get_county_history(
+    request: Request,
+    county: str,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Get monthly price and economic aggregates for a county from the rollup table
+    """
+    name = county if county.lower().endswith(" county") else f"{county} County"
+    county_row = db.query(County).filter(func.lower(County.name) == name.lower()).first()
+    if county_row is None:
+        raise HTTPException(status_code=404, detail=f"Unknown county: {county}")
+    
+    try:
+        months = get_county_monthly_stats(db, county_row.id, start, end)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error loading county history: {str(e)}")
+    
+    last_modified = max((month.pop('refreshed_at') for month in months), default=None)
+    etag = make_etag("areas/history", county_row.id, start, end, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, last_modified, settings.HTTP_CACHE_MAX_AGE)
+    
+    return ORJSONResponse(
+        {'county': county_row.name, 'months': months},
+        headers=cache_headers(etag, last_modified, settings.HTTP_CACHE_MAX_AGE)
+    )
@@ -0,0 +1,33 @@
+# ===== BACKEND/APP/API/V1/ENDPOINTS/AUTOCOMPLETE.PY =====
+from fastapi import APIRouter, HTTPException, Query, Request
+from ....models.schemas import AutocompleteResponse
+from ....core.config import settings
+from ....core.http_cache import make_etag, is_not_modified, cache_headers, not_modified_response
+from ....core.responses import ORJSONResponse
+from ....services.autocomplete import place_index
+
+router = APIRouter()
+
+@router.get("", response_model=AutocompleteResponse)
+async def autocomplete(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200, description="Partial address, city, ZIP or county"),
+    limit: int = Query(8, ge=1, le=25)
+):
+    """
+    Suggest known cities, ZIP codes and counties for a partial address
+    """
+    try:
+        index = place_index.get()
+        # Suggestions echo the query and keep its street spelling, so hash it as sent
+        etag = make_etag("autocomplete", q, limit, place_index.version)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, max_age=settings.HTTP_CACHE_MAX_AGE)
+        
+        return ORJSONResponse(
+            {'query': q, 'suggestions': index.search(q, limit)},
+            headers=cache_headers(etag, max_age=settings.HTTP_CACHE_MAX_AGE)
+        )
+    
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error completing address: {str(e)}")
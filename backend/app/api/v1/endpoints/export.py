@@ -0,0 +1,22 @@
+# ===== BACKEND/APP/API/V1/ENDPOINTS/EXPORT.PY =====
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+from ....services.export import iter_forecast_export, MEDIA_TYPES
+from ....services.ml_service import MLService, get_ml_service
+
+router = APIRouter()
+
+@router.get("/forecasts")
+async def export_forecasts(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    chunk_size: int = Query(500, ge=1, le=10000),
+    ml_service: MLService = Depends(get_ml_service)
+):
+    """
+    Stream forecasts and investment scores for every market as NDJSON or CSV
+    """
+    return StreamingResponse(
+        iter_forecast_export(ml_service, export_format, chunk_size),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="forecasts.{export_format}"'}
+    )
@@ -1,23 +1,62 @@
 # ===== BACKEND/APP/API/V1/ENDPOINTS/FORECAST.PY =====
-from fastapi import APIRouter, Depends, HTTPException
-from ...models.schemas import ForecastResponse
-from ...services.ml_service import MLService
-from typing import str
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from starlette.concurrency import run_in_threadpool
+from ....models.schemas import ForecastResponse
+from ....core.config import settings
+from ....core.http_cache import make_etag, is_not_modified, cache_headers, not_modified_response
+from ....core.responses import ORJSONResponse
+from ....services.address import normalize_address
+from ....services.ml_service import MLService, get_ml_service, MAX_HORIZON_MONTHS
+from ....services.result_cache import result_cache
+from ....services.singleflight import SingleFlight
+from datetime import date
 
 router = APIRouter()
-ml_service = MLService()
+forecast_flight = SingleFlight("forecast")
 
 @router.get("/{address}", response_model=ForecastResponse)
-async def get_price_forecast(address: str):
+async def get_price_forecast(
+    request: Request,
+    address: str,
+    chart_format: str = Query("rows", alias="format", pattern="^(rows|columnar)$"),
+    horizon_months: int = Query(12, ge=1, le=MAX_HORIZON_MONTHS),
+    granularity: str = Query("monthly", pattern="^(monthly|weekly)$"),
+    ml_service: MLService = Depends(get_ml_service)
+):
     """
-    Get 12-month price forecast for a given address or ZIP code
+    Get a price forecast for a given address or ZIP code.
+    horizon_months (1-60) and granularity (monthly or weekly) shape the chart;
+    pass format=columnar to receive chart data as parallel arrays.
     """
+    if not address or len(address.strip()) < 3:
+        raise HTTPException(status_code=400, detail="Address must be at least 3 characters")
+    
     try:
-        if not address or len(address.strip()) < 3:
-            raise HTTPException(status_code=400, detail="Address must be at least 3 characters")
+        # Forecasts are deterministic per address, model version, data version and day;
+        # check the data files first so validators never describe data that was replaced
+        data_version = await run_in_threadpool(ml_service.current_data_version)
+        normalized = normalize_address(address)
+        cache_key = make_etag("forecast", normalized, chart_format, horizon_months, granularity,
+                              ml_service.model_version, data_version, date.today())
+        # The body echoes the address as sent, so the ETag covers the raw spelling too
+        etag = make_etag(cache_key, address)
+        # No Last-Modified: the body changes daily, not only when the models do
+        if is_not_modified(request, etag):
+            return not_modified_response(etag, max_age=settings.HTTP_CACHE_MAX_AGE)
         
-        forecast_data = ml_service.predict_price_forecast(address)
-        return ForecastResponse(**forecast_data)
+        # Concurrent requests for the same address share one cache lookup or computation,
+        # keyed on the normalized address
+        forecast_data = await forecast_flight.run(
+            (normalized, chart_format, horizon_months, granularity),
+            result_cache.get_or_compute, "forecast", cache_key, ml_service.predict_price_forecast, normalized,
+            chart_format=chart_format, horizon_months=horizon_months, granularity=granularity
+        )
+        forecast_data = {**forecast_data, 'address': address}
+        # Service output is trusted: serialize it directly instead of re-validating
+        return ORJSONResponse(
+            forecast_data,
+            headers=cache_headers(etag, max_age=settings.HTTP_CACHE_MAX_AGE)
+        )
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating forecast: {str(e)}")
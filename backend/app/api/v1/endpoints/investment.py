@@ -1,22 +1,37 @@
 # ===== BACKEND/APP/API/V1/ENDPOINTS/INVESTMENT.PY =====
 from fastapi import APIRouter, Depends, HTTPException
-from ...models.schemas import InvestmentRequest, InvestmentResponse
-from ...services.ml_service import MLService
+from starlette.concurrency import run_in_threadpool
+from ....models.schemas import InvestmentRequest, InvestmentResponse
+from ....core.http_cache import make_etag
+from ....core.responses import ORJSONResponse
+from ....services.address import normalize_address
+from ....services.ml_service import MLService, get_ml_service
+from ....services.result_cache import result_cache
+from ....services.singleflight import SingleFlight
 
 router = APIRouter()
-ml_service = MLService()
+investment_flight = SingleFlight("investment")
 
 @router.post("/score", response_model=InvestmentResponse)
-async def get_investment_score(request: InvestmentRequest):
+async def get_investment_score(request: InvestmentRequest, ml_service: MLService = Depends(get_ml_service)):
     """
     Get investment analysis and score for a given address
     """
+    if not request.address or len(request.address.strip()) < 3:
+        raise HTTPException(status_code=400, detail="Address must be at least 3 characters")
+    
     try:
-        if not request.address or len(request.address.strip()) < 3:
-            raise HTTPException(status_code=400, detail="Address must be at least 3 characters")
-        
-        analysis_data = ml_service.predict_investment_score(request.address)
-        return InvestmentResponse(**analysis_data)
+        # Concurrent requests for the same address share one cache lookup or computation
+        data_version = await run_in_threadpool(ml_service.current_data_version)
+        normalized = normalize_address(request.address)
+        cache_key = make_etag("investment", normalized, ml_service.model_version, data_version)
+        analysis_data = await investment_flight.run(
+            normalized, result_cache.get_or_compute, "investment", cache_key,
+            ml_service.predict_investment_score, normalized
+        )
+        analysis_data = {**analysis_data, 'address': request.address}
+        # Service output is trusted: serialize it directly instead of re-validating
+        return ORJSONResponse(analysis_data)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing investment: {str(e)}")
@@ -0,0 +1,85 @@
+# ===== BACKEND/APP/API/V1/ENDPOINTS/JOBS.PY =====
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import Optional
+import asyncio
+from ....models.schemas import BatchJobRequest
+from ....core.config import settings
+from ....core.responses import ORJSONResponse, dumps
+from ....services.jobs import job_store, job_runner, FINISHED_STATUSES
+
+router = APIRouter()
+
+def _links(job_id: str):
+    base = f"/api/v1/jobs/{job_id}"
+    return {'status': base, 'events': f"{base}/events", 'results': f"{base}/results"}
+
+# Store calls are synchronous SQLite and can wait on busy workers, so they run in the threadpool
+async def _get_job(job_id: str):
+    job = await run_in_threadpool(job_store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return job
+
+@router.post("", status_code=202)
+async def submit_job(request: BatchJobRequest):
+    """
+    Queue a batch forecast for many addresses and return its job id immediately
+    """
+    if len(request.addresses) > settings.JOB_MAX_ADDRESSES:
+        raise HTTPException(status_code=413, detail=f"At most {settings.JOB_MAX_ADDRESSES} addresses per job")
+    try:
+        job_id = await run_in_threadpool(
+            job_store.submit, request.addresses, request.chunk_size or settings.JOB_CHUNK_SIZE, request.top_k
+        )
+        job_runner.notify()
+        job = await run_in_threadpool(job_store.get, job_id)
+        return ORJSONResponse({**job, 'links': _links(job_id)}, status_code=202)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error submitting job: {str(e)}")
+
+@router.get("/{job_id}")
+async def get_job(job_id: str):
+    """
+    Job status and progress (processed / total addresses)
+    """
+    return {**await _get_job(job_id), 'links': _links(job_id)}
+
+@router.get("/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request):
+    """
+    Server-Sent Events: a 'progress' event whenever the job advances, then 'done' or 'failed'
+    """
+    await _get_job(job_id)
+
+    async def events():
+        last = None
+        while True:
+            job = await run_in_threadpool(job_store.get, job_id)
+            if job is None:
+                return
+            if job != last:
+                event = job['status'] if job['status'] in FINISHED_STATUSES else "progress"
+                yield f"event: {event}\ndata: {dumps(job).decode()}\n\n"
+                last = job
+            if job['status'] in FINISHED_STATUSES or await request.is_disconnected():
+                return
+            await asyncio.sleep(settings.JOB_POLL_INTERVAL_SECONDS)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@router.get("/{job_id}/results")
+async def get_job_results(job_id: str, offset: int = Query(0, ge=0), limit: Optional[int] = Query(None, ge=1)):
+    """
+    Scored rows of a finished job, in submission order (page with offset and limit)
+    """
+    job = await _get_job(job_id)
+    if job['status'] != "done":
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}; results are available once it is done")
+    try:
+        results = await run_in_threadpool(job_store.results, job_id, offset, limit)
+        return {**job, 'offset': offset, 'results': results}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error reading job results: {str(e)}")
@@ -1,72 +1,56 @@
 # ===== BACKEND/APP/API/V1/ENDPOINTS/RENTAL.PY =====
+import math
+import numpy as np
 from fastapi import APIRouter, HTTPException
-from ...models.schemas import RentalCalculationRequest, RentalCalculationResponse
+from ....models.schemas import (
+    RentalCalculationRequest, RentalCalculationResponse, RentalSolveRequest, RentalSolveResponse
+)
+from ....services.rental import rental_returns, scenario_arrays, solve_rental_targets
 
 router = APIRouter()
 
+def _rounded(value: float):
+    return None if not math.isfinite(value) else round(float(value), 2)
+
 @router.post("/calculate", response_model=RentalCalculationResponse)
 async def calculate_rental_returns(request: RentalCalculationRequest):
     """
     Calculate rental property investment returns and cap rate
     """
     try:
-        # Extract values from request
-        purchase_price = request.purchase_price
-        down_payment_amount = purchase_price * (request.down_payment_percent / 100)
-        loan_amount = purchase_price - down_payment_amount
-        
-        # Monthly mortgage payment calculation
-        monthly_rate = request.interest_rate / 100 / 12
-        num_payments = request.loan_term_years * 12
-        
-        if monthly_rate > 0:
-            monthly_mortgage = (loan_amount * monthly_rate * (1 + monthly_rate)**num_payments) / \
-                             ((1 + monthly_rate)**num_payments - 1)
-        else:
-            monthly_mortgage = loan_amount / num_payments
-        
-        # Monthly expenses
-        monthly_property_tax = (purchase_price * request.property_tax_percent / 100) / 12
-        monthly_insurance = request.annual_insurance / 12
-        monthly_maintenance = (purchase_price * request.maintenance_percent / 100) / 12
-        monthly_capex = (purchase_price * request.capex_percent / 100) / 12
-        
-        # Effective rental income (after vacancy)
-        effective_monthly_rent = request.monthly_rent * (1 - request.vacancy_percent / 100)
-        monthly_management_fee = effective_monthly_rent * (request.management_fee_percent / 100)
-        
-        # Net Operating Income calculation
-        monthly_operating_expenses = (monthly_property_tax + monthly_insurance + 
-                                    monthly_maintenance + monthly_capex + monthly_management_fee)
-        monthly_noi = effective_monthly_rent - monthly_operating_expenses
-        annual_noi = monthly_noi * 12
-        
-        # Cap rate calculation
-        cap_rate = (annual_noi / purchase_price) * 100
-        
-        # Cash flow calculation
-        monthly_cash_flow = monthly_noi - monthly_mortgage
-        annual_cash_flow = monthly_cash_flow * 12
-        
-        # Cash-on-cash return
-        closing_costs = purchase_price * 0.03  # Assume 3% closing costs
-        total_cash_invested = down_payment_amount + closing_costs
-        cash_on_cash_return = (annual_cash_flow / total_cash_invested) * 100
-        
-        # Total return including appreciation
-        annual_appreciation = purchase_price * (request.appreciation_percent / 100)
-        total_annual_return = annual_cash_flow + annual_appreciation
-        total_return_percent = (total_annual_return / total_cash_invested) * 100
-        
-        return RentalCalculationResponse(
-            cap_rate=round(cap_rate, 2),
-            cash_on_cash_return=round(cash_on_cash_return, 2),
-            monthly_cash_flow=round(monthly_cash_flow, 2),
-            annual_cash_flow=round(annual_cash_flow, 2),
-            total_return_percent=round(total_return_percent, 2),
-            noi=round(annual_noi, 2),
-            total_cash_invested=round(total_cash_invested, 2)
-        )
-    
+        returns = rental_returns(request.model_dump())
+        return RentalCalculationResponse(**{name: round(float(value), 2) for name, value in returns.items()})
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error calculating rental returns: {str(e)}")
+
+@router.post("/solve", response_model=RentalSolveResponse)
+async def solve_rental_targets_endpoint(request: RentalSolveRequest):
+    """
+    Break-even rent, maximum purchase price and minimum down payment for
+    every scenario and cash-on-cash target, solved in one vectorized pass
+    """
+    try:
+        scenarios = scenario_arrays([scenario.model_dump() for scenario in request.scenarios])
+        returns = rental_returns(scenarios)
+        solved = solve_rental_targets(scenarios, request.target_cash_on_cash, request.target_monthly_cash_flow)
+
+        solutions = []
+        for i in range(len(request.scenarios)):
+            solutions.append({
+                'break_even_rent': _rounded(solved['break_even_rent'][i]),
+                'current': {name: _rounded(values[i]) for name, values in returns.items()},
+                'targets': [
+                    {
+                        'target_cash_on_cash': target,
+                        'max_purchase_price': _rounded(solved['max_purchase_price'][i, j]),
+                        'max_purchase_price_unbounded': bool(np.isposinf(solved['max_purchase_price'][i, j])),
+                        'min_down_payment_percent': _rounded(solved['min_down_payment_percent'][i, j])
+                    }
+                    for j, target in enumerate(request.target_cash_on_cash)
+                ]
+            })
+        return RentalSolveResponse(solutions=solutions)
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error solving rental targets: {str(e)}")
@@ -1,14 +1,26 @@
 # ===== BACKEND/APP/API/V1/ROUTER.PY =====
 from fastapi import APIRouter
-from .endpoints import forecast, investment, areas, rental
+from .endpoints import forecast, investment, areas, rental, export, jobs, admin, autocomplete
+from ...core.metrics import metrics
+from ...core.responses import ORJSONResponse
+from ...services.result_cache import result_cache
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 api_router.include_router(forecast.router, prefix="/forecast", tags=["forecasting"])
 api_router.include_router(investment.router, prefix="/investment", tags=["investment"])
 api_router.include_router(areas.router, prefix="/areas", tags=["areas"])
 api_router.include_router(rental.router, prefix="/rental", tags=["rental"])
+api_router.include_router(export.router, prefix="/export", tags=["export"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
+api_router.include_router(autocomplete.router, prefix="/autocomplete", tags=["autocomplete"])
 
 @api_router.get("/health")
 async def health_check():
     return {"status": "healthy", "service": "real-estate-api"}
+
+@api_router.get("/metrics")
+async def get_metrics():
+    """In-process counters and gauges for this worker, plus result cache hit rates"""
+    return {**metrics.snapshot(), "result_cache": result_cache.stats()}
@@ -0,0 +1,12 @@
+# ===== BACKEND/APP/CORE/ADMIN.PY =====
+from fastapi import Header, HTTPException
+from typing import Optional
+import hmac
+from .config import settings
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Gate operational endpoints behind the ADMIN_TOKEN shared secret"""
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin API is disabled; set ADMIN_TOKEN to enable it")
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, settings.ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
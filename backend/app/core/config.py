@@ -27,8 +27,61 @@ class Settings(BaseSettings):
         "*"  # Remove in production
     ]
     
+    # Responses larger than this (in bytes) are gzip/brotli compressed
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+    
+    # Cache-Control max-age (seconds) for ETag-validated GET endpoints
+    HTTP_CACHE_MAX_AGE: int = int(os.getenv("HTTP_CACHE_MAX_AGE", "300"))
+    
+    # Per-client token buckets (tokens; routes cost 1-10) and inference load shedding
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_BURST: int = int(os.getenv("RATE_LIMIT_BURST", "120"))
+    RATE_LIMIT_REFILL_PER_SECOND: float = float(os.getenv("RATE_LIMIT_REFILL_PER_SECOND", "10"))
+    MAX_INFERENCE_QUEUE_DEPTH: int = int(os.getenv("MAX_INFERENCE_QUEUE_DEPTH", "32"))
+    # Identify clients by X-Real-IP/X-Forwarded-For (only behind a trusted proxy)
+    TRUST_PROXY_HEADERS: bool = os.getenv("TRUST_PROXY_HEADERS", "false").lower() == "true"
+    # Comma-separated API keys that get their own bucket via X-API-Key; other callers are keyed by IP
+    # (a str, not List[str]: pydantic-settings would JSON-decode the env var)
+    RATE_LIMIT_API_KEYS: str = os.getenv("RATE_LIMIT_API_KEYS", "")
+    
+    # Result cache shared by all workers on this host (SQLite, WAL mode)
+    RESULT_CACHE_ENABLED: bool = os.getenv("RESULT_CACHE_ENABLED", "true").lower() == "true"
+    RESULT_CACHE_PATH: str = os.getenv("RESULT_CACHE_PATH", "cache/results.sqlite3")
+    RESULT_CACHE_MAX_MB: int = int(os.getenv("RESULT_CACHE_MAX_MB", "256"))
+    
+    # Batch forecast jobs: state in a local SQLite file, processed by a per-worker thread pool (0 disables)
+    JOB_STORE_PATH: str = os.getenv("JOB_STORE_PATH", "cache/jobs.sqlite3")
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_CHUNK_SIZE: int = int(os.getenv("JOB_CHUNK_SIZE", "200"))
+    JOB_MAX_ADDRESSES: int = int(os.getenv("JOB_MAX_ADDRESSES", "100000"))
+    JOB_POLL_INTERVAL_SECONDS: float = float(os.getenv("JOB_POLL_INTERVAL_SECONDS", "0.5"))
+    # Finished jobs and their results are deleted after this long
+    JOB_RETENTION_HOURS: int = int(os.getenv("JOB_RETENTION_HOURS", "24"))
+    
+    # Seeded market data written by app.scripts.seed_data
+    DATA_PATH: str = os.getenv("DATA_PATH", "backend/data/")
+    # Storage format for datasets: parquet, arrow (IPC, memory-mapped) or csv
+    DATA_FORMAT: str = os.getenv("DATA_FORMAT", "parquet")
+    PARQUET_ROW_GROUP_SIZE: int = int(os.getenv("PARQUET_ROW_GROUP_SIZE", "65536"))
+    
     # ML Model settings
     MODEL_PATH: str = "app/models/trained_models/"
+    # Tuned hyperparameters (written by app.scripts.tune_models); tracked in git, unlike trained models
+    HYPERPARAMETERS_PATH: str = os.getenv("HYPERPARAMETERS_PATH", "app/models/hyperparameters.json")
+    # Poll the promoted-version pointer and hot-swap new models (0 disables)
+    MODEL_WATCH_INTERVAL_SECONDS: int = int(os.getenv("MODEL_WATCH_INTERVAL_SECONDS", "30"))
+    
+    # Admin endpoints require this value in the X-Admin-Token header (disabled when empty)
+    ADMIN_TOKEN: str = os.getenv("ADMIN_TOKEN", "")
+    # Admin-requested request profiles (X-Profile: 1): sampling interval and how many to keep
+    PROFILE_SAMPLE_INTERVAL_MS: float = float(os.getenv("PROFILE_SAMPLE_INTERVAL_MS", "1"))
+    PROFILE_HISTORY: int = int(os.getenv("PROFILE_HISTORY", "20"))
+    # Load models and run warm-up inference in a background thread at startup
+    WARMUP_ON_STARTUP: bool = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"
+    
+    @property
+    def rate_limit_api_keys(self) -> List[str]:
+        return [key.strip() for key in self.RATE_LIMIT_API_KEYS.split(",") if key.strip()]
     
     class Config:
         env_file = ".env"
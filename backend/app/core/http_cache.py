@@ -0,0 +1,52 @@
+# ===== BACKEND/APP/CORE/HTTP_CACHE.PY =====
+from fastapi import Request, Response
+from email.utils import format_datetime, parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+import hashlib
+
+def make_etag(*parts: Any) -> str:
+    """Build a strong ETag from the inputs that determine a response"""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:20]}"'
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes (e.g. from SQLite) as UTC"""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match uses weak comparison, so W/ prefixes are ignored
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against the current validators"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one-second resolution
+        return int(_as_utc(last_modified).timestamp()) <= int(since.timestamp())
+    
+    return False
+
+def cache_headers(etag: str, last_modified: Optional[datetime] = None, max_age: int = 0) -> Dict[str, str]:
+    """Validator and Cache-Control headers for a cacheable response"""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age}, must-revalidate"
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified).astimezone(timezone.utc), usegmt=True)
+    return headers
+
+def not_modified_response(etag: str, last_modified: Optional[datetime] = None, max_age: int = 0) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag, last_modified, max_age))
@@ -0,0 +1,39 @@
+# ===== BACKEND/APP/CORE/METRICS.PY =====
+from typing import Dict, Union
+import threading
+
+Number = Union[int, float]
+
+def _metric_key(name: str, labels: Dict[str, str]) -> str:
+    if not labels:
+        return name
+    label_str = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+    return f"{name}{{{label_str}}}"
+
+class Metrics:
+    """Minimal in-process counter and gauge registry"""
+
+    def __init__(self):
+        self._counters: Dict[str, Number] = {}
+        self._gauges: Dict[str, Number] = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: Number = 1, **labels: str):
+        key = _metric_key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: Number, **labels: str):
+        with self._lock:
+            self._gauges[_metric_key(name, labels)] = value
+
+    def get(self, name: str, **labels: str) -> Number:
+        key = _metric_key(name, labels)
+        with self._lock:
+            return self._counters.get(key, self._gauges.get(key, 0))
+
+    def snapshot(self) -> Dict[str, Dict[str, Number]]:
+        with self._lock:
+            return {"counters": dict(self._counters), "gauges": dict(self._gauges)}
+
+metrics = Metrics()
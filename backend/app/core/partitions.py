@@ -0,0 +1,47 @@
+# ===== BACKEND/APP/CORE/PARTITIONS.PY =====
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+from datetime import datetime
+from typing import Iterable, List
+import logging
+from .database import Base
+
+logger = logging.getLogger(__name__)
+
+# Tables declared PARTITION BY RANGE (date) in database/init.sql
+PARTITIONED_TABLES = ("price_history", "economic_indicators")
+
+def partition_name(table: str, year: int) -> str:
+    return f"{table}_y{year}"
+
+def prepare_schema(engine: Engine):
+    """
+    Make sure the schema exists.
+
+    PostgreSQL gets its partitioned schema from database/init.sql. Any other
+    backend (SQLite for local runs and tests) uses plain, unpartitioned tables
+    created from the ORM models.
+    """
+    if engine.dialect.name != "postgresql":
+        Base.metadata.create_all(engine)
+
+def ensure_partitions(connection: Connection, table: str, dates: Iterable[datetime]) -> List[str]:
+    """Create the yearly partitions of table needed to hold rows with these dates"""
+    if connection.dialect.name != "postgresql":
+        return []
+    if table not in PARTITIONED_TABLES:
+        raise ValueError(f"{table} is not a partitioned table")
+    
+    years = sorted({d.year for d in dates})
+    created = []
+    for year in years:
+        name = partition_name(table, year)
+        connection.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        ))
+        created.append(name)
+    
+    if created:
+        logger.info(f"Ensured partitions {created[0]}..{created[-1]} for {table}")
+    return created
@@ -0,0 +1,202 @@
+# ===== BACKEND/APP/CORE/PROFILING.PY =====
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import wraps
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+import hmac
+import os
+import sys
+import threading
+import time
+import uuid
+from .config import settings
+from .metrics import metrics
+
+# Set only while a profiled request runs; everything else sees None
+_active_profiler: ContextVar[Optional["SamplingProfiler"]] = ContextVar("active_profiler", default=None)
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+class SamplingProfiler:
+    """
+    Statistical profiler built on sys._current_frames().
+
+    A background thread snapshots the stacks of the registered threads every
+    interval seconds. The request's event-loop thread is always registered;
+    threadpool work joins through profile_thread(). Samples from the event
+    loop can include other coroutines that happened to be running, and
+    CPU-bound code is sampled at most once per GIL switch interval (5 ms by
+    default) whatever the configured interval.
+    """
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._threads: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sampler = None
+
+    def add_thread(self, ident: int):
+        with self._lock:
+            self._threads[ident] = self._threads.get(ident, 0) + 1
+
+    def remove_thread(self, ident: int):
+        with self._lock:
+            if self._threads.get(ident, 0) <= 1:
+                self._threads.pop(ident, None)
+            else:
+                self._threads[ident] -= 1
+
+    def start(self):
+        self.add_thread(threading.get_ident())
+        self._sampler = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        self._stop.set()
+        self._sampler.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                idents = list(self._threads)
+            frames = sys._current_frames()
+            for ident in idents:
+                frame = frames.get(ident)
+                if frame is None:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(_frame_name(frame))
+                    frame = frame.f_back
+                self.stacks[tuple(reversed(stack))] += 1
+                self.samples += 1
+
+    def collapsed(self) -> str:
+        """Brendan Gregg's collapsed-stack format: 'root;...;leaf count' per line"""
+        return "\n".join(f"{';'.join(stack)} {count}" for stack, count in self.stacks.most_common())
+
+    def top_functions(self, limit: int = 25) -> List[Dict[str, Any]]:
+        """Functions by samples on-CPU (self) and on-stack (total)"""
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        for stack, count in self.stacks.items():
+            self_counts[stack[-1]] += count
+            for name in set(stack):
+                total_counts[name] += count
+        return [
+            {'function': name, 'self_samples': self_counts[name], 'total_samples': total}
+            for name, total in total_counts.most_common(limit)
+        ]
+
+def profile_thread(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap fn so the thread running it is sampled if the calling request is being profiled"""
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return fn
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        ident = threading.get_ident()
+        profiler.add_thread(ident)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profiler.remove_thread(ident)
+    return wrapper
+
+def is_profiling() -> bool:
+    return _active_profiler.get() is not None
+
+class ProfileStore:
+    """The most recent request profiles, kept in memory"""
+
+    def __init__(self, maxlen: int):
+        self._profiles = deque(maxlen=maxlen)
+
+    def add(self, profile: Dict[str, Any]):
+        self._profiles.append(profile)
+
+    def get(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        return next((p for p in self._profiles if p['id'] == profile_id), None)
+
+    def list(self) -> List[Dict[str, Any]]:
+        return [
+            {key: value for key, value in p.items() if key not in ('collapsed', 'top_functions')}
+            for p in reversed(self._profiles)
+        ]
+
+profile_store = ProfileStore(settings.PROFILE_HISTORY)
+
+def _profile_requested(scope: Scope) -> Tuple[bool, Optional[str]]:
+    """(profile flag present, admin token) from the X-Profile header or ?profile=1"""
+    headers = Headers(scope=scope)
+    flag = headers.get("x-profile")
+    if flag is None and b"profile" in scope.get("query_string", b""):
+        flag = parse_qs(scope["query_string"].decode("latin-1")).get("profile", [None])[0]
+    return flag in ("1", "true"), headers.get("x-admin-token")
+
+class ProfilingMiddleware:
+    """
+    Run individual requests under the sampling profiler on demand.
+
+    A request is profiled only when it carries X-Profile: 1 (or ?profile=1)
+    and a valid X-Admin-Token; otherwise the flag is ignored. The profile
+    is kept in memory, its id is returned in the X-Profile-Id header, and it
+    can be fetched from /api/v1/admin/profiles/{id}. Requests without the
+    flag pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp, interval: float = 0.001):
+        self.app = app
+        self.interval = interval
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        requested, token = _profile_requested(scope)
+        if not requested or not settings.ADMIN_TOKEN or token is None \
+                or not hmac.compare_digest(token, settings.ADMIN_TOKEN):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex[:16]
+        status = {}
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                status['code'] = message["status"]
+                MutableHeaders(raw=message["headers"])["X-Profile-Id"] = profile_id
+            await send(message)
+
+        profiler = SamplingProfiler(self.interval)
+        token_var = _active_profiler.set(profiler)
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            _active_profiler.reset(token_var)
+            profile_store.add({
+                'id': profile_id,
+                'method': scope["method"],
+                'path': scope["path"],
+                'status': status.get('code'),
+                'duration_ms': round((time.perf_counter() - started) * 1000, 3),
+                'interval_ms': self.interval * 1000,
+                'samples': profiler.samples,
+                'created_at': datetime.now(timezone.utc),
+                'top_functions': profiler.top_functions(),
+                'collapsed': profiler.collapsed()
+            })
+            metrics.increment("profiled_requests_total")
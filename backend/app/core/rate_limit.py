@@ -0,0 +1,175 @@
+# ===== BACKEND/APP/CORE/RATE_LIMIT.PY =====
+from collections import OrderedDict
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from typing import Callable, FrozenSet, Iterable, Optional, Tuple
+import math
+import time
+from .metrics import metrics
+from .responses import ORJSONResponse
+
+# (method, path prefix, token cost, counts toward inference queue depth)
+# SHAP-backed and full-model routes cost more than arithmetic-only routes
+ROUTE_COSTS = [
+    ("POST", "/api/v1/investment/score", 5, True),
+    ("GET", "/api/v1/export/", 10, True),
+    # Submission only queues work; the job pool bounds the actual inference
+    ("POST", "/api/v1/jobs", 10, False),
+    ("GET", "/api/v1/forecast/", 3, True),
+    ("GET", "/api/v1/areas/", 1, False),
+    ("POST", "/api/v1/rental/calculate", 1, False),
+    ("POST", "/api/v1/rental/solve", 2, False),
+]
+DEFAULT_COST = 1
+
+# Never limited: probes, metrics scrapes and API docs
+EXEMPT_PREFIXES = ("/health", "/api/v1/metrics", "/docs", "/redoc", "/openapi.json")
+
+def route_cost(method: str, path: str) -> Tuple[str, int, bool]:
+    """Return (route label, token cost, is inference route) for a request"""
+    for route_method, prefix, cost, inference in ROUTE_COSTS:
+        if method == route_method and path.startswith(prefix):
+            return prefix.rstrip("/"), cost, inference
+    return "other", DEFAULT_COST, False
+
+class TokenBucket:
+    """Classic token bucket: holds up to capacity tokens, refilled continuously"""
+
+    def __init__(self, capacity: float, refill_rate: float, now: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.updated = now
+
+    def try_acquire(self, cost: float, now: float) -> Tuple[bool, float]:
+        """Take cost tokens if available; otherwise return the seconds until they will be"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_rate)
+        self.updated = now
+        if self.tokens >= cost:
+            self.tokens -= cost
+            return True, 0.0
+        return False, (cost - self.tokens) / self.refill_rate
+
+class RateLimiter:
+    """
+    Per-client token buckets kept in process memory.
+
+    Only the most recently seen max_clients buckets are kept; an evicted
+    client simply starts again with a full bucket. Each worker enforces its
+    own limits, so the effective limit scales with the worker count.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float, max_clients: int = 10000,
+                 clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.max_clients = max_clients
+        self.clock = clock
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+    def acquire(self, client: str, cost: float) -> Tuple[bool, float, float]:
+        """Returns (allowed, retry_after seconds, tokens remaining)"""
+        now = self.clock()
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = TokenBucket(self.capacity, self.refill_rate, now)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+        allowed, retry_after = bucket.try_acquire(cost, now)
+        return allowed, retry_after, bucket.tokens
+
+def client_key(scope: Scope, trust_proxy_headers: bool = False, api_keys: FrozenSet[str] = frozenset()) -> str:
+    """
+    Identify the caller by API key, else by (optionally proxy-reported) client IP.
+
+    Only configured keys count: an unknown X-API-Key would otherwise buy a
+    fresh bucket per request and push real clients out of the LRU.
+    """
+    headers = Headers(scope=scope)
+    api_key = headers.get("x-api-key")
+    if api_key and api_key in api_keys:
+        return f"key:{api_key}"
+    if trust_proxy_headers:
+        # The proxy appends the peer it saw; earlier X-Forwarded-For entries come from the client
+        forwarded = headers.get("x-real-ip") or headers.get("x-forwarded-for", "").split(",")[-1].strip()
+        if forwarded:
+            return f"ip:{forwarded}"
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+class AdmissionControlMiddleware:
+    """
+    Rate limiting and load shedding in front of the API.
+
+    Inference routes are shed with 503 while max_queue_depth of them are
+    already in flight in this worker, so a burst degrades into fast
+    rejections instead of a growing threadpool backlog. Every admitted
+    request then spends its route's cost from the client's token bucket,
+    or gets 429 with a Retry-After hint.
+    """
+
+    def __init__(self, app: ASGIApp, capacity: float = 120, refill_rate: float = 10,
+                 max_queue_depth: int = 32, trust_proxy_headers: bool = False,
+                 api_keys: Iterable[str] = (), limiter: Optional[RateLimiter] = None, enabled: bool = True):
+        self.app = app
+        self.limiter = limiter or RateLimiter(capacity, refill_rate)
+        self.max_queue_depth = max_queue_depth
+        self.trust_proxy_headers = trust_proxy_headers
+        self.api_keys = frozenset(api_keys)
+        self.enabled = enabled
+        self.inference_inflight = 0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        path = scope.get("path", "")
+        if not self.enabled or scope["type"] != "http" or scope["method"] == "OPTIONS" \
+                or path.startswith(EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        route, cost, inference = route_cost(scope["method"], path)
+
+        # Load shedding: reject before spending the client's tokens
+        if inference and self.inference_inflight >= self.max_queue_depth:
+            metrics.increment("load_shed_total", route=route)
+            response = ORJSONResponse(
+                {"detail": "Server is busy, please retry shortly"},
+                status_code=503, headers={"Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        allowed, retry_after, remaining = self.limiter.acquire(client_key(scope, self.trust_proxy_headers, self.api_keys), cost)
+        if not allowed:
+            metrics.increment("rate_limited_total", route=route)
+            response = ORJSONResponse(
+                {"detail": "Rate limit exceeded"},
+                status_code=429,
+                headers={
+                    "Retry-After": str(math.ceil(retry_after)),
+                    "X-RateLimit-Limit": str(int(self.limiter.capacity)),
+                    "X-RateLimit-Remaining": str(int(remaining))
+                }
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                headers["X-RateLimit-Limit"] = str(int(self.limiter.capacity))
+                headers["X-RateLimit-Remaining"] = str(int(remaining))
+            await send(message)
+
+        if not inference:
+            await self.app(scope, receive, send_with_headers)
+            return
+
+        self.inference_inflight += 1
+        metrics.set_gauge("inference_queue_depth", self.inference_inflight)
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            self.inference_inflight -= 1
+            metrics.set_gauge("inference_queue_depth", self.inference_inflight)
@@ -0,0 +1,32 @@
+# ===== BACKEND/APP/CORE/RESPONSES.PY =====
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from typing import Any
+import orjson
+
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback serializer for objects orjson does not handle natively"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    # Non-contiguous arrays and exotic NumPy dtypes orjson refuses to serialize
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def dumps(content: Any) -> bytes:
+    """Serialize content exactly as ORJSONResponse renders it"""
+    return orjson.dumps(content, default=_orjson_default, option=ORJSON_OPTIONS)
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    NumPy arrays and scalars are serialized directly, so service output can be
+    returned without converting arrays to Python lists first.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,43 @@
+# ===== BACKEND/APP/CORE/TIMING.PY =====
+from contextlib import contextmanager
+from typing import Any, Dict
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class StartupTimer:
+    """Collects wall-clock durations of the phases of process startup"""
+
+    def __init__(self):
+        self.started_at = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float):
+        with self._lock:
+            self.phases[name] = round(seconds, 4)
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = dict(self.phases)
+        return {
+            "uptime_seconds": round(time.perf_counter() - self.started_at, 4),
+            "phases": phases
+        }
+
+    def log_report(self):
+        report = self.report()
+        summary = ", ".join(f"{name}={seconds:.3f}s" for name, seconds in report["phases"].items())
+        logger.info(f"Startup timing: {summary}")
+
+startup_timer = StartupTimer()
@@ -0,0 +1,84 @@
+# ===== BACKEND/APP/MAIN.PY =====
+from .core.timing import startup_timer
+
+with startup_timer.phase("import_app"):
+    from contextlib import asynccontextmanager
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+    from .core.config import settings
+    from .core.compression import CompressionMiddleware
+    from .core.rate_limit import AdmissionControlMiddleware
+    from .core.profiling import ProfilingMiddleware
+    from .core.responses import ORJSONResponse
+    from .api.v1.router import api_router
+    from .services.ml_service import warm_up_ml_service, is_ml_service_ready
+    from .services.model_reload import model_reloader
+    from .services.jobs import job_runner
+    import threading
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup_timer.log_report()
+    if settings.WARMUP_ON_STARTUP:
+        # Serve liveness immediately; readiness flips once inference is warm
+        threading.Thread(target=warm_up_ml_service, name="ml-warmup", daemon=True).start()
+    # Hot-swap models when a new version is promoted (by any worker or the trainer)
+    model_reloader.start_watcher(settings.MODEL_WATCH_INTERVAL_SECONDS)
+    # Batch jobs: unfinished jobs from before a restart are picked up again
+    job_runner.start()
+    yield
+    job_runner.stop()
+    model_reloader.stop_watcher()
+
+app = FastAPI(
+    title=settings.APP_NAME,
+    version=settings.VERSION,
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+# Added first so it runs inside CORS: 429/503 responses still carry CORS headers
+app.add_middleware(
+    AdmissionControlMiddleware,
+    capacity=settings.RATE_LIMIT_BURST,
+    refill_rate=settings.RATE_LIMIT_REFILL_PER_SECOND,
+    max_queue_depth=settings.MAX_INFERENCE_QUEUE_DEPTH,
+    trust_proxy_headers=settings.TRUST_PROXY_HEADERS,
+    api_keys=settings.rate_limit_api_keys,
+    enabled=settings.RATE_LIMIT_ENABLED
+)
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.ALLOWED_HOSTS,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+# Outermost, so a profile covers every middleware; unflagged requests pass straight through
+app.add_middleware(ProfilingMiddleware, interval=settings.PROFILE_SAMPLE_INTERVAL_MS / 1000)
+
+app.include_router(api_router, prefix="/api/v1")
+
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy", "service": "real-estate-api"}
+
+@app.get("/health/live")
+async def liveness_check():
+    """Process is up and serving requests"""
+    return {"status": "alive", "service": "real-estate-api"}
+
+@app.get("/health/ready")
+async def readiness_check():
+    """Models are loaded and warm; load balancers should only route here when 200"""
+    # Without a warm-up pass the models load on the first request instead
+    if settings.WARMUP_ON_STARTUP and not is_ml_service_ready():
+        return ORJSONResponse({"status": "warming_up", "service": "real-estate-api"}, status_code=503)
+    return {"status": "ready", "service": "real-estate-api"}
+
+@app.get("/health/startup")
+async def startup_report():
+    """Startup phase timings; ml_service_init appears once models have loaded"""
+    return startup_timer.report()
@@ -1,5 +1,5 @@
 # ===== BACKEND/APP/MODELS/DATABASE.PY =====
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, Boolean, UniqueConstraint
 from sqlalchemy.sql import func
 from ..core.database import Base
 
@@ -23,25 +23,61 @@ class County(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
 class PriceHistory(Base):
+    # Range-partitioned by year on PostgreSQL (see database/init.sql and
+    # core/partitions.py); a plain table elsewhere
     __tablename__ = "price_history"
+    __table_args__ = (UniqueConstraint("county_id", "date", name="uq_price_history_county_date"),)
     
     id = Column(Integer, primary_key=True, index=True)
     county_id = Column(Integer, index=True)
     zip_code = Column(String, index=True)
-    date = Column(DateTime)
+    date = Column(DateTime, nullable=False)
     median_price = Column(Float)
     price_per_sqft = Column(Float)
     sales_volume = Column(Integer)
     inventory = Column(Integer)
 
 class EconomicIndicator(Base):
+    # Partitioned like PriceHistory
     __tablename__ = "economic_indicators"
+    __table_args__ = (UniqueConstraint("county_id", "date", name="uq_economic_indicators_county_date"),)
     
     id = Column(Integer, primary_key=True, index=True)
     county_id = Column(Integer, index=True)
-    date = Column(DateTime)
+    date = Column(DateTime, nullable=False)
     unemployment_rate = Column(Float)
     employment_growth = Column(Float)
     population_growth = Column(Float)
     new_construction = Column(Integer)
     mortgage_rate = Column(Float)
+
+class CountyMonthlyStats(Base):
+    """County-month rollup of price_history and economic_indicators"""
+    __tablename__ = "county_monthly_stats"
+    __table_args__ = (UniqueConstraint("county_id", "month", name="uq_county_monthly_stats"),)
+    
+    id = Column(Integer, primary_key=True, index=True)
+    county_id = Column(Integer, index=True, nullable=False)
+    month = Column(DateTime, nullable=False)
+    median_price = Column(Float)
+    price_per_sqft = Column(Float)
+    sales_volume = Column(Integer)
+    inventory = Column(Integer)
+    unemployment_rate = Column(Float)
+    employment_growth = Column(Float)
+    population_growth = Column(Float)
+    new_construction = Column(Integer)
+    mortgage_rate = Column(Float)
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+class IngestionWatermark(Base):
+    """Latest row date loaded from each ingestion source"""
+    __tablename__ = "ingestion_watermarks"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    source = Column(String, unique=True, index=True, nullable=False)
+    dataset = Column(String, nullable=False)
+    watermark = Column(DateTime)
+    rows_ingested = Column(Integer, default=0)
+    last_file = Column(Text)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,6 +1,6 @@
 # ===== BACKEND/APP/MODELS/SCHEMAS.PY =====
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from datetime import datetime
 
 class ForecastRequest(BaseModel):
@@ -13,6 +13,14 @@ class ChartDataPoint(BaseModel):
     upper_bound: Optional[float] = None
     lower_bound: Optional[float] = None
 
+class ChartDataColumns(BaseModel):
+    """Columnar chart data: forecast series start where the historical series ends"""
+    dates: List[str]
+    historical: List[float] = Field(..., description="Prices for dates[:len(historical)]")
+    predicted: List[float] = Field(..., description="Predictions for dates[len(historical):]")
+    lower: List[float]
+    upper: List[float]
+
 class RiskFactor(BaseModel):
     factor: str
     description: str
@@ -29,9 +37,16 @@ class ForecastResponse(BaseModel):
     volatility: str
     seasonal_trend: str
     momentum: str
-    chart_data: List[ChartDataPoint]
+    chart_data: Union[List[ChartDataPoint], ChartDataColumns]
     risk_factors: List[RiskFactor]
 
+class InvestmentRequest(BaseModel):
+    address: str
+
+class ShapExplanation(BaseModel):
+    feature: str
+    impact: float
+
 class InvestmentMetrics(BaseModel):
     price_to_rent_ratio: float
     price_appreciation_5yr: float
@@ -70,18 +85,57 @@ class TopAreasResponse(BaseModel):
     areas: List[TopArea]
     last_updated: datetime
 
+class CountyMonth(BaseModel):
+    month: str
+    median_price: Optional[float] = None
+    price_per_sqft: Optional[float] = None
+    sales_volume: Optional[int] = None
+    inventory: Optional[int] = None
+    unemployment_rate: Optional[float] = None
+    employment_growth: Optional[float] = None
+    population_growth: Optional[float] = None
+    new_construction: Optional[int] = None
+    mortgage_rate: Optional[float] = None
+
+class CountyHistoryResponse(BaseModel):
+    county: str
+    months: List[CountyMonth]
+
+class SimilarMarket(BaseModel):
+    county: str
+    region: str
+    distance: float = Field(..., description="Euclidean distance in standardized feature space")
+    median_price: float
+    rental_yield: float
+    price_growth_5yr: float
+    population_growth: float
+
+class SimilarMarketsResponse(BaseModel):
+    county: str
+    similar: List[SimilarMarket]
+
+class ModelReloadRequest(BaseModel):
+    version: Optional[str] = Field(None, description="Artifact version to load (default: the promoted version)")
+    shadow: bool = Field(False, description="Only compare the version against the live model; do not swap")
+
+class BatchJobRequest(BaseModel):
+    addresses: List[str] = Field(..., min_length=1, description="Addresses or ZIP codes to forecast and score")
+    chunk_size: Optional[int] = Field(None, ge=1, le=5000, description="Addresses scored per progress step")
+    top_k: int = Field(3, ge=1, le=9, description="SHAP factors returned per address")
+
 class RentalCalculationRequest(BaseModel):
-    purchase_price: float
-    down_payment_percent: float
-    interest_rate: float
-    loan_term_years: int
-    monthly_rent: float
-    property_tax_percent: float
-    annual_insurance: float
-    maintenance_percent: float
-    vacancy_percent: float
-    management_fee_percent: float
-    capex_percent: float
+    # Bounds keep every return finite (e.g. cap rate divides by the price); out-of-range input gets a 422
+    purchase_price: float = Field(..., gt=0)
+    down_payment_percent: float = Field(..., ge=0, le=100)
+    interest_rate: float = Field(..., ge=0, le=100)
+    loan_term_years: int = Field(..., ge=1, le=50)
+    monthly_rent: float = Field(..., ge=0)
+    property_tax_percent: float = Field(..., ge=0)
+    annual_insurance: float = Field(..., ge=0)
+    maintenance_percent: float = Field(..., ge=0)
+    vacancy_percent: float = Field(..., ge=0, le=100)
+    management_fee_percent: float = Field(..., ge=0, le=100)
+    capex_percent: float = Field(..., ge=0)
     appreciation_percent: float
 
 class RentalCalculationResponse(BaseModel):
@@ -92,3 +146,34 @@ class RentalCalculationResponse(BaseModel):
     total_return_percent: float
     noi: float
     total_cash_invested: float
+
+class RentalSolveRequest(BaseModel):
+    scenarios: List[RentalCalculationRequest] = Field(..., min_length=1, max_length=1000,
+                                                      description="Calculator inputs to solve backwards")
+    target_cash_on_cash: List[float] = Field([8.0], min_length=1, max_length=50,
+                                             description="Cash-on-cash returns (%) to solve price and down payment for")
+    target_monthly_cash_flow: float = Field(0.0, description="Monthly cash flow that defines break-even rent")
+
+class RentalTargetSolution(BaseModel):
+    target_cash_on_cash: float
+    max_purchase_price: Optional[float] = Field(None, description="Highest price that reaches the target; null if none does or if unbounded")
+    max_purchase_price_unbounded: bool = Field(False, description="Every purchase price reaches the target")
+    min_down_payment_percent: Optional[float] = Field(None, description="Lowest down payment that reaches the target; null if none does")
+
+class RentalScenarioSolution(BaseModel):
+    break_even_rent: Optional[float] = Field(None, description="Monthly rent at which cash flow reaches the target cash flow")
+    current: RentalCalculationResponse
+    targets: List[RentalTargetSolution]
+
+class RentalSolveResponse(BaseModel):
+    solutions: List[RentalScenarioSolution]
+
+class AutocompleteSuggestion(BaseModel):
+    type: str = Field(..., description="county, city or zip")
+    label: str
+    county: str
+    value: str = Field(..., description="Canonical address text to send to the forecast and investment endpoints")
+
+class AutocompleteResponse(BaseModel):
+    query: str
+    suggestions: List[AutocompleteSuggestion]
@@ -0,0 +1,128 @@
+# ===== BACKEND/APP/SCRIPTS/BATCH_SCORE.PY =====
+import argparse
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+
+# Each worker process loads the models once and keeps them here
+_worker_service = None
+
+def read_addresses(path: str) -> List[str]:
+    """Read addresses from a .txt (one per line), .csv or .parquet file with an 'address' column"""
+    if path.endswith(".txt"):
+        with open(path) as f:
+            return [line.strip() for line in f if line.strip()]
+    
+    import pandas as pd
+    frame = pd.read_parquet(path, columns=["address"]) if path.endswith(".parquet") else pd.read_csv(path, usecols=["address"])
+    return frame["address"].astype(str).tolist()
+
+def _init_worker():
+    global _worker_service
+    from ..services.ml_service import MLService
+    _worker_service = MLService()
+
+def _score_shard(args: Tuple[int, List[str], str, int, int]) -> Dict[str, float]:
+    """Score one shard in chunks and write each chunk as a partitioned Parquet fragment"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    shard_id, addresses, output_dir, chunk_size, top_k = args
+    started = time.perf_counter()
+    
+    for chunk_idx, start in enumerate(range(0, len(addresses), chunk_size)):
+        result = _worker_service.score_addresses(addresses[start:start + chunk_size], top_k=top_k)
+        table = pa.table({
+            'address': pa.array(result['address'].tolist(), pa.string()),
+            'county': pa.array(result['county'].tolist(), pa.string()),
+            'current_value': result['current_value'],
+            'predicted_change': result['predicted_change'],
+            'predicted_value': result['predicted_value'],
+            'lower_value': result['lower_value'],
+            'upper_value': result['upper_value'],
+            'investment_score': result['investment_score'],
+            'shap_top_features': pa.array(result['shap_top_features'].tolist(), pa.list_(pa.string())),
+            'shap_top_impacts': pa.array(result['shap_top_impacts'].tolist(), pa.list_(pa.float64()))
+        })
+        pq.write_to_dataset(
+            table,
+            root_path=output_dir,
+            partition_cols=['county'],
+            basename_template=f"part-{shard_id}-{chunk_idx}-{{i}}.parquet"
+        )
+    
+    elapsed = time.perf_counter() - started
+    return {
+        'shard': shard_id,
+        'pid': os.getpid(),
+        'rows': len(addresses),
+        'seconds': round(elapsed, 3),
+        'rows_per_second': round(len(addresses) / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
+def batch_score(input_path: str, output_dir: str, workers: int, chunk_size: int, top_k: int,
+                overwrite: bool = False) -> List[Dict[str, float]]:
+    """
+    Shard addresses across a process pool and write scores to partitioned Parquet.
+
+    Fragments are written to a staging directory that replaces output_dir
+    only once every shard has finished, so a rerun never mixes old and new
+    fragments and a failed run leaves the previous output intact. An
+    existing, non-empty output_dir is only replaced with overwrite.
+    """
+    from ..services.ml_service import get_ml_service
+    
+    for name, value in (("workers", workers), ("chunk_size", chunk_size), ("top_k", top_k)):
+        if value < 1:
+            raise ValueError(f"{name} must be at least 1, got {value}")
+    if os.path.isdir(output_dir) and os.listdir(output_dir) and not overwrite:
+        raise FileExistsError(f"{output_dir} already holds a dataset; pass overwrite to replace it")
+    
+    # Make sure trained artifacts exist before workers load them concurrently
+    get_ml_service()
+    
+    addresses = read_addresses(input_path)
+    staging_dir = f"{output_dir.rstrip(os.sep)}.{os.getpid()}.tmp"
+    shutil.rmtree(staging_dir, ignore_errors=True)
+    shard_size = max(1, -(-len(addresses) // workers))
+    shards = [
+        (shard_id, addresses[start:start + shard_size], staging_dir, chunk_size, top_k)
+        for shard_id, start in enumerate(range(0, len(addresses), shard_size))
+    ]
+    
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            reports = list(executor.map(_score_shard, shards))
+    except BaseException:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    
+    os.makedirs(staging_dir, exist_ok=True)
+    shutil.rmtree(output_dir, ignore_errors=True)
+    os.replace(staging_dir, output_dir)
+    return reports
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Score addresses offline and write partitioned Parquet")
+    parser.add_argument("input", help="Addresses file (.txt, .csv or .parquet with an 'address' column)")
+    parser.add_argument("--output", default="batch_scores", help="Output dataset directory")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--top-k", type=int, default=3, help="Number of SHAP factors to keep per row")
+    parser.add_argument("--overwrite", action="store_true", help="Replace an existing output dataset")
+    args = parser.parse_args()
+    
+    started = time.perf_counter()
+    try:
+        reports = batch_score(args.input, args.output, args.workers, args.chunk_size, args.top_k, args.overwrite)
+    except (ValueError, FileExistsError) as e:
+        parser.error(str(e))
+    total_rows = sum(report['rows'] for report in reports)
+    
+    for report in reports:
+        print(f"shard {report['shard']} (pid {report['pid']}): {report['rows']} rows "
+              f"in {report['seconds']}s = {report['rows_per_second']} rows/s")
+    elapsed = time.perf_counter() - started
+    print(f"Total: {total_rows} rows in {elapsed:.1f}s = {total_rows / elapsed:.1f} rows/s")
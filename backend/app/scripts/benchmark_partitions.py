@@ -0,0 +1,64 @@
+# ===== BACKEND/APP/SCRIPTS/BENCHMARK_PARTITIONS.PY =====
+import argparse
+import json
+import time
+from datetime import datetime
+from sqlalchemy import create_engine, text
+from ..core.config import settings
+
+RANGE_QUERY = """
+    SELECT county_id, date_trunc('month', date) AS month, avg(median_price)
+    FROM price_history
+    WHERE date >= :start AND date < :end
+    GROUP BY 1, 2
+"""
+
+def _scanned_relations(plan: dict) -> set:
+    """Collect the relation names a JSON EXPLAIN plan actually scans"""
+    relations = set()
+    if "Relation Name" in plan:
+        relations.add(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        relations |= _scanned_relations(child)
+    return relations
+
+def benchmark(start: datetime, end: datetime, runs: int):
+    """Time a date-range aggregate and report which partitions the planner kept"""
+    engine = create_engine(settings.DATABASE_URL)
+    if engine.dialect.name != "postgresql":
+        print("Partition pruning benchmarks need PostgreSQL; SQLite tables are not partitioned.")
+        return
+    
+    params = {"start": start, "end": end}
+    with engine.connect() as connection:
+        plan = connection.execute(text(f"EXPLAIN (ANALYZE, FORMAT JSON) {RANGE_QUERY}"), params).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        scanned = sorted(_scanned_relations(plan[0]["Plan"]))
+        all_partitions = connection.execute(text(
+            "SELECT inhrelid::regclass::text FROM pg_inherits WHERE inhparent = 'price_history'::regclass"
+        )).scalars().all()
+        
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            connection.execute(text(RANGE_QUERY), params).fetchall()
+            timings.append((time.perf_counter() - started) * 1000)
+    
+    timings.sort()
+    print(f"Range {start:%Y-%m-%d}..{end:%Y-%m-%d}: scanned {len(scanned)} of {len(all_partitions)} partitions")
+    print(f"  scanned: {', '.join(scanned)}")
+    print(f"  median {timings[len(timings) // 2]:.2f} ms, min {timings[0]:.2f} ms over {runs} runs")
+    
+    expected = {f"price_history_y{year}" for year in range(start.year, end.year + 1)}
+    if not set(scanned) <= expected | {"price_history_default"}:
+        raise SystemExit(f"Partition pruning failed: scanned {scanned}, expected a subset of {sorted(expected)}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify partition pruning on price_history range queries")
+    parser.add_argument("--start", type=datetime.fromisoformat, default=datetime(datetime.now().year - 1, 1, 1))
+    parser.add_argument("--end", type=datetime.fromisoformat, default=datetime(datetime.now().year, 1, 1))
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+    
+    benchmark(args.start, args.end, args.runs)
@@ -0,0 +1,26 @@
+# ===== BACKEND/APP/SCRIPTS/EXPORT_FORECASTS.PY =====
+import argparse
+import sys
+from ..services.export import iter_forecast_export
+from ..services.ml_service import get_ml_service
+
+def export_forecasts(fmt: str, output: str, chunk_size: int):
+    """Write the statewide forecast export to a file, or stdout when output is '-'"""
+    service = get_ml_service()
+    stream = sys.stdout.buffer if output == "-" else open(output, "wb")
+    try:
+        for chunk in iter_forecast_export(service, fmt, chunk_size):
+            stream.write(chunk)
+            stream.flush()
+    finally:
+        if stream is not sys.stdout.buffer:
+            stream.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export forecasts and investment scores for every market")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--output", default="-", help="Output file path ('-' for stdout)")
+    parser.add_argument("--chunk-size", type=int, default=500)
+    args = parser.parse_args()
+    
+    export_forecasts(args.format, args.output, args.chunk_size)
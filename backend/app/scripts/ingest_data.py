@@ -0,0 +1,43 @@
+# ===== BACKEND/APP/SCRIPTS/INGEST_DATA.PY =====
+# Load new monthly price or economic indicator files without reseeding.
+#
+#   python -m app.scripts.ingest_data prices drops/prices-2026-09.csv
+#   python -m app.scripts.ingest_data economic drops/*.parquet --source bls-monthly
+import argparse
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from ..core.config import settings
+from ..core.partitions import prepare_schema
+from ..services.ingestion import INGEST_TABLES, ingest_file
+
+def ingest(dataset: str, paths, source: str = None, full: bool = False, chunk_size: int = 50000,
+           batch_size: int = 1000, update_datasets: bool = True):
+    engine = create_engine(settings.DATABASE_URL)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    prepare_schema(engine)
+
+    db = SessionLocal()
+    try:
+        for path in paths:
+            result = ingest_file(db, path, dataset, source, full, chunk_size, batch_size, update_datasets)
+            print(f"{path}: {result['upserted']} rows upserted ({result['read']} read, "
+                  f"{result['already_ingested']} at or before the watermark, {result['duplicates']} duplicates, "
+                  f"{result['unknown_county']} unknown counties); {len(result['months_refreshed'])} months "
+                  f"refreshed, watermark {result['watermark']}")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Incrementally ingest price or economic indicator files")
+    parser.add_argument("dataset", choices=list(INGEST_TABLES))
+    parser.add_argument("paths", nargs="+", help="CSV or Parquet files, loaded in the given order")
+    parser.add_argument("--source", help="Watermark name (default: the dataset name)")
+    parser.add_argument("--full", action="store_true", help="Ignore the watermark and upsert every row")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="Rows read per chunk")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Rows per upsert statement")
+    parser.add_argument("--skip-datasets", action="store_true",
+                        help="Only load the database; leave the served data files untouched")
+    args = parser.parse_args()
+
+    ingest(args.dataset, args.paths, args.source, args.full, args.chunk_size, args.batch_size,
+           not args.skip_datasets)
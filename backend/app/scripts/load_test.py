@@ -0,0 +1,230 @@
+# ===== BACKEND/APP/SCRIPTS/LOAD_TEST.PY =====
+# Drives the API with a weighted mix of forecast, investment, areas and rental
+# calls and reports throughput plus p50/p95/p99 latency per route.
+#
+#   python -m app.scripts.load_test --requests 2000 --concurrency 32 --output results.json
+#   python -m app.scripts.load_test --url http://localhost:8000 --duration 60 --compare results.json
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+
+DEFAULT_MIX = "forecast=4,investment=3,areas=2,rental=1"
+
+CITIES = [
+    "Los Angeles", "Beverly Hills", "San Diego", "Orange", "Riverside",
+    "Sacramento", "Fresno", "Malibu", "Hollywood", "San Jose"
+]
+
+RENTAL_PAYLOAD = {
+    "purchase_price": 650000,
+    "down_payment_percent": 20,
+    "interest_rate": 7.0,
+    "loan_term_years": 30,
+    "monthly_rent": 3800,
+    "property_tax_percent": 1.1,
+    "annual_insurance": 1800,
+    "maintenance_percent": 1.0,
+    "vacancy_percent": 5,
+    "management_fee_percent": 8,
+    "capex_percent": 1.0,
+    "appreciation_percent": 3.5
+}
+
+PERCENTILES = [50, 95, 99]
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse 'forecast=4,investment=3' into route weights"""
+    weights = {}
+    for part in mix.split(","):
+        route, _, weight = part.partition("=")
+        if route.strip() not in ROUTES:
+            raise ValueError(f"Unknown route '{route}'; expected one of {', '.join(ROUTES)}")
+        weights[route.strip()] = float(weight or 1)
+    return weights
+
+def _forecast(address: str) -> Tuple[str, str, Optional[dict]]:
+    return "GET", f"/api/v1/forecast/{address}", None
+
+def _investment(address: str) -> Tuple[str, str, Optional[dict]]:
+    return "POST", "/api/v1/investment/score", {"address": address}
+
+def _areas(address: str) -> Tuple[str, str, Optional[dict]]:
+    return "GET", "/api/v1/areas/top", None
+
+def _rental(address: str) -> Tuple[str, str, Optional[dict]]:
+    return "POST", "/api/v1/rental/calculate", RENTAL_PAYLOAD
+
+ROUTES = {
+    "forecast": _forecast,
+    "investment": _investment,
+    "areas": _areas,
+    "rental": _rental
+}
+
+def build_plan(n: int, weights: Dict[str, float], address_pool: int, seed: int) -> List[Tuple[str, str, str, Optional[dict]]]:
+    """Pre-generate a reproducible request sequence: (route, method, path, json body)"""
+    rng = random.Random(seed)
+    addresses = [f"{100 + i} Main St, {CITIES[i % len(CITIES)]}, CA" for i in range(address_pool)]
+    routes = rng.choices(list(weights), weights=list(weights.values()), k=n)
+    return [(route, *ROUTES[route](rng.choice(addresses))) for route in routes]
+
+def summarize(samples: List[Tuple[str, int, float]], elapsed: float) -> Dict[str, Any]:
+    """Throughput and latency percentiles per route from (route, status, seconds) samples"""
+    by_route: Dict[str, List[Tuple[int, float]]] = {}
+    for route, status, seconds in samples:
+        by_route.setdefault(route, []).append((status, seconds))
+    by_route["all"] = [(status, seconds) for _, status, seconds in samples]
+
+    report = {}
+    for route, rows in sorted(by_route.items()):
+        statuses = np.array([status for status, _ in rows])
+        latency_ms = np.array([seconds for _, seconds in rows]) * 1000
+        codes, counts = np.unique(statuses, return_counts=True)
+        report[route] = {
+            'count': len(rows),
+            'errors': int((statuses >= 400).sum() + (statuses == 0).sum()),
+            'status_codes': {str(code): int(count) for code, count in zip(codes, counts)},
+            'throughput_rps': round(len(rows) / elapsed, 2) if elapsed > 0 else 0.0,
+            'mean_ms': round(float(latency_ms.mean()), 3),
+            **{f'p{p}_ms': round(float(v), 3) for p, v in zip(PERCENTILES, np.percentile(latency_ms, PERCENTILES))},
+            'max_ms': round(float(latency_ms.max()), 3)
+        }
+    return report
+
+async def _run(client, plan, concurrency: int, duration: Optional[float]) -> Tuple[List[Tuple[str, int, float]], float]:
+    samples = []
+    next_index = 0
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def worker():
+        nonlocal next_index
+        while True:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            if deadline is None and next_index >= len(plan):
+                return
+            route, method, path, body = plan[next_index % len(plan)]
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, json=body)
+                status = response.status_code
+            except Exception:
+                status = 0
+            samples.append((route, status, time.perf_counter() - started))
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return samples, time.perf_counter() - started
+
+def _make_client(url: Optional[str], concurrency: int, keep_rate_limit: bool):
+    import httpx
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if url:
+        return httpx.AsyncClient(base_url=url, timeout=60, limits=limits)
+
+    # In-process: exercise the full ASGI stack (middleware included) without sockets.
+    # The rate limiter would otherwise throttle this single client, so it is off unless asked for.
+    if not keep_rate_limit:
+        os.environ["RATE_LIMIT_ENABLED"] = "false"
+    os.environ.setdefault("WARMUP_ON_STARTUP", "false")
+    from ..main import app
+    from ..services.ml_service import warm_up_ml_service
+
+    warm_up_ml_service()
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=60)
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+async def load_test(url: Optional[str] = None, requests: int = 1000, duration: Optional[float] = None,
+                    concurrency: int = 16, mix: str = DEFAULT_MIX, address_pool: int = 50,
+                    warmup: int = 20, seed: int = 42, keep_rate_limit: bool = False) -> Dict[str, Any]:
+    """Run one load test and return the JSON-serializable report"""
+    weights = parse_mix(mix)
+    plan = build_plan(max(requests, 1), weights, address_pool, seed)
+
+    async with _make_client(url, concurrency, keep_rate_limit) as client:
+        if warmup:
+            await _run(client, build_plan(warmup, weights, address_pool, seed + 1), concurrency, None)
+        samples, elapsed = await _run(client, plan, concurrency, duration)
+
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'git_commit': _git_commit(),
+            'target': url or 'in-process',
+            'concurrency': concurrency,
+            'mix': weights,
+            'requests': len(samples),
+            'duration_seconds': round(elapsed, 3),
+            'address_pool': address_pool,
+            'seed': seed,
+            'python': platform.python_version(),
+            'cpu_count': os.cpu_count()
+        },
+        'routes': summarize(samples, elapsed)
+    }
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Human-readable per-route deltas against an earlier report"""
+    lines = [f"vs {baseline['meta'].get('git_commit') or baseline['meta']['timestamp']}:"]
+    for route, stats in report['routes'].items():
+        before = baseline['routes'].get(route)
+        if before is None:
+            continue
+        deltas = []
+        for key in ['throughput_rps'] + [f'p{p}_ms' for p in PERCENTILES]:
+            change = (stats[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+            deltas.append(f"{key} {before[key]} -> {stats[key]} ({change:+.1f}%)")
+        lines.append(f"  {route:<11} " + ", ".join(deltas))
+    return lines
+
+def _print_report(report: Dict[str, Any]):
+    meta = report['meta']
+    print(f"{meta['requests']} requests in {meta['duration_seconds']}s against {meta['target']} "
+          f"(concurrency {meta['concurrency']}, commit {meta['git_commit']})")
+    print(f"  {'route':<11} {'count':>6} {'errors':>6} {'rps':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for route, stats in report['routes'].items():
+        print(f"  {route:<11} {stats['count']:>6} {stats['errors']:>6} {stats['throughput_rps']:>9} "
+              f"{stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['p99_ms']:>9}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load-test the API and report latency percentiles per route")
+    parser.add_argument("--url", help="Base URL of a running server (default: drive the app in-process)")
+    parser.add_argument("--requests", type=int, default=1000, help="Requests to send (ignored with --duration)")
+    parser.add_argument("--duration", type=float, help="Run for this many seconds instead of a fixed count")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"Route weights (default: {DEFAULT_MIX})")
+    parser.add_argument("--address-pool", type=int, default=50, help="Distinct addresses (controls cache hit rate)")
+    parser.add_argument("--warmup", type=int, default=20, help="Unrecorded requests sent first")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep-rate-limit", action="store_true", help="Leave rate limiting on in-process")
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--compare", help="Earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    report = asyncio.run(load_test(
+        args.url, args.requests, args.duration, args.concurrency, args.mix,
+        args.address_pool, args.warmup, args.seed, args.keep_rate_limit
+    ))
+    _print_report(report)
+    if args.compare:
+        with open(args.compare) as f:
+            print("\n".join(compare(report, json.load(f))))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
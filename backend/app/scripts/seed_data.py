@@ -5,11 +5,14 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy import create_engine
 from ..core.config import settings
 from ..models.database import County, PriceHistory, EconomicIndicator
+from ..services.market_data import DATASETS, dataset_path, write_dataset, read_dataset
+from ..services.rollups import refresh_rollups
+from ..core.partitions import prepare_schema, ensure_partitions
 import os
 from datetime import datetime, timedelta
 
 def create_seeded_csvs():
-    """Create seeded CSV files for offline demo"""
+    """Create seeded data files for offline demo (format set by DATA_FORMAT)"""
     
     # California counties data
     ca_counties_data = [
@@ -147,8 +150,7 @@ def create_seeded_csvs():
     
     # Save counties CSV
     counties_df = pd.DataFrame(ca_counties_data)
-    os.makedirs('backend/data', exist_ok=True)
-    counties_df.to_csv('backend/data/california_counties.csv', index=False)
+    write_dataset('counties', counties_df)
     
     # Generate historical price data
     historical_data = []
@@ -178,7 +180,7 @@ def create_seeded_csvs():
             })
     
     historical_df = pd.DataFrame(historical_data)
-    historical_df.to_csv('backend/data/historical_prices.csv', index=False)
+    write_dataset('prices', historical_df)
     
     # Generate economic indicators
     economic_data = []
@@ -203,7 +205,7 @@ def create_seeded_csvs():
             })
     
     economic_df = pd.DataFrame(economic_data)
-    economic_df.to_csv('backend/data/economic_indicators.csv', index=False)
+    write_dataset('economic', economic_df)
     
     # Generate rental data
     rental_data = []
@@ -219,25 +221,30 @@ def create_seeded_csvs():
         })
     
     rental_df = pd.DataFrame(rental_data)
-    rental_df.to_csv('backend/data/rental_data.csv', index=False)
+    write_dataset('rental', rental_df)
     
-    print("Seeded CSV files created successfully!")
+    print("Seeded data files created successfully!")
 
 def seed_database():
     """Seed database with initial data"""
     engine = create_engine(settings.DATABASE_URL)
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    prepare_schema(engine)
     
-    # Create seeded CSVs first
-    create_seeded_csvs()
+    # Create seeded data files first; existing ones may hold ingested rows, so keep them
+    if not all(os.path.exists(dataset_path(name)) for name in DATASETS):
+        create_seeded_csvs()
     
     # Load data into database
     db = SessionLocal()
     
     try:
-        # Load counties
-        counties_df = pd.read_csv('backend/data/california_counties.csv')
+        # Load counties (init.sql may already have inserted some of them)
+        counties_df = read_dataset('counties')
+        existing = {name for (name,) in db.query(County.name).all()}
         for _, row in counties_df.iterrows():
+            if row['county'] in existing:
+                continue
             county = County(
                 name=row['county'],
                 region=row['region'],
@@ -254,6 +261,39 @@ def seed_database():
             db.add(county)
         
         db.commit()
+        county_ids = {name: county_id for county_id, name in db.query(County.id, County.name).all()}
+        
+        # Load price history and economic indicators. Seeding runs on every start,
+        # so tables that already hold rows are left alone (later data arrives
+        # through app.scripts.ingest_data)
+        touched_months = set()
+        if db.query(PriceHistory.id).first() is None:
+            prices_df = read_dataset('prices')
+            prices_df['county_id'] = prices_df['county'].map(county_ids)
+            prices_df['date'] = pd.to_datetime(prices_df['date'])
+            ensure_partitions(db.connection(), 'price_history', prices_df['date'].dt.to_pydatetime())
+            db.bulk_insert_mappings(PriceHistory, prices_df[[
+                'county_id', 'date', 'median_price', 'price_per_sqft', 'sales_volume', 'inventory'
+            ]].to_dict('records'))
+            touched_months |= set(prices_df['date'].dt.to_pydatetime())
+        
+        if db.query(EconomicIndicator.id).first() is None:
+            economic_df = read_dataset('economic')
+            economic_df['county_id'] = economic_df['county'].map(county_ids)
+            economic_df['date'] = pd.to_datetime(economic_df['date'])
+            ensure_partitions(db.connection(), 'economic_indicators', economic_df['date'].dt.to_pydatetime())
+            db.bulk_insert_mappings(EconomicIndicator, economic_df[[
+                'county_id', 'date', 'unemployment_rate', 'employment_growth',
+                'population_growth', 'new_construction', 'mortgage_rate'
+            ]].to_dict('records'))
+            touched_months |= set(economic_df['date'].dt.to_pydatetime())
+        db.commit()
+        
+        if not touched_months:
+            print("Database already seeded")
+            return
+        # Aggregate only the months this seed touched
+        refresh_rollups(db, touched_months)
         print("Database seeded successfully!")
         
     except Exception as e:
@@ -0,0 +1,215 @@
+# ===== BACKEND/APP/SCRIPTS/TUNE_MODELS.PY =====
+# Successive-halving hyperparameter search for the price (LightGBM) and
+# investment (random forest) models. Every (candidate, CV fold) fit is a job
+# in a process pool; each round keeps the best 1/factor of the candidates and
+# gives them factor times more training rows. Among the finalists, any
+# configuration within one standard error of the best CV error counts as
+# equally accurate, and the one with the lowest single-row inference latency
+# (then the smallest artifact) wins.
+#
+#   python -m app.scripts.tune_models --workers 4 --candidates 27
+#   python -m app.scripts.tune_models --retrain --promote
+import argparse
+import math
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+import numpy as np
+
+SEARCH_SPACES = {
+    'price_model': {
+        'n_estimators': [50, 100, 200, 400],
+        'learning_rate': [0.03, 0.05, 0.1, 0.2],
+        'max_depth': [3, 4, 6, 8, -1],
+        'num_leaves': [15, 31, 63],
+        'min_child_samples': [5, 10, 20, 40]
+    },
+    'investment_model': {
+        'n_estimators': [50, 100, 200, 300],
+        'max_depth': [6, 8, 10, 14, None],
+        'min_samples_leaf': [1, 2, 4, 8],
+        'max_features': [1.0, 0.5, 'sqrt']
+    }
+}
+
+# Single-row predictions timed per finalist (the latency a request sees)
+LATENCY_REPEATS = 50
+
+def make_estimator(model: str, params: Dict[str, Any]):
+    """Build an estimator with search parameters; one thread each, the pool supplies parallelism"""
+    from ..services.ml_service import PRICE_MODEL_PARAMS, INVESTMENT_MODEL_PARAMS
+
+    if model == 'price_model':
+        import lightgbm as lgb
+        return lgb.LGBMRegressor(**{**PRICE_MODEL_PARAMS, **params, 'n_jobs': 1, 'verbose': -1})
+    from sklearn.ensemble import RandomForestRegressor
+    return RandomForestRegressor(**{**INVESTMENT_MODEL_PARAMS, **params, 'n_jobs': 1})
+
+def load_training_arrays() -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    from ..services.ml_service import MLService, PRICE_FEATURES, INVESTMENT_FEATURES
+
+    data = MLService._generate_training_data()
+    return {
+        'price_model': (data[PRICE_FEATURES].to_numpy(dtype=float), data['price_change_12m'].to_numpy(dtype=float)),
+        'investment_model': (data[INVESTMENT_FEATURES].to_numpy(dtype=float), data['investment_score'].to_numpy(dtype=float))
+    }
+
+def sample_candidates(space: Dict[str, List[Any]], n: int, seed: int) -> List[Dict[str, Any]]:
+    """n distinct random configurations from a grid"""
+    rng = np.random.default_rng(seed)
+    total = math.prod(len(values) for values in space.values())
+    candidates, seen = [], set()
+    while len(candidates) < min(n, total):
+        params = {name: values[rng.integers(len(values))] for name, values in space.items()}
+        key = tuple(sorted((name, str(value)) for name, value in params.items()))
+        if key not in seen:
+            seen.add(key)
+            candidates.append(params)
+    return candidates
+
+def _fit_fold(job: Tuple[str, Dict[str, Any], np.ndarray, np.ndarray, np.ndarray, np.ndarray]) -> float:
+    """Fit one candidate on one fold and return its validation MAE"""
+    model, params, X_train, y_train, X_test, y_test = job
+    estimator = make_estimator(model, params)
+    estimator.fit(X_train, y_train)
+    return float(np.mean(np.abs(estimator.predict(X_test) - y_test)))
+
+def _fit_full(job: Tuple[str, Dict[str, Any], np.ndarray, np.ndarray]):
+    model, params, X, y = job
+    return make_estimator(model, params).fit(X, y)
+
+def _fold_indices(n: int, n_splits: int, rng: np.random.Generator) -> List[Tuple[np.ndarray, np.ndarray]]:
+    order = rng.permutation(n)
+    folds = np.array_split(order, n_splits)
+    return [(np.concatenate(folds[:i] + folds[i + 1:]), folds[i]) for i in range(n_splits)]
+
+def successive_halving(model: str, candidates: List[Dict[str, Any]], X: np.ndarray, y: np.ndarray,
+                       executor: ProcessPoolExecutor, factor: int = 3, min_resources: int = 100,
+                       n_splits: int = 5, finalists: int = 4, seed: int = 42) -> Dict[str, Any]:
+    """
+    Halve the candidate pool until the survivors have been scored on all rows.
+
+    Returns every round's scores plus the full-data finalists with their
+    mean and standard error of the CV MAE.
+    """
+    if n_splits < 2:
+        raise ValueError("n_splits must be at least 2: each fold trains on the others")
+    rng = np.random.default_rng(seed)
+    survivors = list(range(len(candidates)))
+    resources = min(min_resources, len(X))
+    rounds = []
+    while True:
+        rows = rng.permutation(len(X))[:resources]
+        folds = _fold_indices(len(rows), n_splits, rng)
+        jobs = [
+            (model, candidates[c], X[rows[train]], y[rows[train]], X[rows[test]], y[rows[test]])
+            for c in survivors for train, test in folds
+        ]
+        maes = np.array(list(executor.map(_fit_fold, jobs))).reshape(len(survivors), n_splits)
+        mean, sem = maes.mean(axis=1), maes.std(axis=1, ddof=1) / np.sqrt(n_splits)
+        rounds.append({'resources': resources, 'candidates': len(survivors),
+                       'best_mae': round(float(mean.min()), 4)})
+
+        ranked = np.argsort(mean)
+        if resources >= len(X):
+            return {
+                'rounds': rounds,
+                'finalists': [
+                    {'params': candidates[survivors[i]], 'cv_mae': float(mean[i]), 'cv_mae_sem': float(sem[i])}
+                    for i in ranked
+                ]
+            }
+        keep = max(finalists, math.ceil(len(survivors) / factor))
+        # Once the pool stops shrinking, go straight to the full data
+        resources = min(resources * factor, len(X)) if keep < len(survivors) else len(X)
+        survivors = [survivors[i] for i in ranked[:keep]]
+
+def _single_row_latency_ms(estimator, X: np.ndarray) -> float:
+    row = X[:1]
+    estimator.predict(row)
+    timings = []
+    for _ in range(LATENCY_REPEATS):
+        started = time.perf_counter()
+        estimator.predict(row)
+        timings.append(time.perf_counter() - started)
+    return float(np.median(timings) * 1000)
+
+def select_finalist(model: str, finalists: List[Dict[str, Any]], X: np.ndarray, y: np.ndarray,
+                    executor: ProcessPoolExecutor) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Fastest (then smallest) finalist within one standard error of the best CV MAE"""
+    best = finalists[0]
+    threshold = best['cv_mae'] + best['cv_mae_sem']
+    eligible = [f for f in finalists if f['cv_mae'] <= threshold]
+
+    fitted = executor.map(_fit_full, [(model, f['params'], X, y) for f in eligible])
+    # Latency is timed here, one model at a time, so pool contention does not skew it
+    for finalist, estimator in zip(eligible, fitted):
+        finalist['latency_ms'] = round(_single_row_latency_ms(estimator, X), 4)
+        finalist['size_bytes'] = len(pickle.dumps(estimator))
+    selected = min(eligible, key=lambda f: (f['latency_ms'], f['size_bytes']))
+    return selected, eligible
+
+def tune_models(workers: int, candidates: int, factor: int, min_resources: int, n_splits: int,
+                finalists: int, seed: int) -> Dict[str, Any]:
+    """Tune both models and return the selection in the format save_hyperparameters expects"""
+    arrays = load_training_arrays()
+    selection = {
+        'tuned_at': datetime.now(timezone.utc).isoformat(),
+        'search': {'candidates': candidates, 'factor': factor, 'min_resources': min_resources,
+                   'cv_folds': n_splits, 'workers': workers, 'seed': seed},
+        'models': {}
+    }
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for model, space in SEARCH_SPACES.items():
+            X, y = arrays[model]
+            started = time.perf_counter()
+            pool = sample_candidates(space, candidates, seed)
+            search = successive_halving(model, pool, X, y, executor, factor, min_resources,
+                                        n_splits, finalists, seed)
+            selected, eligible = select_finalist(model, search['finalists'], X, y, executor)
+            selection['models'][model] = {
+                **selected,
+                'rounds': search['rounds'],
+                'equally_accurate': eligible,
+                'seconds': round(time.perf_counter() - started, 2)
+            }
+    return selection
+
+def _print_selection(selection: Dict[str, Any]):
+    for model, result in selection['models'].items():
+        print(f"{model}: {result['params']}")
+        print(f"  cv MAE {result['cv_mae']:.4f} ± {result['cv_mae_sem']:.4f}, "
+              f"{result['latency_ms']} ms/row, {result['size_bytes']} bytes, searched in {result['seconds']}s")
+        for round_ in result['rounds']:
+            print(f"    {round_['candidates']:>3} candidates on {round_['resources']:>5} rows: best MAE {round_['best_mae']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tune model hyperparameters with successive halving")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--candidates", type=int, default=27, help="Random configurations per model")
+    parser.add_argument("--factor", type=int, default=3, help="Keep 1/factor of candidates per round")
+    parser.add_argument("--min-resources", type=int, default=100, help="Training rows in the first round")
+    parser.add_argument("--cv", type=int, default=5, help="Cross-validation folds")
+    parser.add_argument("--finalists", type=int, default=4, help="Candidates kept for the full-data round")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--dry-run", action="store_true", help="Print the selection without saving it")
+    parser.add_argument("--retrain", action="store_true", help="Train and save a new model version with the selection")
+    parser.add_argument("--promote", action="store_true", help="Promote the retrained version (hot-swapped by workers)")
+    args = parser.parse_args()
+    if args.cv < 2:
+        parser.error("--cv must be at least 2")
+
+    selection = tune_models(args.workers, args.candidates, args.factor, args.min_resources,
+                            args.cv, args.finalists, args.seed)
+    _print_selection(selection)
+    if not args.dry_run:
+        from ..services.model_registry import save_hyperparameters
+        save_hyperparameters(selection)
+        if args.retrain:
+            from ..services.ml_service import MLService
+            service = MLService()
+            service.train_models(promote=args.promote)
+            print(f"Trained model version {service.artifact_version}" + (" (promoted)" if args.promote else ""))
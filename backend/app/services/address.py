@@ -0,0 +1,14 @@
+# ===== BACKEND/APP/SERVICES/ADDRESS.PY =====
+import hashlib
+import re
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+def normalize_address(address: str) -> str:
+    """Normalize free-text addresses so equivalent inputs share one cache key"""
+    return _NON_ALNUM.sub(" ", address.lower()).strip()
+
+def address_seed(address: str) -> int:
+    """Stable 32-bit seed for per-address simulation noise"""
+    digest = hashlib.sha1(normalize_address(address).encode("utf-8")).hexdigest()
+    return int(digest[:8], 16)
@@ -0,0 +1,181 @@
+# ===== BACKEND/APP/SERVICES/AUTOCOMPLETE.PY =====
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+import re
+import threading
+from .address import normalize_address
+from .market_data import data_mtime, read_dataset
+
+logger = logging.getLogger(__name__)
+
+# Cities and representative ZIP codes of the seeded markets, by county
+PLACES = {
+    'Los Angeles County': [
+        ('Los Angeles', ['90012', '90024', '90028']), ('Beverly Hills', ['90210']), ('Long Beach', ['90802']),
+        ('Pasadena', ['91101']), ('Santa Monica', ['90401']), ('Glendale', ['91203'])
+    ],
+    'San Diego County': [
+        ('San Diego', ['92101', '92103']), ('Chula Vista', ['91910']), ('Oceanside', ['92054']),
+        ('Escondido', ['92025']), ('Carlsbad', ['92008'])
+    ],
+    'Orange County': [
+        ('Anaheim', ['92805']), ('Santa Ana', ['92701']), ('Irvine', ['92618']),
+        ('Huntington Beach', ['92648']), ('Newport Beach', ['92660'])
+    ],
+    'Riverside County': [
+        ('Riverside', ['92501']), ('Moreno Valley', ['92553']), ('Corona', ['92879']),
+        ('Temecula', ['92590']), ('Palm Springs', ['92262'])
+    ],
+    'San Bernardino County': [
+        ('San Bernardino', ['92401']), ('Fontana', ['92335']), ('Ontario', ['91761']),
+        ('Rancho Cucamonga', ['91730']), ('Victorville', ['92392'])
+    ],
+    'Santa Clara County': [
+        ('San Jose', ['95112', '95113']), ('Sunnyvale', ['94086']), ('Santa Clara', ['95050']),
+        ('Palo Alto', ['94301']), ('Mountain View', ['94041'])
+    ],
+    'Alameda County': [
+        ('Oakland', ['94612']), ('Fremont', ['94536']), ('Berkeley', ['94704']), ('Hayward', ['94541'])
+    ],
+    'Sacramento County': [
+        ('Sacramento', ['95814']), ('Elk Grove', ['95624']), ('Citrus Heights', ['95610']), ('Folsom', ['95630'])
+    ],
+    'Contra Costa County': [
+        ('Concord', ['94520']), ('Richmond', ['94801']), ('Antioch', ['94509']), ('Walnut Creek', ['94596'])
+    ],
+    'Fresno County': [
+        ('Fresno', ['93721']), ('Clovis', ['93612']), ('Sanger', ['93657']), ('Reedley', ['93654'])
+    ]
+}
+
+def _places(counties: List[str]) -> List[Dict[str, Any]]:
+    """One suggestion per county, city and ZIP; value is the canonical text to send to the API"""
+    places = []
+    for county in counties:
+        for city, zips in PLACES.get(county, []):
+            value = f"{city}, {county}, CA"
+            places.append({'type': 'city', 'label': f"{city}, CA", 'county': county, 'value': value})
+            places.extend(
+                {'type': 'zip', 'label': f"{zip_code} {city}, CA", 'county': county, 'value': f"{zip_code}, {value}"}
+                for zip_code in zips
+            )
+    # Counties come last so a city ranks first when it shares the county's name
+    places.extend({'type': 'county', 'label': f"{county}, CA", 'county': county, 'value': f"{county}, CA"}
+                  for county in counties)
+    return places
+
+class PrefixIndex:
+    """
+    Sorted-array prefix index over place names.
+
+    Keys are normalized names kept in one sorted list, so every key that
+    starts with a prefix sits in a contiguous run found with one bisect.
+    Names match from their start; inner words ("beach" in "Long Beach")
+    live in a second list consulted only when the name matches run short.
+    """
+
+    def __init__(self, places: List[Dict[str, Any]]):
+        self.places = places
+        names, words = set(), set()
+        # Exact place names (and bare ZIP codes) to county, for resolving full addresses
+        self._counties: Dict[str, str] = {}
+        for i, place in enumerate(places):
+            key = normalize_address(place['label'].rsplit(',', 1)[0])
+            names.add((key, i))
+            if place['type'] == 'county' and key.endswith(' county'):
+                names.add((key[:-len(' county')], i))
+                self._counties.setdefault(key[:-len(' county')], place['county'])
+            if place['type'] == 'zip':
+                self._counties.setdefault(key.split()[0], place['county'])
+                continue
+            self._counties.setdefault(key, place['county'])
+            tokens = key.split()
+            words.update((' '.join(tokens[start:]), i) for start in range(1, len(tokens)))
+        self._names = self._sorted(names)
+        self._words = self._sorted(words)
+        self._longest_name = max((len(key.split()) for key in self._counties), default=0)
+
+    @staticmethod
+    def _sorted(pairs) -> Tuple[List[str], List[int]]:
+        pairs = sorted(pairs)
+        return [key for key, _ in pairs], [i for _, i in pairs]
+
+    @staticmethod
+    def _scan(table: Tuple[List[str], List[int]], prefix: str, found: Dict[int, None], limit: int):
+        keys, ids = table
+        for position in range(bisect_left(keys, prefix), len(keys)):
+            if len(found) >= limit or not keys[position].startswith(prefix):
+                return
+            found.setdefault(ids[position])
+
+    def search(self, query: str, limit: int = 8) -> List[Dict[str, Any]]:
+        """
+        Suggestions for the place at the end of a partial address.
+
+        Leading words that do not start a place name (e.g. "123 Main St")
+        are kept as the street and prefixed to each suggested value.
+        """
+        tokens = re.findall(r"[A-Za-z0-9]+", query)
+        words = [token.lower() for token in tokens]
+        for start in range(len(words)):
+            prefix = ' '.join(words[start:])
+            found: Dict[int, None] = {}
+            self._scan(self._names, prefix, found, limit)
+            if start == 0:
+                self._scan(self._words, prefix, found, limit)
+            if found:
+                street = ' '.join(tokens[:start])
+                return [
+                    {**self.places[i], 'value': f"{street}, {self.places[i]['value']}" if street else self.places[i]['value']}
+                    for i in found
+                ]
+        return []
+
+    def resolve(self, address: str) -> Optional[str]:
+        """
+        County of the last known place named in an address, or None.
+
+        Places are matched as whole words from the end of the address, so
+        "12 Orange St, Fresno, CA" resolves to Fresno and a trailing county
+        wins over a city of the same name.
+        """
+        words = normalize_address(address).split()
+        for end in range(len(words), 0, -1):
+            for size in range(min(self._longest_name, end), 0, -1):
+                county = self._counties.get(' '.join(words[end - size:end]))
+                if county is not None:
+                    return county
+        return None
+
+class PlaceIndex:
+    """The current PrefixIndex, rebuilt when the seeded county list changes"""
+
+    def __init__(self):
+        self._index = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def get(self) -> PrefixIndex:
+        mtime = data_mtime()
+        if self._index is None or mtime != self._mtime:
+            with self._lock:
+                if self._index is None or mtime != self._mtime:
+                    self._index = PrefixIndex(_places(self._counties()))
+                    self._mtime = mtime
+        return self._index
+
+    @staticmethod
+    def _counties() -> List[str]:
+        counties = list(PLACES)
+        try:
+            counties += [name for name in read_dataset('counties', columns=['county'])['county'] if name not in PLACES]
+        except Exception as e:
+            logger.warning(f"County dataset unavailable, autocomplete uses built-in places only: {e}")
+        return counties
+
+    @property
+    def version(self) -> float:
+        return self._mtime
+
+place_index = PlaceIndex()
@@ -0,0 +1,45 @@
+# ===== BACKEND/APP/SERVICES/EXPORT.PY =====
+from typing import Iterator
+import csv
+import io
+import orjson
+from .ml_service import MLService
+
+EXPORT_COLUMNS = [
+    'market', 'current_value', 'predicted_change', 'predicted_value',
+    'lower_value', 'upper_value', 'series_change', 'investment_score'
+]
+
+MEDIA_TYPES = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
+
+def iter_forecast_export(service: MLService, fmt: str = "ndjson", chunk_size: int = 500) -> Iterator[bytes]:
+    """
+    Stream forecasts and investment scores for every known market.
+
+    Markets are scored in vectorized chunks and each chunk is encoded and
+    yielded immediately, so memory stays bounded by chunk_size rather than
+    by the number of markets.
+    """
+    markets = service.get_market_features()
+    
+    if fmt == "csv":
+        yield (",".join(EXPORT_COLUMNS) + "\n").encode("utf-8")
+    
+    for start in range(0, len(markets), chunk_size):
+        scores = service.score_markets(markets.iloc[start:start + chunk_size])
+        columns = [scores[name] for name in EXPORT_COLUMNS]
+        
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for row in zip(*columns):
+                writer.writerow([round(value, 2) if isinstance(value, float) else value for value in row])
+            yield buffer.getvalue().encode("utf-8")
+        else:
+            yield b"".join(
+                orjson.dumps(dict(zip(EXPORT_COLUMNS, row)), option=orjson.OPT_SERIALIZE_NUMPY) + b"\n"
+                for row in zip(*columns)
+            )
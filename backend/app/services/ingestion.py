@@ -0,0 +1,172 @@
+# ===== BACKEND/APP/SERVICES/INGESTION.PY =====
+# Incremental loading of monthly price and economic indicator drops. Files are
+# streamed in chunks, rows at or before the source's watermark are skipped,
+# the rest are deduplicated on (county_id, date) and upserted in batches.
+# Afterwards only the touched months are re-aggregated and the served
+# datasets and result cache are refreshed.
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
+import os
+import logging
+from ..core.partitions import ensure_partitions
+from ..models.database import County, PriceHistory, EconomicIndicator, IngestionWatermark
+from .market_data import read_dataset, write_dataset
+from .rollups import refresh_rollups, month_start, _insert_for
+from .result_cache import result_cache
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Dataset name -> (table, value columns)
+INGEST_TABLES = {
+    'prices': (PriceHistory, ['median_price', 'price_per_sqft', 'sales_volume', 'inventory']),
+    'economic': (EconomicIndicator, [
+        'unemployment_rate', 'employment_growth', 'population_growth', 'new_construction', 'mortgage_rate'
+    ])
+}
+
+KEY_COLUMNS = ['county_id', 'date']
+
+def iter_chunks(path: str, chunk_size: int, since: Optional[datetime] = None) -> Iterator["pd.DataFrame"]:
+    """
+    Stream a CSV or Parquet file as DataFrames of at most chunk_size rows.
+
+    For Parquet, row groups whose date statistics end at or before since
+    are skipped without being read.
+    """
+    import pandas as pd
+    import pyarrow.parquet as pq
+
+    if not path.endswith('.parquet'):
+        yield from pd.read_csv(path, chunksize=chunk_size)
+        return
+
+    parquet = pq.ParquetFile(path)
+    row_groups = list(range(parquet.num_row_groups))
+    if since is not None and 'date' in parquet.schema_arrow.names:
+        column = parquet.schema_arrow.get_field_index('date')
+        row_groups = [i for i in row_groups if not _ends_before(parquet.metadata.row_group(i).column(column), since)]
+    for batch in parquet.iter_batches(batch_size=chunk_size, row_groups=row_groups):
+        yield batch.to_pandas()
+
+def _ends_before(column_chunk, since: datetime) -> bool:
+    import pandas as pd
+
+    stats = column_chunk.statistics
+    if stats is None or not stats.has_min_max:
+        return False
+    try:
+        return pd.Timestamp(stats.max) <= pd.Timestamp(since)
+    except (TypeError, ValueError):
+        return False
+
+def _prepare_chunk(chunk: "pd.DataFrame", columns: List[str], county_ids: Dict[str, int]) -> "pd.DataFrame":
+    """Resolve county ids, parse dates and keep the key and value columns"""
+    import pandas as pd
+
+    if 'county_id' not in chunk.columns:
+        names = chunk['county'].astype(str).str.strip().str.lower()
+        chunk = chunk.assign(county_id=names.map(county_ids))
+    chunk = chunk.assign(date=pd.to_datetime(chunk['date']))
+    for name in columns:
+        if name not in chunk.columns:
+            chunk[name] = None
+    return chunk.dropna(subset=KEY_COLUMNS).astype({'county_id': int})[KEY_COLUMNS + columns]
+
+def _upsert(db: Session, table, columns: List[str], rows: "pd.DataFrame", batch_size: int) -> int:
+    """Insert rows, overwriting existing (county_id, date) rows, batch_size at a time"""
+    insert = _insert_for(db.get_bind().dialect.name)
+    # NaN -> None so missing values land as NULL
+    records = rows.astype(object).where(rows.notna(), None).to_dict('records')
+    for start in range(0, len(records), batch_size):
+        stmt = insert(table).values(records[start:start + batch_size])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=KEY_COLUMNS,
+            set_={name: getattr(stmt.excluded, name) for name in columns}
+        )
+        db.execute(stmt)
+    return len(records)
+
+def _merge_into_dataset(dataset: str, frames: List["pd.DataFrame"]):
+    """Fold the new rows into the served dataset file; newer rows win on (county, date)"""
+    import pandas as pd
+
+    current = read_dataset(dataset)
+    current = current.assign(date=pd.to_datetime(current['date']))
+    merged = pd.concat([current, *frames], ignore_index=True)
+    merged = merged.drop_duplicates(['county', 'date'], keep='last').sort_values(['county', 'date'])
+    write_dataset(dataset, merged[current.columns.intersection(merged.columns)])
+
+def ingest_file(db: Session, path: str, dataset: str, source: Optional[str] = None, full: bool = False,
+                chunk_size: int = 50000, batch_size: int = 1000, update_datasets: bool = True) -> Dict[str, Any]:
+    """
+    Load one CSV or Parquet file into the dataset's table and advance its watermark.
+
+    Each chunk is committed on its own, so a failed run can simply be
+    repeated: upserts are idempotent and the watermark only moves once the
+    whole file is in. full ignores the watermark. Returns row counts and
+    the months that were refreshed.
+    """
+    if dataset not in INGEST_TABLES:
+        raise ValueError(f"Unknown dataset '{dataset}'; expected one of {', '.join(INGEST_TABLES)}")
+    table, columns = INGEST_TABLES[dataset]
+    source = source or dataset
+
+    mark = db.query(IngestionWatermark).filter(IngestionWatermark.source == source).first()
+    since = None if full or mark is None else mark.watermark
+    county_names = dict(db.query(County.id, County.name).all())
+    county_ids = {name.lower(): county_id for county_id, name in county_names.items()}
+
+    counts = {'read': 0, 'already_ingested': 0, 'unknown_county': 0, 'duplicates': 0, 'upserted': 0}
+    months, new_rows = set(), []
+    high_water = mark.watermark if mark is not None else None
+    for chunk in iter_chunks(path, chunk_size, since):
+        counts['read'] += len(chunk)
+        rows = _prepare_chunk(chunk, columns, county_ids)
+        counts['unknown_county'] += len(chunk) - len(rows)
+        if since is not None:
+            fresh = rows['date'] > since
+            counts['already_ingested'] += int((~fresh).sum())
+            rows = rows[fresh]
+        deduped = rows.drop_duplicates(KEY_COLUMNS, keep='last')
+        counts['duplicates'] += len(rows) - len(deduped)
+        if deduped.empty:
+            continue
+
+        dates = deduped['date'].dt.to_pydatetime()
+        ensure_partitions(db.connection(), table.__tablename__, dates)
+        counts['upserted'] += _upsert(db, table, columns, deduped, batch_size)
+        db.commit()
+
+        months.update(month_start(d) for d in dates)
+        high_water = max(filter(None, [high_water, max(dates)]))
+        new_rows.append(deduped.assign(county=deduped['county_id'].map(county_names)).drop(columns='county_id'))
+
+    if mark is None:
+        mark = IngestionWatermark(source=source, dataset=dataset, rows_ingested=0)
+        db.add(mark)
+    mark.watermark = high_water
+    mark.rows_ingested = (mark.rows_ingested or 0) + counts['upserted']
+    mark.last_file = os.path.abspath(path)
+    db.commit()
+
+    # Downstream: only the touched months of the rollup, then the served data and cached results
+    if months:
+        refresh_rollups(db, months)
+        if update_datasets:
+            _merge_into_dataset(dataset, new_rows)
+        result_cache.clear()
+
+    logger.info(f"Ingested {counts['upserted']} {dataset} rows from {path} (source {source}, "
+                f"watermark {high_water})")
+    return {
+        'source': source,
+        'dataset': dataset,
+        'file': path,
+        **counts,
+        'months_refreshed': sorted(months),
+        'watermark': high_water
+    }
@@ -0,0 +1,32 @@
+# ===== BACKEND/APP/SERVICES/INVESTMENT_TABLE.PY =====
+from typing import Any, Dict, List, Optional
+import numpy as np
+
+class InvestmentTable:
+    """
+    Precomputed investment scores, SHAP vectors and analyses per market.
+
+    Rows are keyed by the exact investment feature vector, so any address
+    that resolves to a known market is answered by a dictionary lookup
+    instead of a forest prediction and a TreeSHAP pass.
+    """
+
+    def __init__(self, features: np.ndarray, scores: np.ndarray, shap_values: np.ndarray,
+                 analyses: List[Dict[str, Any]]):
+        self.features = np.ascontiguousarray(features, dtype=np.float64)
+        self.scores = scores.astype(np.int16)
+        self.shap_values = shap_values.astype(np.float32)
+        self.analyses = analyses
+        self._index = {row.tobytes(): i for i, row in enumerate(self.features)}
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    def lookup(self, features) -> Optional[int]:
+        """Row index for a feature vector, or None for an unseen market"""
+        return self._index.get(np.asarray(features, dtype=np.float64).tobytes())
+
+    def rows(self, X: np.ndarray) -> np.ndarray:
+        """Row index for each row of X (-1 where the market is unseen)"""
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        return np.array([self._index.get(row.tobytes(), -1) for row in X], dtype=np.int64)
@@ -0,0 +1,342 @@
+# ===== BACKEND/APP/SERVICES/JOBS.PY =====
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+import orjson
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..core.responses import dumps
+
+logger = logging.getLogger(__name__)
+
+# A running job whose worker has not reported progress for this long is
+# assumed dead (crash, restart) and handed to another worker
+STALE_AFTER_SECONDS = 120
+# Running jobs refresh their heartbeat this often, even while one chunk takes long
+HEARTBEAT_INTERVAL_SECONDS = 30
+# Finished jobs are purged at most this often per runner
+PURGE_INTERVAL_SECONDS = 600
+
+FINISHED_STATUSES = ("done", "failed")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    processed INTEGER NOT NULL DEFAULT 0,
+    chunk_size INTEGER NOT NULL,
+    top_k INTEGER NOT NULL,
+    error TEXT,
+    owner TEXT,
+    heartbeat_at REAL,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_created_at ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS job_chunks (
+    job_id TEXT NOT NULL,
+    chunk INTEGER NOT NULL,
+    addresses BLOB NOT NULL,
+    results BLOB,
+    PRIMARY KEY (job_id, chunk)
+);
+"""
+
+def _timestamp(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value, tz=timezone.utc) if value is not None else None
+
+class JobStore:
+    """
+    Batch job state in a local SQLite file, shared by all workers on a host.
+
+    Each job's addresses are split into chunks up front and every chunk's
+    results are written as soon as it is scored, so progress survives a
+    restart and a resumed job continues from its first unscored chunk.
+    Workers claim jobs with a single write transaction, which is the only
+    coordination needed between processes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections are not shared across threads; keep one per thread
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def submit(self, addresses: List[str], chunk_size: int, top_k: int = 3) -> str:
+        """Queue a job and return its id"""
+        job_id = uuid.uuid4().hex
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT INTO jobs (id, status, total, chunk_size, top_k, created_at) VALUES (?, 'queued', ?, ?, ?, ?)",
+                (job_id, len(addresses), chunk_size, top_k, time.time())
+            )
+            connection.executemany(
+                "INSERT INTO job_chunks (job_id, chunk, addresses) VALUES (?, ?, ?)",
+                ((job_id, i, orjson.dumps(addresses[start:start + chunk_size]))
+                 for i, start in enumerate(range(0, len(addresses), chunk_size)))
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        metrics.increment("jobs_submitted_total")
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Status and progress of a job"""
+        row = self._connection().execute(
+            "SELECT id, status, total, processed, error, created_at, started_at, finished_at FROM jobs WHERE id = ?",
+            (job_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        job_id, status, total, processed, error, created_at, started_at, finished_at = row
+        return {
+            'job_id': job_id,
+            'status': status,
+            'total': total,
+            'processed': processed,
+            'progress': round(processed / total, 4) if total else 1.0,
+            'error': error,
+            'created_at': _timestamp(created_at),
+            'started_at': _timestamp(started_at),
+            'finished_at': _timestamp(finished_at)
+        }
+
+    def claim(self, owner: str) -> Optional[Tuple[str, int]]:
+        """Take the oldest queued (or abandoned) job; returns (job id, top_k)"""
+        now = time.time()
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT id, top_k FROM jobs WHERE status = 'queued' OR (status = 'running' AND heartbeat_at < ?) "
+                "ORDER BY created_at LIMIT 1",
+                (now - STALE_AFTER_SECONDS,)
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE jobs SET status = 'running', owner = ?, heartbeat_at = ?, "
+                    "started_at = COALESCE(started_at, ?) WHERE id = ?",
+                    (owner, now, now, row[0])
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return row
+
+    def pending_chunks(self, job_id: str) -> Iterator[Tuple[int, List[str]]]:
+        """Chunks of a job that have no results yet, in order"""
+        rows = self._connection().execute(
+            "SELECT chunk, addresses FROM job_chunks WHERE job_id = ? AND results IS NULL ORDER BY chunk",
+            (job_id,)
+        ).fetchall()
+        for chunk, addresses in rows:
+            yield chunk, orjson.loads(addresses)
+
+    def complete_chunk(self, job_id: str, chunk: int, owner: str, results: List[Dict[str, Any]]) -> bool:
+        """Store one chunk's results; False if the job was handed to another worker meanwhile"""
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            owned = connection.execute(
+                "UPDATE jobs SET processed = processed + ?, heartbeat_at = ? "
+                "WHERE id = ? AND owner = ? AND status = 'running'",
+                (len(results), time.time(), job_id, owner)
+            ).rowcount
+            if owned:
+                connection.execute(
+                    "UPDATE job_chunks SET results = ? WHERE job_id = ? AND chunk = ?",
+                    (dumps(results), job_id, chunk)
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return bool(owned)
+
+    def heartbeat(self, job_id: str, owner: str) -> bool:
+        """Mark a running job as alive; False if it is no longer owned by this worker"""
+        return bool(self._connection().execute(
+            "UPDATE jobs SET heartbeat_at = ? WHERE id = ? AND owner = ? AND status = 'running'",
+            (time.time(), job_id, owner)
+        ).rowcount)
+
+    def finish(self, job_id: str, owner: str, error: Optional[str] = None):
+        self._connection().execute(
+            "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ? AND owner = ?",
+            ("failed" if error else "done", error, time.time(), job_id, owner)
+        )
+        metrics.increment("jobs_failed_total" if error else "jobs_completed_total")
+
+    def release(self, job_id: str, owner: str):
+        """Put an unfinished job back in the queue"""
+        self._connection().execute(
+            "UPDATE jobs SET status = 'queued', owner = NULL WHERE id = ? AND owner = ? AND status = 'running'",
+            (job_id, owner)
+        )
+
+    def results(self, job_id: str, offset: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Scored rows of a job in submission order, reading only the chunks the window covers"""
+        chunk_size = self._connection().execute(
+            "SELECT chunk_size FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()[0]
+        first = offset // chunk_size
+        last = (offset + limit - 1) // chunk_size if limit else None
+        rows = self._connection().execute(
+            "SELECT results FROM job_chunks WHERE job_id = ? AND chunk >= ? AND (? IS NULL OR chunk <= ?) "
+            "AND results IS NOT NULL ORDER BY chunk",
+            (job_id, first, last, last)
+        ).fetchall()
+        results = [row for (payload,) in rows for row in orjson.loads(payload)]
+        start = offset - first * chunk_size
+        return results[start:start + limit] if limit else results[start:]
+
+    def purge(self, older_than_seconds: float) -> int:
+        """Delete finished jobs (and their results) older than the retention window"""
+        connection = self._connection()
+        cutoff = time.time() - older_than_seconds
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            expired = [job_id for (job_id,) in connection.execute(
+                "SELECT id FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?", (cutoff,)
+            )]
+            connection.executemany("DELETE FROM job_chunks WHERE job_id = ?", ((job_id,) for job_id in expired))
+            connection.executemany("DELETE FROM jobs WHERE id = ?", ((job_id,) for job_id in expired))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return len(expired)
+
+    def counts(self) -> Dict[str, int]:
+        return dict(self._connection().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+def score_rows(addresses: List[str], top_k: int) -> List[Dict[str, Any]]:
+    """Vectorized forecast and investment score per address, as JSON-ready rows"""
+    from .ml_service import get_ml_service
+
+    scored = get_ml_service().score_addresses(addresses, top_k=top_k)
+    columns = {name: values.tolist() for name, values in scored.items()}
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
+
+class JobRunner:
+    """
+    A bounded pool of threads that claim queued jobs and score them chunk by chunk.
+
+    Every uvicorn worker runs its own pool against the shared store, so the
+    total concurrency is workers x JOB_WORKERS. Pools poll for new jobs;
+    submissions to the same process wake them immediately.
+    """
+
+    def __init__(self, store: JobStore, workers: int, poll_interval: float, retention_seconds: float):
+        self.store = store
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._last_purge = 0.0
+
+    def start(self):
+        if self._threads or self.workers <= 0:
+            return
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self):
+        self._wake.set()
+
+    def _run(self):
+        owner = f"{socket.gethostname()}:{os.getpid()}:{threading.current_thread().name}"
+        while not self._stop.is_set():
+            # Nothing may escape this loop: a dead thread would shrink the pool for good
+            try:
+                self._maybe_purge()
+                claimed = self.store.claim(owner)
+                if claimed is not None:
+                    self.run_job(*claimed, owner=owner)
+                    continue
+            except sqlite3.Error as e:
+                logger.warning(f"Job store unavailable: {e}")
+            except Exception:
+                logger.exception("Job worker error")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def run_job(self, job_id: str, top_k: int, owner: str):
+        """Score the job's remaining chunks; a crash here leaves it to be resumed elsewhere"""
+        done = threading.Event()
+        threading.Thread(target=self._heartbeat, args=(job_id, owner, done), daemon=True).start()
+        try:
+            for chunk, addresses in self.store.pending_chunks(job_id):
+                if self._stop.is_set():
+                    # Shutting down: hand the job back so the next worker resumes it at this chunk
+                    self.store.release(job_id, owner)
+                    return
+                if not self.store.complete_chunk(job_id, chunk, owner, score_rows(addresses, top_k)):
+                    logger.warning(f"Job {job_id} was taken over by another worker")
+                    return
+                metrics.increment("job_addresses_processed_total", len(addresses))
+            self.store.finish(job_id, owner)
+            logger.info(f"Job {job_id} finished")
+        except Exception as e:
+            logger.exception(f"Job {job_id} failed")
+            self.store.finish(job_id, owner, error=str(e))
+        finally:
+            done.set()
+
+    def _heartbeat(self, job_id: str, owner: str, done: threading.Event):
+        """Keep a claimed job's heartbeat fresh so slow chunks are not taken over"""
+        while not done.wait(HEARTBEAT_INTERVAL_SECONDS):
+            try:
+                if not self.store.heartbeat(job_id, owner):
+                    return
+            except sqlite3.Error as e:
+                logger.warning(f"Job {job_id} heartbeat failed: {e}")
+
+    def _maybe_purge(self):
+        now = time.monotonic()
+        if now - self._last_purge >= PURGE_INTERVAL_SECONDS:
+            self._last_purge = now
+            purged = self.store.purge(self.retention_seconds)
+            if purged:
+                logger.info(f"Purged {purged} finished jobs")
+
+job_store = JobStore(settings.JOB_STORE_PATH)
+job_runner = JobRunner(job_store, settings.JOB_WORKERS, settings.JOB_POLL_INTERVAL_SECONDS,
+                       settings.JOB_RETENTION_HOURS * 3600)
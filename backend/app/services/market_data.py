@@ -0,0 +1,176 @@
+# ===== BACKEND/APP/SERVICES/MARKET_DATA.PY =====
+import numpy as np
+import os
+from typing import Dict, List, Tuple, TYPE_CHECKING
+import logging
+from ..core.config import settings
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DATASETS = ['counties', 'prices', 'economic', 'rental']
+
+DATASET_FILES = {
+    'counties': 'california_counties',
+    'prices': 'historical_prices',
+    'economic': 'economic_indicators',
+    'rental': 'rental_data'
+}
+
+FILE_EXTENSIONS = {
+    'csv': 'csv',
+    'parquet': 'parquet',
+    'arrow': 'arrow'
+}
+
+# Derived per-market features, stored as Arrow IPC so reads are memory-mapped
+FEATURE_STORE_FILE = 'market_features.arrow'
+
+def dataset_path(name: str, fmt: str = None) -> str:
+    fmt = fmt or settings.DATA_FORMAT
+    return f"{settings.DATA_PATH}{DATASET_FILES[name]}.{FILE_EXTENSIONS[fmt]}"
+
+def data_mtime() -> float:
+    """Latest modification time across the seeded datasets (0 if none exist)"""
+    paths = [dataset_path(name) for name in DATASETS]
+    return max((os.path.getmtime(path) for path in paths if os.path.exists(path)), default=0.0)
+
+def write_dataset(name: str, frame: "pd.DataFrame", fmt: str = None):
+    """Write a dataset in the configured format (Parquet by default)"""
+    import pandas as pd
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    
+    fmt = fmt or settings.DATA_FORMAT
+    path = dataset_path(name, fmt)
+    os.makedirs(settings.DATA_PATH, exist_ok=True)
+    
+    if fmt == 'csv':
+        frame.to_csv(path, index=False)
+        return
+    
+    # Typed formats keep real timestamps instead of date strings
+    if 'date' in frame.columns:
+        frame = frame.assign(date=pd.to_datetime(frame['date']))
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    
+    if fmt == 'parquet':
+        # Row-group statistics let readers skip groups that fail a filter
+        pq.write_table(table, path, row_group_size=settings.PARQUET_ROW_GROUP_SIZE)
+    else:
+        with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+def _filter_columns(filters: List) -> List[str]:
+    """Column names referenced by pyarrow-style filters (flat or DNF list of lists)"""
+    columns = []
+    for term in filters or []:
+        for column, _, _ in (term if isinstance(term, list) else [term]):
+            columns.append(column)
+    return columns
+
+def read_dataset(name: str, columns: List[str] = None, filters: List[Tuple] = None) -> "pd.DataFrame":
+    """
+    Read one seeded dataset, generating the offline demo data if it is missing.
+
+    columns projects the read onto a subset of columns and filters takes
+    pyarrow-style predicates such as [('county', '=', 'Fresno County')]. For
+    Parquet both are pushed down into the reader; Arrow IPC files are
+    memory-mapped and filtered without a parse step.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    
+    fmt = settings.DATA_FORMAT
+    path = dataset_path(name, fmt)
+    if not os.path.exists(path):
+        from ..scripts.seed_data import create_seeded_csvs
+        logger.info(f"{path} not found, generating seeded market data")
+        create_seeded_csvs()
+    
+    if fmt == 'parquet':
+        return pq.read_table(path, columns=columns, filters=filters).to_pandas()
+    
+    if fmt == 'arrow':
+        with pa.memory_map(path, 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+    else:
+        # Filters may reference columns outside the projection; parse both, project after filtering
+        needed = list(dict.fromkeys([*columns, *_filter_columns(filters)])) if columns else None
+        convert_options = pa_csv.ConvertOptions(include_columns=needed) if needed else None
+        table = pa_csv.read_csv(path, convert_options=convert_options)
+    
+    if filters:
+        table = table.filter(pq.filters_to_expression(filters))
+    if columns:
+        table = table.select(columns)
+    return table.to_pandas()
+
+def _write_feature_store(markets: "pd.DataFrame"):
+    import pyarrow as pa
+    
+    # Write to a temp file and rename so concurrent readers never see a partial file
+    path = f"{settings.DATA_PATH}{FEATURE_STORE_FILE}"
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    table = pa.Table.from_pandas(markets)
+    with pa.OSFile(tmp_path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    os.replace(tmp_path, path)
+
+def _read_feature_store() -> "pd.DataFrame":
+    import pyarrow as pa
+    
+    with pa.memory_map(f"{settings.DATA_PATH}{FEATURE_STORE_FILE}", 'r') as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+def load_market_features() -> "pd.DataFrame":
+    """Per-market features, served from the memory-mapped feature store when it is current"""
+    store_path = f"{settings.DATA_PATH}{FEATURE_STORE_FILE}"
+    if os.path.exists(store_path) and os.path.getmtime(store_path) >= data_mtime():
+        return _read_feature_store()
+    
+    markets = build_market_features()
+    _write_feature_store(markets)
+    return markets
+
+def build_market_features() -> "pd.DataFrame":
+    """
+    Build one row of model features per county from the seeded datasets.
+
+    Columns cover the price- and investment-model features (except the
+    time-dependent seasonal_factor) plus descriptive fields
+    (region, median_home_price, ...) used in API responses.
+    """
+    counties = read_dataset('counties').set_index('county')
+    economic = read_dataset('economic', columns=[
+        'county', 'population_growth', 'employment_growth', 'new_construction', 'mortgage_rate'
+    ])
+    prices = read_dataset('prices', columns=['county', 'date', 'median_price'])
+
+    # Average the monthly economic indicators per county
+    indicators = economic.groupby('county')[
+        ['population_growth', 'employment_growth', 'new_construction', 'mortgage_rate']
+    ].mean()
+
+    # Annualized volatility of monthly median price changes
+    prices = prices.sort_values(['county', 'date'])
+    monthly_change = prices.groupby('county')['median_price'].pct_change()
+    volatility = (monthly_change.groupby(prices['county']).std() * np.sqrt(12)).rename('market_volatility')
+
+    markets = counties.join(indicators).join(volatility)
+    # Same definition as the training data: annual price over annual rent
+    markets['price_to_rent_ratio'] = 100 / markets['rental_yield']
+    markets['price_per_sqft_lag'] = markets['price_per_sqft']
+    return markets
+
+def build_name_lookup(names: List[str]) -> Dict[str, str]:
+    """Map lowercase county names, with and without the ' County' suffix, to canonical names"""
+    lookup = {}
+    for name in names:
+        lookup[name.lower()] = name
+        if name.lower().endswith(' county'):
+            lookup[name.lower()[:-len(' county')]] = name
+    return lookup
@@ -1,104 +1,231 @@
 # ===== BACKEND/APP/SERVICES/ML_SERVICE.PY =====
-import pandas as pd
+# pandas, scikit-learn, LightGBM, SHAP and joblib are imported lazily inside the
+# methods that need them, so importing this module (and every endpoint that
+# depends on it) stays cheap until a model-backed route is first used.
 import numpy as np
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-import lightgbm as lgb
-import shap
-import joblib
+import copy
+import hashlib
+import json
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Any
+import threading
+import time
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Any, TYPE_CHECKING
 import logging
+from .address import address_seed, normalize_address
+from .market_data import load_market_features, read_dataset, data_mtime, build_name_lookup
+from . import model_registry
+from .model_registry import MODEL_FILES, load_hyperparameters
+from .investment_table import InvestmentTable
+from .timeseries import load_series_model
+from .autocomplete import PrefixIndex, place_index
+from ..core.timing import startup_timer
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+PRICE_FEATURES = [
+    'median_income', 'population_growth', 'employment_growth',
+    'inventory_months', 'days_on_market', 'mortgage_rate',
+    'new_construction', 'price_per_sqft_lag', 'seasonal_factor'
+]
+
+INVESTMENT_FEATURES = [
+    'price_to_rent_ratio', 'rental_yield', 'price_growth_5yr',
+    'population_growth', 'employment_growth', 'inventory_months',
+    'median_income', 'new_construction', 'market_volatility'
+]
+
+# Defaults used until app.scripts.tune_models saves a tuned configuration
+PRICE_MODEL_PARAMS = {'n_estimators': 100, 'learning_rate': 0.1, 'max_depth': 6, 'random_state': 42}
+INVESTMENT_MODEL_PARAMS = {'n_estimators': 100, 'max_depth': 10, 'random_state': 42}
+
+# Investment features for the market profiles addresses resolve to
+INVESTMENT_PROFILES = {
+    'luxury': [35, 3.2, 15, 0.8, 1.5, 2.0, 120000, 200, 0.12],
+    'inland_empire': [22, 6.8, 25, 2.8, 3.5, 4.5, 65000, 800, 0.18],
+    'default': [28, 5.5, 20, 1.8, 2.2, 3.5, 75000, 450, 0.15]
+}
+
+# Forecast chart layout
+MAX_HORIZON_MONTHS = 60
+# Location used when an address names no known place
+DEFAULT_COUNTY = "Los Angeles County"
+DEFAULT_PRICE = 650000
+HISTORY_MONTHS = 6
+CHART_GRANULARITIES = ["monthly", "weekly"]
+WEEKS_PER_MONTH = 52 / 12
+
+@lru_cache(maxsize=128)
+def _chart_date_index(today: date, horizon_months: int, granularity: str) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Chart dates (datetime64[D]) and their offsets from today in months.
+
+    The first HISTORY_MONTHS worth of points are historical (negative
+    offsets); forecast points start at offset 0. Cached per day, so the
+    date arithmetic runs once rather than on every request.
+    """
+    if granularity == "weekly":
+        steps = np.arange(-round(HISTORY_MONTHS * WEEKS_PER_MONTH), round(horizon_months * WEEKS_PER_MONTH))
+        dates = np.datetime64(today, 'D') + steps * 7
+        offsets = steps / WEEKS_PER_MONTH
+    else:
+        steps = np.arange(-HISTORY_MONTHS, horizon_months)
+        dates = (np.datetime64(today, 'M') + steps).astype('datetime64[D]')
+        offsets = steps.astype(float)
+    
+    # Shared between requests; keep callers from mutating the cached arrays
+    dates.flags.writeable = False
+    offsets.flags.writeable = False
+    return dates, offsets, int((steps < 0).sum())
+
 class MLService:
-    def __init__(self):
+    def __init__(self, version: Optional[str] = None):
         self.price_model = None
         self.investment_model = None
-        self.scaler = StandardScaler()
+        self.scaler = None
         self.shap_explainer = None
-        self.feature_names = []
-        self.load_models()
+        self.feature_names = INVESTMENT_FEATURES
+        self.artifact_version = None
+        self.model_version = None
+        self.data_version = None
+        self.updated_at = None
+        self.market_features = None
+        self.market_index = None
+        self.investment_table = None
+        self.series_model = None
+        self._market_matrix = None
+        self._market_lookup = {}
+        self._home_prices = {}
+        self._market_mtime = None
+        self._price_history = {}
+        self._series_change = None
+        self._market_lock = threading.Lock()
+        self.load_models(version)
+        
+    def load_models(self, version: Optional[str] = None):
+        """Load a model version (default: the promoted one) or train new models"""
+        if version is not None:
+            # An explicitly requested version must load; never silently retrain
+            self._load_version(version)
+            return
         
-    def load_models(self):
-        """Load pre-trained models or train new ones"""
         try:
-            model_path = "app/models/trained_models/"
-            if os.path.exists(f"{model_path}price_model.joblib"):
-                self.price_model = joblib.load(f"{model_path}price_model.joblib")
-                self.investment_model = joblib.load(f"{model_path}investment_model.joblib")
-                self.scaler = joblib.load(f"{model_path}scaler.joblib")
-                logger.info("Loaded pre-trained models")
+            version = model_registry.current_version() or model_registry.import_legacy_artifacts()
+            if version is not None:
+                self._load_version(version)
             else:
                 self.train_models()
         except Exception as e:
             logger.error(f"Error loading models: {e}")
             self.train_models()
     
-    def train_models(self):
-        """Train ML models with seeded data"""
+    def _load_version(self, version: str):
+        import joblib
+        
+        if not model_registry.version_exists(version):
+            raise ValueError(f"Unknown model version: {version}")
+        model_path = model_registry.version_path(version)
+        self.price_model = joblib.load(f"{model_path}price_model.joblib")
+        self.investment_model = joblib.load(f"{model_path}investment_model.joblib")
+        self.scaler = joblib.load(f"{model_path}scaler.joblib")
+        self.artifact_version = version
+        self._refresh_versions(model_path)
+        logger.info(f"Loaded model version {version}")
+    
+    def _refresh_versions(self, model_path: str):
+        """Derive cache validators from the saved model artifacts and served data"""
+        digest = hashlib.sha1()
+        mtimes = []
+        for name in MODEL_FILES:
+            with open(f"{model_path}{name}", "rb") as f:
+                digest.update(f.read())
+            mtimes.append(os.path.getmtime(f"{model_path}{name}"))
+        self.model_version = digest.hexdigest()[:12]
+        self.updated_at = datetime.fromtimestamp(max(mtimes), tz=timezone.utc)
+        self._refresh_data_version()
+    
+    def _refresh_data_version(self):
+        """Hash the data served alongside model output (top areas and market features)"""
+        digest = hashlib.sha1(json.dumps(self.get_top_investment_areas(), sort_keys=True).encode("utf-8"))
+        if self.market_features is not None:
+            digest.update(self.market_features.to_json().encode("utf-8"))
+        self.data_version = digest.hexdigest()[:12]
+    
+    def train_models(self, promote: bool = True):
+        """Train ML models with seeded data and save them as a new version"""
+        import lightgbm as lgb
+        from sklearn.ensemble import RandomForestRegressor
+        from sklearn.preprocessing import StandardScaler
+        
         logger.info("Training new ML models...")
         
         # Generate synthetic training data
         train_data = self._generate_training_data()
         
         # Prepare features for price prediction
-        price_features = [
-            'median_income', 'population_growth', 'employment_growth',
-            'inventory_months', 'days_on_market', 'mortgage_rate',
-            'new_construction', 'price_per_sqft_lag', 'seasonal_factor'
-        ]
-        
-        X_price = train_data[price_features]
+        X_price = train_data[PRICE_FEATURES]
         y_price = train_data['price_change_12m']
         
+        # Hyperparameters selected by app.scripts.tune_models, if it has been run
+        tuned = load_hyperparameters()
+        
         # Train price prediction model
-        self.price_model = lgb.LGBMRegressor(
-            n_estimators=100,
-            learning_rate=0.1,
-            max_depth=6,
-            random_state=42
-        )
+        self.price_model = lgb.LGBMRegressor(**{**PRICE_MODEL_PARAMS, **tuned.get('price_model', {})})
         self.price_model.fit(X_price, y_price)
         
         # Investment scoring features
-        investment_features = [
-            'price_to_rent_ratio', 'rental_yield', 'price_growth_5yr',
-            'population_growth', 'employment_growth', 'inventory_months',
-            'median_income', 'new_construction', 'market_volatility'
-        ]
-        
-        X_invest = train_data[investment_features]
+        X_invest = train_data[INVESTMENT_FEATURES]
         y_invest = train_data['investment_score']
         
         # Train investment scoring model
         self.investment_model = RandomForestRegressor(
-            n_estimators=100,
-            max_depth=10,
-            random_state=42
+            **{**INVESTMENT_MODEL_PARAMS, **tuned.get('investment_model', {})}
         )
         self.investment_model.fit(X_invest, y_invest)
         
         # Fit scaler
+        self.scaler = StandardScaler()
         self.scaler.fit(X_invest)
         
-        # Initialize SHAP explainer
-        self.shap_explainer = shap.TreeExplainer(self.investment_model)
-        self.feature_names = investment_features
+        # SHAP explainer is rebuilt lazily for the new model
+        self.shap_explainer = None
         
-        # Save models
-        os.makedirs("app/models/trained_models/", exist_ok=True)
-        joblib.dump(self.price_model, "app/models/trained_models/price_model.joblib")
-        joblib.dump(self.investment_model, "app/models/trained_models/investment_model.joblib")
-        joblib.dump(self.scaler, "app/models/trained_models/scaler.joblib")
+        # Save models as a new version and serve it
+        version = model_registry.save_version({
+            "price_model.joblib": self.price_model,
+            "investment_model.joblib": self.investment_model,
+            "scaler.joblib": self.scaler
+        })
+        if promote:
+            model_registry.promote(version)
+        self.artifact_version = version
+        self._refresh_versions(model_registry.version_path(version))
         
         logger.info("Models trained and saved successfully")
     
-    def _generate_training_data(self) -> pd.DataFrame:
+    def warm_up(self):
+        """Run one forecast and one investment analysis so first requests are fast"""
+        self.get_shap_explainer()
+        self._ensure_market_index()
+        self.predict_price_forecast("Los Angeles, CA")
+        self.predict_investment_score("Los Angeles, CA")
+    
+    def get_shap_explainer(self):
+        """Build the SHAP explainer on first use (shap is slow to import)"""
+        if self.shap_explainer is None:
+            import shap
+            self.shap_explainer = shap.TreeExplainer(self.investment_model)
+        return self.shap_explainer
+    
+    @staticmethod
+    def _generate_training_data() -> "pd.DataFrame":
         """Generate synthetic training data for CA counties"""
+        import pandas as pd
+        
         np.random.seed(42)
         n_samples = 1000
         
@@ -190,42 +317,52 @@ class MLService:
         
         return pd.DataFrame(data)
     
-    def predict_price_forecast(self, address: str) -> Dict[str, Any]:
-        """Generate 12-month price forecast for given address"""
+    def predict_price_forecast(self, address: str, chart_format: str = "rows", horizon_months: int = 12,
+                               granularity: str = "monthly") -> Dict[str, Any]:
+        """Generate a price forecast for given address over horizon_months (up to 60)"""
+        if not 1 <= horizon_months <= MAX_HORIZON_MONTHS:
+            raise ValueError(f"horizon_months must be between 1 and {MAX_HORIZON_MONTHS}")
+        if granularity not in CHART_GRANULARITIES:
+            raise ValueError(f"granularity must be one of {', '.join(CHART_GRANULARITIES)}")
+        
         # Simulate address lookup and feature extraction
         features = self._extract_features_from_address(address)
         
-        # Generate base prediction
-        base_prediction = self.price_model.predict([features])[0]
+        # Seed noise per address so repeated requests return identical forecasts
+        rng = np.random.default_rng(address_seed(address))
         
-        # Generate confidence intervals
-        predictions = []
-        for _ in range(100):  # Monte Carlo simulation
-            noise = np.random.normal(0, 2)  # Add uncertainty
-            pred = base_prediction + noise
-            predictions.append(pred)
+        # Extract location info
+        county, current_price = self._get_location_info(address)
+        
+        # Counties with enough history forecast from their own fitted trend and seasonality;
+        # the price model covers the rest
+        base_prediction = self._series_changes().get(county)
+        if base_prediction is None:
+            base_prediction = self.price_model.predict([features])[0]
         
-        predictions = np.array(predictions)
+        # Generate confidence intervals
+        predictions = base_prediction + rng.normal(0, 2, 100)  # Monte Carlo simulation
         lower_bound = np.percentile(predictions, 10)  # 80% CI
         upper_bound = np.percentile(predictions, 90)
         
-        # Generate time series data
+        # Generate time series data anchored on the property's price and its market's history
         chart_data = self._generate_forecast_chart_data(
-            base_prediction, lower_bound, upper_bound, features
+            base_prediction, lower_bound, upper_bound, current_price,
+            history=self._get_price_history(county), series=self._get_series_row(county),
+            horizon_months=horizon_months, granularity=granularity
         )
-        
-        # Extract location info
-        county, current_price = self._get_location_info(address)
+        if chart_format == "rows":
+            chart_data = self._chart_columns_to_rows(chart_data)
         
         return {
             'address': address,
             'county': county,
             'current_value': current_price,
             'predicted_value': current_price * (1 + base_prediction / 100),
-            'recent_change': np.random.normal(0.5, 2),
+            'recent_change': rng.normal(0.5, 2),
             'predicted_change': base_prediction,
             'market_type': self._determine_market_type(features),
-            'confidence': max(70, min(95, int(85 + np.random.normal(0, 5)))),
+            'confidence': max(70, min(95, int(85 + rng.normal(0, 5)))),
             'volatility': self._assess_volatility(features),
             'seasonal_trend': self._assess_seasonal_trend(),
             'momentum': self._assess_momentum(features),
@@ -237,12 +374,23 @@ class MLService:
         """Generate investment analysis for given address"""
         features = self._extract_investment_features(address)
         
+        # Known markets are precomputed; only unseen ones run the model and SHAP
+        self._ensure_market_index()
+        row = self.investment_table.lookup(features)
+        if row is not None:
+            # Deep copy: nested lists (highlights, SHAP factors) must not be shared with the table
+            return {**copy.deepcopy(self.investment_table.analyses[row]), 'address': address}
+        
         # Predict investment score
         score = self.investment_model.predict([features])[0]
         score = max(0, min(100, int(score)))
         
         # Generate SHAP explanations
-        shap_values = self.shap_explainer.shap_values([features])[0]
+        shap_values = self.get_shap_explainer().shap_values(np.asarray([features]))[0]
+        return self._build_investment_analysis(address, features, score, shap_values)
+    
+    def _build_investment_analysis(self, address: Optional[str], features: List[float], score: int,
+                                   shap_values: np.ndarray) -> Dict[str, Any]:
         shap_explanations = [
             {
                 'feature': self._format_feature_name(feat),
@@ -270,6 +418,21 @@ class MLService:
             'metrics': metrics
         }
     
+    def refresh_investment_table(self, markets: "pd.DataFrame"):
+        """Precompute scores, SHAP vectors and analyses for every known market"""
+        X = np.unique(np.vstack([
+            np.array(list(INVESTMENT_PROFILES.values()), dtype=np.float64),
+            markets[INVESTMENT_FEATURES].to_numpy(dtype=np.float64)
+        ]), axis=0)
+        scores = np.clip(self.investment_model.predict(X), 0, 100).astype(int)
+        shap_values = self.get_shap_explainer().shap_values(X)
+        analyses = [
+            self._build_investment_analysis(None, features.tolist(), int(score), shap_row)
+            for features, score, shap_row in zip(X, scores, shap_values)
+        ]
+        self.investment_table = InvestmentTable(X, scores, shap_values, analyses)
+        logger.info(f"Precomputed investment analyses for {len(X)} markets")
+    
     def get_top_investment_areas(self) -> List[Dict[str, Any]]:
         """Get top 5 investment areas in California"""
         # Generate data for top CA counties
@@ -338,6 +501,170 @@ class MLService:
         
         return top_counties
     
+    def refresh_market_index(self):
+        """Rebuild the comparable-markets KD-tree from the current market data"""
+        from sklearn.neighbors import KDTree
+        
+        mtime = data_mtime()
+        markets = load_market_features()
+        # Standardize with the scaler fitted on the investment model's training data
+        matrix = self.scaler.transform(markets[INVESTMENT_FEATURES])
+        
+        # Built before the index is published so readers never see an index without a table
+        self.refresh_investment_table(markets)
+        self.market_features = markets
+        self._market_matrix = matrix
+        self.market_index = KDTree(matrix)
+        self._market_lookup = build_name_lookup(list(markets.index))
+        self._home_prices = markets['median_home_price'].astype(float).to_dict()
+        
+        # Per-county price history for anchoring forecast charts, read on first use
+        self._price_history = {}
+        # Trend and seasonal parameters for every price series, cached on disk
+        self.series_model = load_series_model()
+        self._market_mtime = mtime
+        self._refresh_data_version()
+        logger.info(f"Built comparable-markets index over {len(markets)} markets")
+    
+    def _ensure_market_index(self):
+        """Build the index on first use and rebuild it when the data files change"""
+        if self.market_index is None or data_mtime() != self._market_mtime:
+            with self._market_lock:
+                if self.market_index is None or data_mtime() != self._market_mtime:
+                    self.refresh_market_index()
+    
+    def current_data_version(self) -> str:
+        """The data version after picking up changed data files (a stat call when nothing changed)"""
+        self._ensure_market_index()
+        return self.data_version
+    
+    def find_similar_markets(self, county: str, k: int = 5) -> Optional[List[Dict[str, Any]]]:
+        """Return the k markets closest to county in standardized feature space"""
+        self._ensure_market_index()
+        name = self._market_lookup.get(normalize_address(county))
+        if name is None:
+            return None
+        
+        markets = self.market_features
+        row = markets.index.get_loc(name)
+        n_neighbors = min(k + 1, len(markets))
+        distances, indices = self.market_index.query(self._market_matrix[row:row + 1], k=n_neighbors)
+        
+        similar = []
+        for distance, idx in zip(distances[0], indices[0]):
+            if idx == row:
+                continue
+            market = markets.iloc[idx]
+            similar.append({
+                'county': markets.index[idx],
+                'region': market['region'],
+                'distance': round(float(distance), 4),
+                'median_price': float(market['median_home_price']),
+                'rental_yield': float(market['rental_yield']),
+                'price_growth_5yr': float(market['price_growth_5yr']),
+                'population_growth': round(float(market['population_growth']), 2)
+            })
+        return similar[:k]
+    
+    def get_market_features(self) -> "pd.DataFrame":
+        """Current per-market feature frame (refreshed when the data changes)"""
+        self._ensure_market_index()
+        return self.market_features
+    
+    def score_markets(self, markets: "pd.DataFrame") -> Dict[str, np.ndarray]:
+        """Vectorized 12-month forecast and investment score for a frame of markets"""
+        price_X = markets.assign(seasonal_factor=np.sin(2 * np.pi * datetime.now().month / 12))[PRICE_FEATURES]
+        predicted_change = self._with_series_trend(self.price_model.predict(price_X), markets.index)
+        # Every seeded market has a precomputed table row; only unseen ones hit the forest
+        scores, _ = self._score_investment_rows(markets[INVESTMENT_FEATURES].to_numpy(dtype=np.float64))
+        
+        current_value = markets['median_home_price'].to_numpy(dtype=float)
+        # 80% interval of the N(0, 2) forecast noise used by predict_price_forecast
+        interval = 1.2816 * 2
+        
+        # NaN marks markets forecast by the price model (too little history for a series fit)
+        series_change = self._series_changes()
+        return {
+            'market': markets.index.to_numpy(),
+            'current_value': current_value,
+            'predicted_change': predicted_change,
+            'predicted_value': current_value * (1 + predicted_change / 100),
+            'lower_value': current_value * (1 + (predicted_change - interval) / 100),
+            'upper_value': current_value * (1 + (predicted_change + interval) / 100),
+            'series_change': np.array([series_change.get(market, np.nan) for market in markets.index]),
+            'investment_score': scores
+        }
+    
+    def score_addresses(self, addresses: List[str], top_k: int = 3) -> Dict[str, np.ndarray]:
+        """Vectorized forecast, investment score and top-k SHAP factors for many addresses"""
+        price_X = np.array([self._extract_features_from_address(a) for a in addresses])
+        invest_X = np.array([self._extract_investment_features(a) for a in addresses])
+        self._ensure_market_index()
+        places = place_index.get()
+        locations = [self._get_location_info(a, places) for a in addresses]
+        
+        predicted_change = self._with_series_trend(self.price_model.predict(price_X),
+                                                   [county for county, _ in locations])
+        
+        # Many addresses share a market's feature vector; score each distinct row
+        # once and broadcast the results back
+        unique_X, inverse = np.unique(invest_X, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        unique_scores, unique_shap = self._score_investment_rows(unique_X)
+        scores = unique_scores[inverse]
+        shap_values = unique_shap[inverse]
+        
+        # Rank features by absolute SHAP impact per row
+        order = np.argsort(-np.abs(shap_values), axis=1)[:, :top_k]
+        
+        current_value = np.array([price for _, price in locations], dtype=float)
+        interval = 1.2816 * 2
+        return {
+            'address': np.array(addresses, dtype=object),
+            'county': np.array([county for county, _ in locations], dtype=object),
+            'current_value': current_value,
+            'predicted_change': predicted_change,
+            'predicted_value': current_value * (1 + predicted_change / 100),
+            'lower_value': current_value * (1 + (predicted_change - interval) / 100),
+            'upper_value': current_value * (1 + (predicted_change + interval) / 100),
+            'investment_score': scores,
+            'shap_top_features': np.array(self.feature_names, dtype=object)[order],
+            'shap_top_impacts': np.take_along_axis(shap_values, order, axis=1)
+        }
+    
+    def _series_changes(self) -> Dict[str, float]:
+        """12-month percent change of every fitted series from this month, computed once per data version and month"""
+        self._ensure_market_index()
+        key = (self._market_mtime, int(np.datetime64(date.today(), 'M').astype(np.int64)))
+        cached = self._series_change
+        if cached is None or cached[0] != key:
+            cached = (key, self.series_model.forecast_change(12, origin=key[1]))
+            self._series_change = cached
+        return cached[1]
+    
+    def _with_series_trend(self, predicted_change: np.ndarray, counties) -> np.ndarray:
+        """Price-model changes, replaced by the fitted series forecast wherever a county has one"""
+        changes = self._series_changes()
+        return np.array([changes.get(county, change) for county, change in zip(counties, predicted_change)],
+                        dtype=float)
+    
+    def _score_investment_rows(self, X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Investment scores and SHAP values, from the precomputed table where possible"""
+        self._ensure_market_index()
+        table = self.investment_table
+        rows = table.rows(X)
+        known = rows >= 0
+        
+        scores = np.empty(len(X), dtype=int)
+        shap_values = np.empty(X.shape, dtype=float)
+        scores[known] = table.scores[rows[known]]
+        shap_values[known] = table.shap_values[rows[known]]
+        if not known.all():
+            unseen = X[~known]
+            scores[~known] = np.clip(self.investment_model.predict(unseen), 0, 100).astype(int)
+            shap_values[~known] = self.get_shap_explainer().shap_values(unseen)
+        return scores, shap_values
+    
     def _extract_features_from_address(self, address: str) -> List[float]:
         """Extract features for price prediction from address"""
         # Simulate feature extraction based on address
@@ -358,68 +685,97 @@ class MLService:
         """Extract features for investment analysis"""
         # Generate realistic investment features
         if any(city in address.lower() for city in ['beverly hills', '90210', 'malibu']):
-            return [35, 3.2, 15, 0.8, 1.5, 2.0, 120000, 200, 0.12]
+            return INVESTMENT_PROFILES['luxury']
         elif any(city in address.lower() for city in ['riverside', 'inland empire']):
-            return [22, 6.8, 25, 2.8, 3.5, 4.5, 65000, 800, 0.18]
+            return INVESTMENT_PROFILES['inland_empire']
         else:
-            return [28, 5.5, 20, 1.8, 2.2, 3.5, 75000, 450, 0.15]
+            return INVESTMENT_PROFILES['default']
     
-    def _generate_forecast_chart_data(self, base_pred: float, lower: float, upper: float, features: List[float]) -> List[Dict]:
-        """Generate chart data for forecast visualization"""
-        data = []
-        current_price = 650000  # Base price
-        
-        # Historical data (6 months)
-        for i in range(-6, 0):
-            date = (datetime.now() + timedelta(days=i*30)).strftime('%Y-%m-%d')
-            price_variation = np.random.normal(0, 2)
-            historical_price = current_price * (1 + price_variation/100)
-            
-            data.append({
-                'date': date,
-                'historical_price': round(historical_price),
-                'predicted_price': None,
-                'upper_bound': None,
-                'lower_bound': None
-            })
+    def _generate_forecast_chart_data(self, base_pred: float, lower: float, upper: float, current_price: float,
+                                      history: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                                      series: Optional[int] = None, horizon_months: int = 12,
+                                      granularity: str = "monthly") -> Dict[str, Any]:
+        """Generate columnar chart data (NumPy arrays) for forecast visualization"""
+        today = date.today()
+        dates, offsets, n_history = _chart_date_index(today, horizon_months, granularity)
+        
+        # Historical data: the market's price path, rescaled to end at the property's current price
+        if history is not None:
+            history_days, history_prices = history
+            path = np.interp(dates[:n_history].astype(np.int64), history_days, history_prices)
+            historical = current_price * path / path[-1]
+        else:
+            historical = np.full(n_history, float(current_price))
+        
+        # Forecast data: the market's fitted trend and seasonal path when it has one,
+        # otherwise progressive change at the predicted annual rate
+        progress = offsets[n_history:] / 12.0
+        if series is not None:
+            origin = np.datetime64(today, 'M').astype(np.int64)
+            predicted = current_price * np.exp(self.series_model.log_ratios(offsets[n_history:], origin, rows=series)[0])
+        else:
+            predicted = current_price * (1 + base_pred * progress / 100)
         
-        # Forecast data (12 months)
-        for i in range(0, 12):
-            date = (datetime.now() + timedelta(days=i*30)).strftime('%Y-%m-%d')
-            
-            # Progressive change over time
-            progress = i / 12.0
-            predicted_change = base_pred * progress
-            predicted_price = current_price * (1 + predicted_change/100)
-            
-            # Widening confidence intervals
-            ci_width = (upper - lower) * (0.5 + progress * 0.5)
-            upper_bound = predicted_price + ci_width * current_price / 100
-            lower_bound = predicted_price - ci_width * current_price / 100
-            
-            data.append({
-                'date': date,
-                'historical_price': None,
-                'predicted_price': round(predicted_price),
-                'upper_bound': round(upper_bound),
-                'lower_bound': round(lower_bound)
-            })
+        # Widening confidence intervals, plus the series' month-to-month noise
+        ci_width = (upper - lower) * (0.5 + progress * 0.5) * current_price / 100
+        if series is not None:
+            ci_width = ci_width + predicted * 1.2816 * self.series_model.sigma[series]
         
-        return data
-    
-    def _get_location_info(self, address: str) -> Tuple[str, float]:
-        """Extract county and current price from address"""
-        # Simulate location lookup
-        if 'los angeles' in address.lower() or '90210' in address:
-            return "Los Angeles County", 850000
-        elif 'san diego' in address.lower():
-            return "San Diego County", 720000
-        elif 'orange' in address.lower():
-            return "Orange County", 950000
-        elif 'riverside' in address.lower():
-            return "Riverside County", 520000
-        else:
-            return "Los Angeles County", 650000  # Default
+        return {
+            'dates': np.datetime_as_string(dates, unit='D').tolist(),
+            'historical': np.rint(historical).astype(np.int64),
+            'predicted': np.rint(predicted).astype(np.int64),
+            'lower': np.rint(predicted - ci_width).astype(np.int64),
+            'upper': np.rint(predicted + ci_width).astype(np.int64)
+        }
+    
+    def _chart_columns_to_rows(self, columns: Dict[str, Any]) -> List[Dict]:
+        """Expand columnar chart data into per-point rows with nulls for missing series"""
+        n_history = len(columns['historical'])
+        dates = columns['dates']
+        
+        rows = [
+            {'date': d, 'historical_price': price, 'predicted_price': None, 'upper_bound': None, 'lower_bound': None}
+            for d, price in zip(dates[:n_history], columns['historical'].tolist())
+        ]
+        rows.extend(
+            {'date': d, 'historical_price': None, 'predicted_price': price, 'upper_bound': up, 'lower_bound': low}
+            for d, price, up, low in zip(dates[n_history:], columns['predicted'].tolist(),
+                                         columns['upper'].tolist(), columns['lower'].tolist())
+        )
+        return rows
+    
+    def _get_price_history(self, county: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Monthly median price history for a county as (epoch days, prices) arrays"""
+        self._ensure_market_index()
+        history = self._price_history
+        if county not in history:
+            # Only this county's rows are read; Parquet skips the other row groups
+            prices = read_dataset('prices', columns=['date', 'median_price'],
+                                  filters=[('county', '=', county)]).sort_values('date')
+            history[county] = (
+                prices['date'].to_numpy().astype('datetime64[D]').astype(np.int64),
+                prices['median_price'].to_numpy(dtype=float)
+            ) if len(prices) else None
+        return history[county]
+    
+    def _get_series_row(self, county: str) -> Optional[int]:
+        """Row of a county's fitted trend/seasonal model, if it has enough history"""
+        self._ensure_market_index()
+        return self.series_model.row(county)
+    
+    def _get_location_info(self, address: str, places: Optional[PrefixIndex] = None) -> Tuple[str, float]:
+        """
+        Extract county and current price from address.
+
+        Counties are resolved with the autocomplete place index, so every
+        suggested value maps to the county it was suggested for.
+        """
+        if places is None:
+            self._ensure_market_index()
+            places = place_index.get()
+        county = places.resolve(address) or DEFAULT_COUNTY
+        return county, self._home_prices.get(county, DEFAULT_PRICE)
     
     def _determine_market_type(self, features: List[float]) -> str:
         """Determine market type based on features"""
@@ -582,3 +938,59 @@ class MLService:
             'market_volatility': 'Market Volatility'
         }
         return name_mapping.get(feature_name, feature_name.replace('_', ' ').title())
+
+
+_ml_service = None
+_ml_service_lock = threading.Lock()
+_ml_service_ready = threading.Event()
+
+def get_ml_service() -> MLService:
+    """Return the shared MLService, loading models on first use"""
+    global _ml_service
+    if _ml_service is None:
+        with _ml_service_lock:
+            if _ml_service is None:
+                started = time.perf_counter()
+                _ml_service = MLService()
+                startup_timer.record("ml_service_init", time.perf_counter() - started)
+    return _ml_service
+
+def loaded_ml_service() -> Optional[MLService]:
+    """The shared service if it has been created, without loading models"""
+    return _ml_service
+
+def swap_ml_service(service: MLService) -> Optional[MLService]:
+    """
+    Atomically replace the shared service and return the previous one.
+
+    Requests resolve the service once (via get_ml_service) and keep that
+    reference, so in-flight requests finish on the old models.
+    """
+    global _ml_service
+    with _ml_service_lock:
+        previous, _ml_service = _ml_service, service
+    return previous
+
+def warm_up_ml_service(retry_delay: float = 5.0, max_retry_delay: float = 60.0):
+    """
+    Load models and run warm-up inference, retrying until it succeeds.
+
+    Only a completed warm-up marks the service ready: loaded models alone
+    would still build the SHAP explainer and market index on a live request.
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            service = get_ml_service()
+            with startup_timer.phase("ml_warm_up"):
+                service.warm_up()
+            _ml_service_ready.set()
+            logger.info("ML service warm and ready")
+            return
+        except Exception as e:
+            logger.error(f"ML service warm-up failed (attempt {attempt}): {e}")
+            time.sleep(min(retry_delay * attempt, max_retry_delay))
+
+def is_ml_service_ready() -> bool:
+    return _ml_service_ready.is_set()
@@ -0,0 +1,127 @@
+# ===== BACKEND/APP/SERVICES/MODEL_REGISTRY.PY =====
+# Model artifacts are stored per version under {MODEL_PATH}versions/<version>/
+# and a CURRENT file names the version workers should serve. Version
+# directories are written once and never modified, so a worker can load one
+# while another version is being trained or promoted.
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from ..core.config import settings
+
+logger = logging.getLogger(__name__)
+
+MODEL_FILES = ["price_model.joblib", "investment_model.joblib", "scaler.joblib"]
+
+POINTER_FILE = "CURRENT"
+
+def versions_path() -> str:
+    return f"{settings.MODEL_PATH}versions/"
+
+def version_path(version: str) -> str:
+    return f"{versions_path()}{version}/"
+
+def _is_complete(path: str) -> bool:
+    return all(os.path.exists(f"{path}{name}") for name in MODEL_FILES)
+
+def list_versions() -> List[str]:
+    """Complete artifact versions on disk, oldest first"""
+    if not os.path.isdir(versions_path()):
+        return []
+    return sorted(
+        name for name in os.listdir(versions_path())
+        if not name.startswith(".") and _is_complete(version_path(name))
+    )
+
+def version_exists(version: str) -> bool:
+    # Version names are directory names; reject anything that could escape versions/
+    return os.path.basename(version) == version and _is_complete(version_path(version))
+
+def current_version() -> Optional[str]:
+    """The promoted version named by the CURRENT pointer, if it exists"""
+    try:
+        with open(f"{settings.MODEL_PATH}{POINTER_FILE}") as f:
+            version = f.read().strip()
+    except FileNotFoundError:
+        return None
+    return version if version and version_exists(version) else None
+
+def pointer_mtime() -> int:
+    """Modification time of the CURRENT pointer (0 if missing), for cheap change polling"""
+    try:
+        return os.stat(f"{settings.MODEL_PATH}{POINTER_FILE}").st_mtime_ns
+    except FileNotFoundError:
+        return 0
+
+def save_version(artifacts: Dict[str, Any], version: str = None) -> str:
+    """Write a new artifact version; it becomes visible only once complete"""
+    import joblib
+
+    version = version or f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:6]}"
+    os.makedirs(versions_path(), exist_ok=True)
+    tmp_path = f"{versions_path()}.{version}.{os.getpid()}.tmp/"
+    os.makedirs(tmp_path)
+    for name in MODEL_FILES:
+        joblib.dump(artifacts[name], f"{tmp_path}{name}")
+    os.replace(tmp_path, version_path(version))
+    logger.info(f"Saved model version {version}")
+    return version
+
+def promote(version: str):
+    """Atomically point CURRENT at version; watching workers pick it up"""
+    if not version_exists(version):
+        raise ValueError(f"Unknown model version: {version}")
+    pointer = f"{settings.MODEL_PATH}{POINTER_FILE}"
+    tmp_pointer = f"{pointer}.{os.getpid()}.tmp"
+    with open(tmp_pointer, "w") as f:
+        f.write(version)
+    os.replace(tmp_pointer, pointer)
+    logger.info(f"Promoted model version {version}")
+
+def import_legacy_artifacts() -> Optional[str]:
+    """Adopt artifacts from the old flat layout ({MODEL_PATH}*.joblib) as a version"""
+    if not _is_complete(settings.MODEL_PATH):
+        return None
+
+    # Name the version by content so concurrent workers import the same one
+    digest = hashlib.sha1()
+    for name in MODEL_FILES:
+        with open(f"{settings.MODEL_PATH}{name}", "rb") as f:
+            digest.update(f.read())
+    version = f"legacy-{digest.hexdigest()[:12]}"
+
+    if not version_exists(version):
+        os.makedirs(versions_path(), exist_ok=True)
+        tmp_path = f"{versions_path()}.{version}.{os.getpid()}.tmp/"
+        os.makedirs(tmp_path)
+        for name in MODEL_FILES:
+            shutil.copy2(f"{settings.MODEL_PATH}{name}", f"{tmp_path}{name}")
+        try:
+            os.replace(tmp_path, version_path(version))
+        except OSError:
+            # Another worker published the same version first
+            shutil.rmtree(tmp_path, ignore_errors=True)
+    promote(version)
+    return version
+
+def load_hyperparameters() -> Dict[str, Dict[str, Any]]:
+    """Tuned estimator parameters per model ({} until tuning has run)"""
+    try:
+        with open(settings.HYPERPARAMETERS_PATH) as f:
+            selection = json.load(f)
+    except FileNotFoundError:
+        return {}
+    return {name: model['params'] for name, model in selection.get('models', {}).items()}
+
+def save_hyperparameters(selection: Dict[str, Any]):
+    """Persist a tuning result; train_models picks it up on the next training run"""
+    path = settings.HYPERPARAMETERS_PATH
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(selection, f, indent=2, default=str)
+    os.replace(tmp_path, path)
@@ -0,0 +1,164 @@
+# ===== BACKEND/APP/SERVICES/MODEL_RELOAD.PY =====
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+import logging
+import threading
+import time
+import numpy as np
+from . import model_registry
+from .ml_service import MLService, get_ml_service, loaded_ml_service, swap_ml_service
+from ..core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Addresses timed during shadow scoring (one per feature profile the service recognizes)
+SHADOW_ADDRESSES = [
+    "Beverly Hills, CA 90210",
+    "Downtown Los Angeles, CA",
+    "San Diego, CA",
+    "Orange, CA",
+    "Riverside, CA",
+    "Sacramento, CA"
+]
+
+def _diff_stats(current: np.ndarray, candidate: np.ndarray) -> Dict[str, float]:
+    diff = np.abs(np.asarray(candidate, dtype=float) - np.asarray(current, dtype=float))
+    return {'mean_abs_diff': round(float(diff.mean()), 4), 'max_abs_diff': round(float(diff.max()), 4)}
+
+def _time_service(service: MLService, addresses: List[str]) -> Dict[str, float]:
+    """Mean per-request latency (ms) of the forecast and investment paths"""
+    latency = {}
+    for name, predict in (("forecast", service.predict_price_forecast),
+                          ("investment", service.predict_investment_score)):
+        started = time.perf_counter()
+        for address in addresses:
+            predict(address)
+        latency[name] = round((time.perf_counter() - started) * 1000 / len(addresses), 3)
+    return latency
+
+def shadow_compare(current: MLService, candidate: MLService,
+                   addresses: List[str] = SHADOW_ADDRESSES) -> Dict[str, Any]:
+    """
+    Score the same inputs with the live and candidate models.
+
+    Latency comes from the per-address forecast and investment paths;
+    output drift is measured over every market in the current data.
+    """
+    markets = current.get_market_features()
+    current_scores = current.score_markets(markets)
+    candidate_scores = candidate.score_markets(markets)
+    return {
+        'current_version': current.artifact_version,
+        'candidate_version': candidate.artifact_version,
+        'samples': len(addresses),
+        'markets': len(markets),
+        'latency_ms': {
+            'current': _time_service(current, addresses),
+            'candidate': _time_service(candidate, addresses)
+        },
+        'predicted_change': _diff_stats(current_scores['predicted_change'], candidate_scores['predicted_change']),
+        'investment_score': _diff_stats(current_scores['investment_score'], candidate_scores['investment_score']),
+        'compared_at': datetime.now(timezone.utc)
+    }
+
+class ModelReloader:
+    """
+    Loads model versions in a background thread and swaps them in.
+
+    The candidate is fully loaded and warmed before the swap, so requests
+    never wait on a cold model. Each worker swaps its own service; a
+    promotion rewrites the CURRENT pointer, which the other workers'
+    watchers pick up.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = None
+        self.status: Dict[str, Any] = {'state': 'idle'}
+        self.last_shadow_report: Optional[Dict[str, Any]] = None
+
+    def is_busy(self) -> bool:
+        return self.status['state'] in ('loading', 'shadowing')
+
+    def start(self, version: Optional[str] = None, shadow: bool = False) -> bool:
+        """Begin a background reload; returns False if one is already running"""
+        with self._lock:
+            if self.is_busy():
+                return False
+            self.status = {
+                'state': 'shadowing' if shadow else 'loading',
+                'version': version,
+                'started_at': datetime.now(timezone.utc)
+            }
+        threading.Thread(target=self._run, args=(version, shadow), name="model-reload", daemon=True).start()
+        return True
+
+    def _run(self, version: Optional[str], shadow: bool):
+        try:
+            result = self.reload(version, shadow=shadow)
+            status = {'state': 'shadowed' if shadow else 'swapped', **result}
+        except Exception as e:
+            logger.error(f"Model reload of {version or 'current version'} failed: {e}")
+            metrics.increment("model_reload_failures_total")
+            status = {'state': 'failed', 'version': version, 'error': str(e)}
+        with self._lock:
+            self.status = {**status, 'started_at': self.status.get('started_at'),
+                           'finished_at': datetime.now(timezone.utc)}
+
+    def reload(self, version: Optional[str] = None, shadow: bool = False) -> Dict[str, Any]:
+        """Load and warm a version, then shadow-compare it or swap it in (blocking)"""
+        version = version or model_registry.current_version()
+        if version is None:
+            raise ValueError("No promoted model version to load")
+
+        started = time.perf_counter()
+        candidate = MLService(version)
+        candidate.warm_up()
+        load_seconds = round(time.perf_counter() - started, 3)
+
+        if shadow:
+            self.last_shadow_report = shadow_compare(get_ml_service(), candidate)
+            logger.info(f"Shadow-scored model version {version}: {self.last_shadow_report}")
+            return {'version': version, 'load_seconds': load_seconds, 'report': self.last_shadow_report}
+
+        if version != model_registry.current_version():
+            model_registry.promote(version)
+        previous = swap_ml_service(candidate)
+        metrics.increment("model_reloads_total")
+        logger.info(f"Swapped model version {previous.artifact_version if previous else None} -> {version}")
+        return {
+            'version': version,
+            'previous_version': previous.artifact_version if previous else None,
+            'load_seconds': load_seconds
+        }
+
+    def start_watcher(self, interval: float):
+        """Poll the CURRENT pointer and reload when another process promotes a version"""
+        if interval <= 0 or self._watcher is not None:
+            return
+        self._watcher = threading.Thread(target=self._watch, args=(interval,), name="model-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop_watcher(self):
+        self._stop.set()
+
+    def _watch(self, interval: float):
+        last_mtime = model_registry.pointer_mtime()
+        while not self._stop.wait(interval):
+            mtime = model_registry.pointer_mtime()
+            # Only a started reload consumes the change; if one was already running, retry next tick
+            if mtime != last_mtime and self.reload_promoted():
+                last_mtime = mtime
+
+    def reload_promoted(self) -> bool:
+        """Start loading the promoted version unless it is already served; False if a reload is busy"""
+        version = model_registry.current_version()
+        service = loaded_ml_service()
+        # Nothing loaded yet: the first get_ml_service() reads CURRENT anyway
+        if not version or service is None or version == service.artifact_version:
+            return True
+        logger.info(f"Promoted model version changed to {version}, reloading")
+        return self.start(version)
+
+model_reloader = ModelReloader()
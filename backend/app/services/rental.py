@@ -0,0 +1,148 @@
+# ===== BACKEND/APP/SERVICES/RENTAL.PY =====
+from typing import Callable, Dict, List, Mapping
+import numpy as np
+
+# Assumed closing costs, as a percent of the purchase price
+CLOSING_COST_PERCENT = 3.0
+
+# Inputs of the rental calculator (fields of RentalCalculationRequest)
+RENTAL_FIELDS = [
+    'purchase_price', 'down_payment_percent', 'interest_rate', 'loan_term_years', 'monthly_rent',
+    'property_tax_percent', 'annual_insurance', 'maintenance_percent', 'vacancy_percent',
+    'management_fee_percent', 'capex_percent', 'appreciation_percent'
+]
+
+# Bisection halves the bracket each step; 60 steps resolve any bracket below float precision
+SOLVER_ITERATIONS = 60
+# Search bounds for the maximum purchase price (searched in log space)
+MIN_PRICE = 1e3
+MAX_PRICE = 1e9
+
+def scenario_arrays(scenarios: List[Mapping[str, float]]) -> Dict[str, np.ndarray]:
+    """Stack calculator inputs into one float array per field"""
+    return {name: np.array([s[name] for s in scenarios], dtype=float) for name in RENTAL_FIELDS}
+
+def monthly_mortgage(loan_amount, interest_rate, loan_term_years):
+    """Fixed-rate monthly payment (straight-line when the rate is zero)"""
+    monthly_rate = np.asarray(interest_rate, dtype=float) / 100 / 12
+    num_payments = np.asarray(loan_term_years, dtype=float) * 12
+    growth = (1 + monthly_rate) ** num_payments
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = np.where(monthly_rate > 0, monthly_rate * growth / (growth - 1), 1 / num_payments)
+    return loan_amount * factor
+
+def rental_returns(s: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Cap rate, cash flow and returns for arrays of scenarios.
+
+    Every input may be a scalar or an array; arrays broadcast against each
+    other, so one call evaluates a whole grid of scenarios.
+    """
+    purchase_price = np.asarray(s['purchase_price'], dtype=float)
+    down_payment_amount = purchase_price * (s['down_payment_percent'] / 100)
+    loan_amount = purchase_price - down_payment_amount
+    mortgage = monthly_mortgage(loan_amount, s['interest_rate'], s['loan_term_years'])
+
+    # Monthly expenses
+    monthly_property_tax = (purchase_price * s['property_tax_percent'] / 100) / 12
+    monthly_insurance = s['annual_insurance'] / 12
+    monthly_maintenance = (purchase_price * s['maintenance_percent'] / 100) / 12
+    monthly_capex = (purchase_price * s['capex_percent'] / 100) / 12
+
+    # Effective rental income (after vacancy)
+    effective_monthly_rent = s['monthly_rent'] * (1 - s['vacancy_percent'] / 100)
+    monthly_management_fee = effective_monthly_rent * (s['management_fee_percent'] / 100)
+
+    # Net operating income and cash flow
+    monthly_operating_expenses = (monthly_property_tax + monthly_insurance +
+                                  monthly_maintenance + monthly_capex + monthly_management_fee)
+    monthly_noi = effective_monthly_rent - monthly_operating_expenses
+    monthly_cash_flow = monthly_noi - mortgage
+
+    # Cash invested and returns
+    total_cash_invested = down_payment_amount + purchase_price * CLOSING_COST_PERCENT / 100
+    annual_appreciation = purchase_price * (s['appreciation_percent'] / 100)
+    return {
+        'cap_rate': monthly_noi * 12 / purchase_price * 100,
+        'cash_on_cash_return': monthly_cash_flow * 12 / total_cash_invested * 100,
+        'monthly_cash_flow': monthly_cash_flow,
+        'annual_cash_flow': monthly_cash_flow * 12,
+        'total_return_percent': (monthly_cash_flow * 12 + annual_appreciation) / total_cash_invested * 100,
+        'noi': monthly_noi * 12,
+        'total_cash_invested': total_cash_invested
+    }
+
+def _bisect(fn: Callable[[np.ndarray], np.ndarray], lo: np.ndarray, hi: np.ndarray, target,
+            log_space: bool = False) -> np.ndarray:
+    """
+    Vectorized bisection for fn(x) == target, one root per element.
+
+    fn must be monotone between the bounds with fn(lo) <= target <= fn(hi);
+    lo may be the larger bound. Returns the end of the final bracket on the
+    hi side (where fn >= target), or NaN where the bounds miss the target.
+    """
+    lo, hi, target = np.broadcast_arrays(np.asarray(lo, dtype=float), np.asarray(hi, dtype=float), target)
+    lo, hi = lo.copy(), hi.copy()
+    feasible = (fn(lo) <= target) & (fn(hi) >= target)
+    for _ in range(SOLVER_ITERATIONS):
+        mid = np.sqrt(lo * hi) if log_space else (lo + hi) / 2
+        below = fn(mid) < target
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    return np.where(feasible, hi, np.nan)
+
+def solve_rental_targets(s: Mapping[str, np.ndarray], target_cash_on_cash: np.ndarray,
+                         target_monthly_cash_flow: float = 0.0) -> Dict[str, np.ndarray]:
+    """
+    Solve the calculator backwards for n scenarios and m cash-on-cash targets at once.
+
+    Returns break_even_rent (n,), the rent at which monthly cash flow
+    reaches target_monthly_cash_flow, and (n, m) arrays of the highest
+    purchase price and the lowest down payment percent that still reach
+    each target. NaN marks targets no price or down payment can meet;
+    an infinite price means every price meets the target.
+    """
+    scenarios = {name: np.asarray(values, dtype=float)[:, None] for name, values in s.items()}
+    targets = np.asarray(target_cash_on_cash, dtype=float)[None, :]
+    n = len(s['purchase_price'])
+
+    # Cash flow rises with rent; grow the upper bracket until it covers the target
+    def cash_flow_at_rent(rent):
+        return rental_returns({**scenarios, 'monthly_rent': rent})['monthly_cash_flow']
+
+    rent_hi = np.maximum(scenarios['purchase_price'] * 0.05, 1.0)
+    for _ in range(20):
+        short = cash_flow_at_rent(rent_hi) < target_monthly_cash_flow
+        if not short.any():
+            break
+        rent_hi = np.where(short, rent_hi * 4, rent_hi)
+    no_rent = np.zeros((n, 1))
+    break_even_rent = _bisect(cash_flow_at_rent, no_rent, rent_hi, target_monthly_cash_flow)[:, 0]
+    # A negative target can already be met without any rent
+    break_even_rent = np.where(cash_flow_at_rent(no_rent)[:, 0] >= target_monthly_cash_flow, 0.0, break_even_rent)
+
+    # Cash-on-cash falls as the price rises (rent and insurance stay fixed), so
+    # bisect from the expensive end and keep the side that meets the target
+    def coc_at_price(price):
+        return rental_returns({**scenarios, 'purchase_price': price})['cash_on_cash_return']
+
+    cheapest, dearest = np.full((n, 1), MIN_PRICE), np.full((n, 1), MAX_PRICE)
+    max_price = _bisect(coc_at_price, dearest, cheapest, targets, log_space=True)
+    # Still meeting the target at the search bound means no price is too high (e.g. rent
+    # that cannot cover insurance against a negative target): unbounded, not MAX_PRICE
+    max_price = np.where(coc_at_price(dearest) >= targets, np.inf, max_price)
+
+    # Cash-on-cash is monotone in the down payment, in a direction that depends on
+    # whether the loan costs more or less than the property earns
+    def coc_at_down(percent):
+        return rental_returns({**scenarios, 'down_payment_percent': percent})['cash_on_cash_return']
+
+    zero, full = np.zeros((n, 1)), np.full((n, 1), 100.0)
+    min_down = _bisect(coc_at_down, zero, full, targets)
+    min_down = np.where(coc_at_down(zero) >= targets, 0.0, min_down)
+
+    return {
+        'break_even_rent': break_even_rent,
+        'max_purchase_price': np.broadcast_to(max_price, (n, targets.shape[1])),
+        'min_down_payment_percent': np.broadcast_to(min_down, (n, targets.shape[1]))
+    }
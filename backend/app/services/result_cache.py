@@ -0,0 +1,172 @@
+# ===== BACKEND/APP/SERVICES/RESULT_CACHE.PY =====
+from typing import Any, Callable, Dict, Optional
+import logging
+import os
+import sqlite3
+import threading
+import time
+import orjson
+from ..core.config import settings
+from ..core.metrics import metrics
+from ..core.responses import dumps
+
+logger = logging.getLogger(__name__)
+
+# Hits only refresh accessed_at when it is older than this, to keep hot keys
+# from turning every read into a write
+TOUCH_INTERVAL_SECONDS = 60
+# Check the size bound every N writes per process
+EVICT_EVERY = 64
+# Evict down to this fraction of max_bytes, so eviction does not run on every write
+EVICT_TARGET = 0.9
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    route TEXT NOT NULL,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_accessed_at ON results (accessed_at);
+"""
+
+class ResultCache:
+    """
+    Size-bounded result cache in a local SQLite file, shared by all workers.
+
+    The database runs in WAL mode so readers in other uvicorn workers never
+    block on a writer, and entries survive restarts. Callers build keys from
+    the normalized input plus model and data versions, so a new model or
+    dataset never serves stale results; old entries age out through
+    least-recently-used eviction. Cache errors are logged and treated as
+    misses, so a broken cache only costs the recomputation.
+    """
+
+    def __init__(self, path: str, max_bytes: int, enabled: bool = True):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._local = threading.local()
+        self._writes = 0
+        self._routes = set()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections are not shared across threads; keep one per thread
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._local.connection = connection
+        return connection
+
+    def get(self, route: str, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        self._routes.add(route)
+        try:
+            connection = self._connection()
+            row = connection.execute("SELECT value, accessed_at FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                metrics.increment("result_cache_misses_total", route=route)
+                return None
+            now = time.time()
+            if now - row[1] > TOUCH_INTERVAL_SECONDS:
+                connection.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+            metrics.increment("result_cache_hits_total", route=route)
+            return orjson.loads(row[0])
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache read failed: {e}")
+            metrics.increment("result_cache_errors_total", route=route)
+            return None
+
+    def set(self, route: str, key: str, value: Any):
+        if self.enabled:
+            self._store(route, key, dumps(value))
+
+    def _store(self, route: str, key: str, payload: bytes):
+        try:
+            now = time.time()
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO results (key, route, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, route, payload, len(payload), now, now)
+            )
+            self._writes += 1
+            if self._writes % EVICT_EVERY == 0:
+                self.evict()
+        except sqlite3.Error as e:
+            logger.warning(f"Result cache write failed: {e}")
+            metrics.increment("result_cache_errors_total", route=route)
+
+    def get_or_compute(self, route: str, key: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Return the cached result for key, computing and storing it on a miss.
+
+        Results always come back as plain JSON values (lists, not arrays), so
+        callers see the same types on a hit and on a miss.
+        """
+        value = self.get(route, key)
+        if value is None:
+            payload = dumps(fn(*args, **kwargs))
+            if self.enabled:
+                self._store(route, key, payload)
+            value = orjson.loads(payload)
+        return value
+
+    def evict(self) -> int:
+        """Drop least-recently-used entries until the cache fits in max_bytes"""
+        connection = self._connection()
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        deleted = connection.execute(
+            "DELETE FROM results WHERE key IN ("
+            "  SELECT key FROM ("
+            "    SELECT key, SUM(size) OVER (ORDER BY accessed_at DESC, key) AS running FROM results"
+            "  ) WHERE running > ?"
+            ")",
+            (int(self.max_bytes * EVICT_TARGET),)
+        ).rowcount
+        metrics.increment("result_cache_evictions_total", deleted)
+        logger.info(f"Evicted {deleted} result cache entries ({total} bytes > {self.max_bytes})")
+        return deleted
+
+    def clear(self):
+        if self.enabled:
+            self._connection().execute("DELETE FROM results")
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-route hit rates for this worker plus the shared cache's size"""
+        routes = {}
+        for route in sorted(self._routes):
+            hits = metrics.get("result_cache_hits_total", route=route)
+            misses = metrics.get("result_cache_misses_total", route=route)
+            routes[route] = {
+                'hits': hits,
+                'misses': misses,
+                'hit_rate': round(hits / (hits + misses), 4) if hits + misses else None
+            }
+        stats = {'enabled': self.enabled, 'routes': routes}
+        if self.enabled:
+            try:
+                entries, size = self._connection().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+                ).fetchone()
+                stats.update({'entries': entries, 'bytes': size, 'max_bytes': self.max_bytes})
+            except sqlite3.Error as e:
+                logger.warning(f"Result cache stats failed: {e}")
+        return stats
+
+result_cache = ResultCache(
+    settings.RESULT_CACHE_PATH,
+    settings.RESULT_CACHE_MAX_MB * 1024 * 1024,
+    enabled=settings.RESULT_CACHE_ENABLED
+)
@@ -0,0 +1,120 @@
+# ===== BACKEND/APP/SERVICES/ROLLUPS.PY =====
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+from ..models.database import PriceHistory, EconomicIndicator, CountyMonthlyStats
+
+logger = logging.getLogger(__name__)
+
+def month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+def _month_expr(column, dialect: str):
+    """Truncate a timestamp column to the first day of its month"""
+    if dialect == "postgresql":
+        return func.date_trunc("month", column)
+    # SQLite stores DateTime as text; keep the same format SQLAlchemy writes
+    return func.strftime("%Y-%m-01 00:00:00.000000", column)
+
+def _median_expr(column, dialect: str):
+    if dialect == "postgresql":
+        return func.percentile_cont(0.5).within_group(column)
+    # SQLite has no ordered-set aggregates; the mean is used in local setups
+    return func.avg(column)
+
+def _insert_for(dialect: str):
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+def refresh_rollups(db: Session, months: Optional[Iterable[datetime]] = None) -> int:
+    """
+    Recompute county_monthly_stats from the raw tables.
+
+    Only the given months are re-aggregated (all months when None), so an
+    ingest that touched two months costs two months of work. Returns the
+    number of county-month rows upserted.
+    """
+    dialect = db.get_bind().dialect.name
+    insert = _insert_for(dialect)
+    month_filter = sorted({month_start(m) for m in months}) if months is not None else None
+    if month_filter == []:
+        return 0
+
+    # Price aggregates
+    price_month = _month_expr(PriceHistory.date, dialect)
+    price_stats = select(
+        PriceHistory.county_id,
+        price_month.label("month"),
+        _median_expr(PriceHistory.median_price, dialect).label("median_price"),
+        func.avg(PriceHistory.price_per_sqft).label("price_per_sqft"),
+        func.sum(PriceHistory.sales_volume).label("sales_volume"),
+        func.sum(PriceHistory.inventory).label("inventory")
+    ).where(PriceHistory.county_id.isnot(None)).group_by(PriceHistory.county_id, price_month)
+    if month_filter is not None:
+        price_stats = price_stats.where(price_month.in_(_month_params(month_filter, dialect)))
+
+    price_columns = ["median_price", "price_per_sqft", "sales_volume", "inventory"]
+    stmt = insert(CountyMonthlyStats).from_select(["county_id", "month"] + price_columns, price_stats)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["county_id", "month"],
+        set_={**{name: getattr(stmt.excluded, name) for name in price_columns}, "refreshed_at": func.now()}
+    )
+    upserted = db.execute(stmt).rowcount
+
+    # Economic indicator aggregates
+    econ_month = _month_expr(EconomicIndicator.date, dialect)
+    econ_columns = ["unemployment_rate", "employment_growth", "population_growth", "new_construction", "mortgage_rate"]
+    econ_stats = select(
+        EconomicIndicator.county_id,
+        econ_month.label("month"),
+        *[func.avg(getattr(EconomicIndicator, name)).label(name) for name in econ_columns]
+    ).where(EconomicIndicator.county_id.isnot(None)).group_by(EconomicIndicator.county_id, econ_month)
+    if month_filter is not None:
+        econ_stats = econ_stats.where(econ_month.in_(_month_params(month_filter, dialect)))
+
+    stmt = insert(CountyMonthlyStats).from_select(["county_id", "month"] + econ_columns, econ_stats)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["county_id", "month"],
+        set_={**{name: getattr(stmt.excluded, name) for name in econ_columns}, "refreshed_at": func.now()}
+    )
+    upserted += db.execute(stmt).rowcount
+
+    db.commit()
+    logger.info(f"Refreshed county-month rollups ({upserted} rows upserted)")
+    return upserted
+
+def _month_params(months: List[datetime], dialect: str) -> List[Any]:
+    if dialect == "postgresql":
+        return months
+    return [m.strftime("%Y-%m-01 00:00:00.000000") for m in months]
+
+def get_county_monthly_stats(db: Session, county_id: int, start: Optional[datetime] = None,
+                             end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Read precomputed county-month aggregates for charts and dashboards"""
+    query = db.query(CountyMonthlyStats).filter(CountyMonthlyStats.county_id == county_id)
+    if start is not None:
+        query = query.filter(CountyMonthlyStats.month >= month_start(start))
+    if end is not None:
+        query = query.filter(CountyMonthlyStats.month <= end)
+
+    return [
+        {
+            'month': row.month.strftime('%Y-%m-%d'),
+            'median_price': row.median_price,
+            'price_per_sqft': row.price_per_sqft,
+            'sales_volume': row.sales_volume,
+            'inventory': row.inventory,
+            'unemployment_rate': row.unemployment_rate,
+            'employment_growth': row.employment_growth,
+            'population_growth': row.population_growth,
+            'new_construction': row.new_construction,
+            'mortgage_rate': row.mortgage_rate,
+            'refreshed_at': row.refreshed_at
+        }
+        for row in query.order_by(CountyMonthlyStats.month).all()
+    ]
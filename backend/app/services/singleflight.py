@@ -0,0 +1,41 @@
+# ===== BACKEND/APP/SERVICES/SINGLEFLIGHT.PY =====
+from starlette.concurrency import run_in_threadpool
+from typing import Any, Callable, Dict, Hashable
+import asyncio
+from ..core.metrics import metrics
+from ..core.profiling import is_profiling, profile_thread
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one computation.
+
+    The first caller for a key starts the computation in the threadpool; callers
+    arriving while it is in flight await the same result instead of starting
+    their own. The computation runs as its own task, so a disconnecting client
+    does not cancel it for everyone else.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        if is_profiling():
+            # A profiled request computes on its own so its work is what gets sampled
+            return await run_in_threadpool(profile_thread(fn), *args, **kwargs)
+        
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(run_in_threadpool(fn, *args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+            metrics.increment("singleflight_executions_total", group=self.name)
+            metrics.set_gauge("singleflight_inflight", len(self._inflight), group=self.name)
+        else:
+            metrics.increment("singleflight_coalesced_total", group=self.name)
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Future):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        metrics.set_gauge("singleflight_inflight", len(self._inflight), group=self.name)
@@ -0,0 +1,155 @@
+# ===== BACKEND/APP/SERVICES/TIMESERIES.PY =====
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+import numpy as np
+import os
+import logging
+from ..core.config import settings
+from .market_data import read_dataset, data_mtime
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Fitted parameters are cached next to the datasets and refit when they change
+SERIES_MODEL_FILE = 'series_model.npz'
+
+# Annual seasonality as Fourier harmonics, so forecasts work at fractional (weekly) offsets
+SEASONAL_HARMONICS = 2
+# Observations carry half the weight of ones HALF_LIFE_MONTHS more recent
+HALF_LIFE_MONTHS = 24.0
+# At least a year of data before a seasonal fit is trusted
+MIN_OBSERVATIONS = 13
+# Coefficients per series: level, trend and a sin/cos pair per harmonic
+N_PARAMS = 2 + 2 * SEASONAL_HARMONICS
+
+def _design(t: np.ndarray) -> np.ndarray:
+    """Regressors [1, t, sin/cos harmonics] for month offsets t"""
+    angles = 2 * np.pi * np.outer(t, np.arange(1, SEASONAL_HARMONICS + 1)) / 12
+    return np.column_stack([np.ones_like(t), t, np.sin(angles), np.cos(angles)])
+
+def monthly_matrix(prices: "pd.DataFrame", key: str = 'county') -> Tuple[List[str], int, np.ndarray]:
+    """
+    Pivot long (key, date, median_price) rows into one row per series.
+
+    Returns (keys, first month as months since 1970-01, matrix) where the
+    matrix is (n_series, n_months) of monthly mean prices with NaN gaps.
+    """
+    keys, series = np.unique(prices[key].to_numpy().astype(str), return_inverse=True)
+    months = prices['date'].to_numpy().astype('datetime64[M]').astype(np.int64)
+    first = int(months.min()) if len(months) else 0
+    shape = (len(keys), int(months.max()) - first + 1 if len(months) else 0)
+
+    totals = np.zeros(shape)
+    counts = np.zeros(shape)
+    np.add.at(totals, (series, months - first), prices['median_price'].to_numpy(dtype=float))
+    np.add.at(counts, (series, months - first), 1)
+    with np.errstate(invalid='ignore'):
+        return keys.tolist(), first, totals / counts
+
+class SeriesModel:
+    """
+    Trend plus seasonal regression on log prices for many series at once.
+
+    Every series shares one monthly grid, so the design matrix is built once
+    and all fits are a single batched weighted least-squares solve. Missing
+    months get zero weight and recent months count more than old ones.
+    Forecasts for every series are one matrix product.
+    """
+
+    def __init__(self, keys: List[str], first_month: int, coef: np.ndarray, sigma: np.ndarray,
+                 last_month: np.ndarray):
+        self.keys = list(keys)
+        self.first_month = first_month
+        self.coef = coef
+        self.sigma = sigma
+        self.last_month = last_month
+        self._index = {key: i for i, key in enumerate(self.keys)}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def fit(cls, keys: List[str], first_month: int, Y: np.ndarray) -> "SeriesModel":
+        observed = np.isfinite(Y) & (Y > 0)
+        n_obs = observed.sum(axis=1)
+        fitted = n_obs >= MIN_OBSERVATIONS
+        if not fitted.any():
+            # Fresh or sparse data: no series has enough history yet
+            return cls([], first_month, np.zeros((0, N_PARAMS)), np.zeros(0), np.zeros(0))
+        Y, observed = Y[fitted], observed[fitted]
+
+        t = np.arange(Y.shape[1], dtype=float)
+        X = _design(t)
+        last = (Y.shape[1] - 1 - np.argmax(observed[:, ::-1], axis=1)).astype(float)
+        W = observed * 0.5 ** ((last[:, None] - t) / HALF_LIFE_MONTHS)
+        logY = np.log(np.where(observed, Y, 1.0))
+
+        # Normal equations for every series: (X' W X) b = X' W y
+        XtWX = np.einsum('tk,st,tl->skl', X, W, X)
+        XtWy = np.einsum('tk,st->sk', X, W * logY)
+        coef = np.linalg.solve(XtWX + 1e-9 * np.eye(X.shape[1]), XtWy[..., None])[..., 0]
+
+        residuals = np.where(observed, logY - coef @ X.T, 0.0)
+        dof = np.maximum(observed.sum(axis=1) - X.shape[1], 1)
+        sigma = np.sqrt((residuals ** 2).sum(axis=1) / dof)
+
+        kept = [key for key, keep in zip(keys, fitted) if keep]
+        return cls(kept, first_month, coef, sigma, first_month + last)
+
+    def row(self, key: str) -> Optional[int]:
+        return self._index.get(key)
+
+    def log_ratios(self, offsets: np.ndarray, origin: Optional[float] = None,
+                   seasonal_only: bool = False, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        (n_series, len(offsets)) log price change from origin to origin + offsets.
+
+        origin is in months since 1970-01 (default: each series' last
+        observation). seasonal_only drops the trend, leaving the seasonal
+        swing around it. rows restricts the result to those series.
+        """
+        rows = np.arange(len(self)) if rows is None else np.atleast_1d(rows)
+        base = self.last_month[rows] if origin is None else np.full(len(rows), float(origin))
+        coef = self.coef[rows]
+        if seasonal_only:
+            coef[:, :2] = 0.0
+
+        def level(t: np.ndarray) -> np.ndarray:
+            # Each series has its own origin, so the regressors are built per (series, offset)
+            X = _design(t.ravel()).reshape(*t.shape, N_PARAMS)
+            return np.einsum('stk,sk->st', X, coef)
+
+        start = (base - self.first_month)[:, None]
+        return level(start + np.asarray(offsets, dtype=float)[None, :]) - level(start)
+
+    def forecast_change(self, months: float = 12.0, origin: Optional[float] = None) -> Dict[str, float]:
+        """Percent price change over the next months for every series"""
+        change = np.expm1(self.log_ratios(np.array([months]), origin)[:, 0]) * 100
+        return dict(zip(self.keys, change.tolist()))
+
+    def save(self, path: str):
+        # Write to a temp file and rename so concurrent readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, keys=np.array(self.keys, dtype=str), first_month=self.first_month,
+                     coef=self.coef, sigma=self.sigma, last_month=self.last_month)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SeriesModel":
+        with np.load(path) as data:
+            return cls(data['keys'].tolist(), int(data['first_month']), data['coef'], data['sigma'],
+                       data['last_month'])
+
+def load_series_model() -> SeriesModel:
+    """Fitted series parameters, from the cache file when it is newer than the data"""
+    path = f"{settings.DATA_PATH}{SERIES_MODEL_FILE}"
+    if os.path.exists(path) and os.path.getmtime(path) >= data_mtime():
+        return SeriesModel.load(path)
+
+    prices = read_dataset('prices', columns=['county', 'date', 'median_price'])
+    model = SeriesModel.fit(*monthly_matrix(prices))
+    model.save(path)
+    logger.info(f"Fitted seasonal models for {len(model)} price series")
+    return model
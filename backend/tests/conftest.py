@@ -0,0 +1,23 @@
+import threading
+import pytest
+from app.core.config import settings
+from app.services.jobs import job_store
+from app.services.result_cache import result_cache
+
+@pytest.fixture(autouse=True, scope="session")
+def isolated_data(tmp_path_factory):
+    """Write seeded datasets, trained models and tuning results to a per-session directory instead of the source tree"""
+    root = tmp_path_factory.mktemp("state")
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(settings, "DATA_PATH", f"{root}/data/")
+        patch.setattr(settings, "MODEL_PATH", f"{root}/models/")
+        patch.setattr(settings, "HYPERPARAMETERS_PATH", f"{root}/hyperparameters.json")
+        yield
+
+@pytest.fixture(autouse=True)
+def isolated_stores(tmp_path, monkeypatch):
+    """Point the shared result cache and job store at per-test files instead of ./cache"""
+    for store, name in ((result_cache, "results.sqlite3"), (job_store, "jobs.sqlite3")):
+        monkeypatch.setattr(store, "path", str(tmp_path / "cache" / name))
+        # Connections are cached per thread; start fresh ones on the new path
+        monkeypatch.setattr(store, "_local", threading.local())
@@ -1,5 +1,6 @@
 # ===== BACKEND/TESTS/TEST_API.PY =====
 import pytest
+import threading
 from fastapi.testclient import TestClient
 from app.main import app
 
@@ -73,3 +74,196 @@ def test_invalid_address():
 def test_empty_investment_request():
     response = client.post("/api/v1/investment/score", json={"address": ""})
     assert response.status_code == 400
+
+def test_orjson_response_serializes_numpy():
+    import numpy as np
+    from app.core.responses import ORJSONResponse
+
+    response = ORJSONResponse({"values": np.array([1.5, 2.5]), "score": np.float64(3.0)})
+    assert response.body == b'{"values":[1.5,2.5],"score":3.0}'
+
+def test_price_forecast_columnar():
+    response = client.get("/api/v1/forecast/90210?format=columnar")
+    assert response.status_code == 200
+    chart = response.json()["chart_data"]
+    assert set(chart) == {"dates", "historical", "predicted", "lower", "upper"}
+    assert len(chart["dates"]) == len(chart["historical"]) + len(chart["predicted"])
+    assert None not in chart["predicted"]
+
+def test_price_forecast_horizon():
+    response = client.get("/api/v1/forecast/90210?format=columnar&horizon_months=36&granularity=weekly")
+    assert response.status_code == 200
+    assert len(response.json()["chart_data"]["predicted"]) == 156
+    
+    assert client.get("/api/v1/forecast/90210?horizon_months=61").status_code == 422
+
+def test_large_response_is_compressed():
+    response = client.get("/api/v1/forecast/90210", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+
+def test_top_areas_conditional_get():
+    response = client.get("/api/v1/areas/top")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "last-modified" in response.headers
+    
+    cached = client.get("/api/v1/areas/top", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+def test_forecast_etag_is_stable():
+    first = client.get("/api/v1/forecast/90210")
+    second = client.get("/api/v1/forecast/90210")
+    assert first.headers["etag"] == second.headers["etag"]
+    assert first.json() == second.json()
+    
+    cached = client.get("/api/v1/forecast/90210", headers={"If-None-Match": first.headers["etag"]})
+    assert cached.status_code == 304
+    
+    # Same forecast, but the body echoes a different address, so the ETag differs
+    respelled = client.get("/api/v1/forecast/90210 ", headers={"If-None-Match": first.headers["etag"]})
+    assert respelled.status_code == 200
+    assert respelled.json()["address"] == "90210 "
+
+def test_forecast_validators_pick_up_new_data():
+    from app.services.ml_service import get_ml_service
+    
+    current = client.get("/api/v1/forecast/90210")
+    # The body changes daily, so only the ETag validates it
+    assert "last-modified" not in current.headers
+    
+    # Simulate data files replaced since the index was built: the ETag must follow the new data
+    service = get_ml_service()
+    service.data_version, service._market_mtime = "stale", None
+    refreshed = client.get("/api/v1/forecast/90210", headers={"If-None-Match": current.headers["etag"]})
+    assert service.data_version != "stale"
+    assert refreshed.status_code == 304
+
+def test_startup_report():
+    response = client.get("/health/startup")
+    assert response.status_code == 200
+    assert "import_app" in response.json()["phases"]
+
+def test_liveness_and_readiness():
+    from app.services.ml_service import warm_up_ml_service
+    
+    assert client.get("/health/live").status_code == 200
+    
+    warm_up_ml_service()
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+def test_lazy_load_does_not_mark_service_ready(monkeypatch):
+    from app.services import ml_service
+    
+    monkeypatch.setattr(ml_service, "_ml_service", None)
+    monkeypatch.setattr(ml_service, "_ml_service_ready", threading.Event())
+    assert client.get("/health/ready").status_code == 503
+    
+    # Loaded but not warmed: the explainer and market index are still missing
+    ml_service.get_ml_service()
+    assert client.get("/health/ready").status_code == 503
+    
+    ml_service.warm_up_ml_service()
+    assert client.get("/health/ready").status_code == 200
+
+def test_warm_up_retries_until_it_succeeds(monkeypatch):
+    from app.services import ml_service
+    
+    service = ml_service.get_ml_service()
+    calls = []
+    
+    def flaky_warm_up():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RuntimeError("database not ready")
+    
+    monkeypatch.setattr(ml_service, "_ml_service_ready", threading.Event())
+    monkeypatch.setattr(service, "warm_up", flaky_warm_up)
+    ml_service.warm_up_ml_service(retry_delay=0)
+    assert len(calls) == 3
+    assert ml_service.is_ml_service_ready()
+
+def test_readiness_without_warm_up(monkeypatch):
+    from app.core.config import settings
+    from app.services import ml_service
+    
+    monkeypatch.setattr(ml_service, "_ml_service_ready", threading.Event())
+    monkeypatch.setattr(settings, "WARMUP_ON_STARTUP", False)
+    assert client.get("/health/ready").status_code == 200
+
+def test_metrics_endpoint():
+    client.post("/api/v1/investment/score", json={"address": "Riverside, CA"})
+    response = client.get("/api/v1/metrics")
+    assert response.status_code == 200
+    assert any(key.startswith("singleflight_executions_total") for key in response.json()["counters"])
+
+def test_similar_areas():
+    response = client.get("/api/v1/areas/Riverside/similar?k=3")
+    assert response.status_code == 200
+    similar = response.json()["similar"]
+    assert len(similar) == 3
+    assert all(area["county"] != "Riverside County" for area in similar)
+
+def test_similar_areas_unknown_county():
+    response = client.get("/api/v1/areas/Atlantis/similar")
+    assert response.status_code == 404
+
+def test_export_forecasts_ndjson():
+    import json
+    
+    response = client.get("/api/v1/export/forecasts?chunk_size=3")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) > 3
+    assert all(0 <= row["investment_score"] <= 100 for row in rows)
+
+def test_export_forecasts_csv():
+    response = client.get("/api/v1/export/forecasts?format=csv")
+    assert response.status_code == 200
+    assert response.text.splitlines()[0].startswith("market,current_value")
+
+def test_county_history_unknown_county():
+    response = client.get("/api/v1/areas/Atlantis/history")
+    assert response.status_code == 404
+
+def test_admin_endpoints_require_token(monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "")
+    assert client.get("/api/v1/admin/models").status_code == 403
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    assert client.get("/api/v1/admin/models", headers={"X-Admin-Token": "wrong"}).status_code == 401
+    response = client.get("/api/v1/admin/models", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    assert "available_versions" in response.json()
+
+def test_reload_unknown_model_version(monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    response = client.post("/api/v1/admin/models/reload", json={"version": "missing"},
+                           headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 404
+
+def test_profiled_request(monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "ADMIN_TOKEN", "secret")
+    # Without the admin token the flag is ignored
+    assert "x-profile-id" not in client.get("/api/v1/forecast/90210?profile=1").headers
+
+    response = client.get("/api/v1/forecast/Fresno, CA", headers={"X-Profile": "1", "X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+
+    profile = client.get(f"/api/v1/admin/profiles/{profile_id}", headers={"X-Admin-Token": "secret"}).json()
+    assert profile["path"] == "/api/v1/forecast/Fresno, CA"
+    assert profile["status"] == 200
+    collapsed = client.get(f"/api/v1/admin/profiles/{profile_id}?format=collapsed",
+                           headers={"X-Admin-Token": "secret"})
+    assert collapsed.headers["content-type"].startswith("text/plain")
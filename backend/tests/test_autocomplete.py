@@ -0,0 +1,46 @@
+from fastapi.testclient import TestClient
+from app.services.autocomplete import PrefixIndex, _places, PLACES
+
+index = PrefixIndex(_places(list(PLACES)))
+
+def _values(query, limit=8):
+    return [suggestion["value"] for suggestion in index.search(query, limit)]
+
+def test_prefixes_complete_cities_zips_and_counties():
+    assert _values("irv") == ["Irvine, Orange County, CA"]
+    assert _values("9021") == ["90210, Beverly Hills, Los Angeles County, CA"]
+    assert _values("orange") == ["Orange County, CA"]
+    # City and county of the same name are both offered once, city first
+    assert _values("Santa Clara") == ["Santa Clara, Santa Clara County, CA", "Santa Clara County, CA"]
+
+def test_limit_and_inner_word_matches():
+    assert len(index.search("san", limit=3)) == 3
+    assert all(s["label"].startswith("San") for s in index.search("san", limit=3))
+    assert "Huntington Beach, Orange County, CA" in _values("beach")
+
+def test_street_prefix_is_kept_in_values():
+    assert _values("123 Main St, Fres", limit=1) == ["123 Main St, Fresno, Fresno County, CA"]
+    assert _values("123 Main St") == []
+
+def test_autocomplete_endpoint():
+    from app.main import app
+
+    client = TestClient(app)
+    response = client.get("/api/v1/autocomplete", params={"q": "Walnut"})
+    assert response.status_code == 200
+    assert response.json()["suggestions"][0]["county"] == "Contra Costa County"
+    etag = response.headers["etag"]
+    assert client.get("/api/v1/autocomplete", params={"q": "Walnut"}, headers={"If-None-Match": etag}).status_code == 304
+    # A different spelling gets a different body, so it must not revalidate
+    assert client.get("/api/v1/autocomplete", params={"q": "walnut"}, headers={"If-None-Match": etag}).status_code == 200
+    assert client.get("/api/v1/autocomplete", params={"q": ""}).status_code == 422
+
+def test_suggested_values_resolve_to_their_county():
+    from app.services.ml_service import MLService
+
+    ml_service = MLService()
+    for place in index.places:
+        for value in (place["value"], f"12 Orange St, {place['value']}"):
+            assert index.resolve(value) == place["county"]
+            assert ml_service._get_location_info(value)[0] == place["county"]
+    assert index.resolve("somewhere else") is None
@@ -0,0 +1,30 @@
+import pyarrow.parquet as pq
+import pytest
+from app.scripts.batch_score import batch_score
+
+ADDRESSES = ["12 Main St, Fresno, CA", "90210", "1 Ocean Ave, San Diego, CA", "5 Elm St, Oakland, CA"]
+
+@pytest.fixture
+def addresses_file(tmp_path):
+    path = tmp_path / "addresses.txt"
+    path.write_text("\n".join(ADDRESSES) + "\n")
+    return str(path)
+
+def test_batch_score_writes_partitioned_parquet(addresses_file, tmp_path):
+    output = str(tmp_path / "scores")
+    reports = batch_score(addresses_file, output, workers=2, chunk_size=1, top_k=2)
+
+    assert sum(report["rows"] for report in reports) == len(ADDRESSES)
+    table = pq.read_table(output).to_pandas()
+    assert sorted(table["address"]) == sorted(ADDRESSES)
+    assert table["shap_top_features"].map(len).eq(2).all()
+
+    # Existing output is only replaced on request, and then without stale fragments
+    with pytest.raises(FileExistsError):
+        batch_score(addresses_file, output, workers=1, chunk_size=10, top_k=2)
+    batch_score(addresses_file, output, workers=1, chunk_size=10, top_k=2, overwrite=True)
+    assert len(pq.read_table(output)) == len(ADDRESSES)
+
+def test_batch_score_rejects_zero_workers(addresses_file, tmp_path):
+    with pytest.raises(ValueError, match="workers"):
+        batch_score(addresses_file, str(tmp_path / "scores"), workers=0, chunk_size=10, top_k=2)
@@ -0,0 +1,78 @@
+import pandas as pd
+import pytest
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.core.database import Base
+from app.models.database import County, PriceHistory, CountyMonthlyStats, IngestionWatermark
+from app.services import market_data
+from app.services.ingestion import ingest_file
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "DATA_PATH", f"{tmp_path}/data/")
+    monkeypatch.setattr(settings, "DATA_FORMAT", "parquet")
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([County(id=1, name="Fresno County"), County(id=2, name="Kern County")])
+    session.commit()
+    market_data.write_dataset("prices", pd.DataFrame({
+        "county": ["Fresno County"], "date": ["2024-01-01"], "median_price": [400000],
+        "price_per_sqft": [250], "sales_volume": [100], "inventory": [300]
+    }))
+    yield session
+    session.close()
+
+def _write_drop(path, rows):
+    frame = pd.DataFrame(rows, columns=["county", "date", "median_price", "price_per_sqft", "sales_volume", "inventory"])
+    if str(path).endswith(".parquet"):
+        frame.assign(date=pd.to_datetime(frame["date"])).to_parquet(path, row_group_size=2)
+    else:
+        frame.to_csv(path, index=False)
+    return str(path)
+
+@pytest.mark.parametrize("suffix", ["csv", "parquet"])
+def test_ingest_dedupes_upserts_and_refreshes(db, tmp_path, suffix):
+    path = _write_drop(tmp_path / f"drop.{suffix}", [
+        ("Fresno County", "2024-02-01", 410000, 255, 90, 310),
+        ("Fresno County", "2024-02-01", 415000, 256, 95, 305),
+        ("kern county", "2024-02-01", 300000, 200, 80, 400),
+        ("Atlantis", "2024-02-01", 1, 1, 1, 1)
+    ])
+    result = ingest_file(db, path, "prices", chunk_size=2)
+
+    assert (result["read"], result["upserted"], result["duplicates"], result["unknown_county"]) == (4, 2, 1, 1)
+    assert result["months_refreshed"] == [datetime(2024, 2, 1)]
+    # The later duplicate wins
+    assert db.query(PriceHistory.median_price).filter(PriceHistory.county_id == 1).scalar() == 415000
+    assert db.query(CountyMonthlyStats).count() == 2
+    assert db.query(IngestionWatermark).one().watermark == datetime(2024, 2, 1)
+    # The served dataset picks up the new rows
+    served = market_data.read_dataset("prices")
+    assert len(served) == 3
+    assert served.loc[served["county"] == "Fresno County", "median_price"].tolist() == [400000, 415000]
+
+def test_rerun_skips_rows_at_or_before_the_watermark(db, tmp_path):
+    first = _write_drop(tmp_path / "first.csv", [("Fresno County", "2024-02-01", 410000, 255, 90, 310)])
+    ingest_file(db, first, "prices")
+
+    second = _write_drop(tmp_path / "second.csv", [
+        ("Fresno County", "2024-02-01", 999999, 255, 90, 310),
+        ("Fresno County", "2024-03-01", 420000, 260, 92, 300)
+    ])
+    result = ingest_file(db, second, "prices")
+
+    assert (result["upserted"], result["already_ingested"]) == (1, 1)
+    assert result["months_refreshed"] == [datetime(2024, 3, 1)]
+    assert db.query(PriceHistory).count() == 2
+    assert db.query(PriceHistory.median_price).filter(PriceHistory.date == datetime(2024, 2, 1)).scalar() == 410000
+    mark = db.query(IngestionWatermark).one()
+    assert (mark.watermark, mark.rows_ingested) == (datetime(2024, 3, 1), 2)
+
+    # Nothing new: no writes, no refresh
+    assert ingest_file(db, second, "prices")["months_refreshed"] == []
+    # --full reloads everything, correcting the earlier row
+    assert ingest_file(db, second, "prices", full=True)["upserted"] == 2
+    assert db.query(PriceHistory.median_price).filter(PriceHistory.date == datetime(2024, 2, 1)).scalar() == 999999
@@ -0,0 +1,129 @@
+import pytest
+from fastapi.testclient import TestClient
+from app.services import jobs
+from app.services.jobs import JobStore, JobRunner
+
+ADDRESSES = [f"{100 + i} Main St, Fresno, CA" for i in range(7)]
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(f"{tmp_path}/jobs.sqlite3")
+
+@pytest.fixture
+def runner(store):
+    return JobRunner(store, workers=1, poll_interval=0.01, retention_seconds=3600)
+
+def test_job_runs_chunk_by_chunk(store, runner):
+    job_id = store.submit(ADDRESSES, chunk_size=3)
+    assert store.get(job_id)["status"] == "queued"
+
+    runner.run_job(*store.claim("w1"), owner="w1")
+
+    job = store.get(job_id)
+    assert (job["status"], job["processed"], job["progress"]) == ("done", 7, 1.0)
+    results = store.results(job_id)
+    assert [row["address"] for row in results] == ADDRESSES
+    assert {"county", "predicted_value", "investment_score", "shap_top_features"} <= set(results[0])
+    # Pages only read the chunks they cover
+    assert [row["address"] for row in store.results(job_id, offset=2, limit=3)] == ADDRESSES[2:5]
+
+def test_interrupted_job_resumes_from_first_unscored_chunk(store, runner, monkeypatch):
+    job_id = store.submit(ADDRESSES, chunk_size=3)
+    _, top_k = store.claim("w1")
+    chunk, addresses = next(store.pending_chunks(job_id))
+    store.complete_chunk(job_id, chunk, "w1", jobs.score_rows(addresses, top_k))
+    # The worker dies here; once its heartbeat is stale another worker takes over
+    monkeypatch.setattr(jobs, "STALE_AFTER_SECONDS", -1)
+
+    assert store.claim("w2") == (job_id, top_k)
+    assert not store.complete_chunk(job_id, 1, "w1", [])
+    runner.run_job(job_id, top_k, owner="w2")
+
+    assert store.get(job_id)["processed"] == 7
+    assert [row["address"] for row in store.results(job_id)] == ADDRESSES
+
+def test_failed_job_records_error(store, runner, monkeypatch):
+    def explode(addresses, top_k):
+        raise RuntimeError("model unavailable")
+    monkeypatch.setattr(jobs, "score_rows", explode)
+    job_id = store.submit(ADDRESSES, chunk_size=3)
+
+    runner.run_job(*store.claim("w1"), owner="w1")
+
+    job = store.get(job_id)
+    assert (job["status"], job["error"]) == ("failed", "model unavailable")
+
+def test_slow_chunks_keep_the_job_alive(store, runner, monkeypatch):
+    monkeypatch.setattr(jobs, "HEARTBEAT_INTERVAL_SECONDS", 0.01)
+    job_id = store.submit(ADDRESSES[:1], chunk_size=1)
+    claimed = store.claim("w1")
+    beats = []
+
+    def slow(addresses, top_k):
+        started = store._connection().execute("SELECT heartbeat_at FROM jobs WHERE id = ?", (job_id,)).fetchone()[0]
+        runner._stop.wait(0.1)
+        beats.append(store._connection().execute("SELECT heartbeat_at FROM jobs WHERE id = ?", (job_id,)).fetchone()[0] > started)
+        return [{"address": a} for a in addresses]
+    monkeypatch.setattr(jobs, "score_rows", slow)
+
+    runner.run_job(*claimed, owner="w1")
+    assert beats == [True]
+
+def test_worker_survives_store_errors(store, runner, monkeypatch):
+    import sqlite3
+
+    calls = []
+    def locked(owner):
+        calls.append(owner)
+        if len(calls) == 1:
+            raise RuntimeError("unexpected")
+        runner._stop.set()
+        raise sqlite3.OperationalError("database is locked")
+    monkeypatch.setattr(store, "claim", locked)
+
+    runner._run()
+    assert len(calls) == 2
+
+def test_pool_picks_up_submitted_jobs(store, runner):
+    runner.start()
+    try:
+        job_id = store.submit(ADDRESSES[:2], chunk_size=1)
+        runner.notify()
+        for _ in range(500):
+            if store.get(job_id)["status"] == "done":
+                break
+            runner._stop.wait(0.01)
+    finally:
+        runner.stop()
+    assert store.get(job_id)["status"] == "done"
+
+def test_finished_jobs_are_purged(store, runner):
+    job_id = store.submit(ADDRESSES[:1], chunk_size=1)
+    runner.run_job(*store.claim("w1"), owner="w1")
+
+    assert store.purge(older_than_seconds=3600) == 0
+    assert store.purge(older_than_seconds=-1) == 1
+    assert store.get(job_id) is None
+
+def test_job_endpoints(store, runner, monkeypatch):
+    from app.api.v1.endpoints import jobs as jobs_endpoint
+    from app.main import app
+
+    monkeypatch.setattr(jobs_endpoint, "job_store", store)
+    monkeypatch.setattr(jobs_endpoint, "job_runner", runner)
+    client = TestClient(app)
+
+    response = client.post("/api/v1/jobs", json={"addresses": ADDRESSES, "chunk_size": 4})
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+    assert client.get(f"/api/v1/jobs/{job_id}/results").status_code == 409
+
+    runner.run_job(*store.claim("w1"), owner="w1")
+
+    assert client.get(f"/api/v1/jobs/{job_id}").json()["progress"] == 1.0
+    events = client.get(f"/api/v1/jobs/{job_id}/events")
+    assert events.headers["content-type"].startswith("text/event-stream")
+    assert events.text.startswith("event: done\ndata: ")
+    results = client.get(f"/api/v1/jobs/{job_id}/results", params={"offset": 5}).json()["results"]
+    assert [row["address"] for row in results] == ADDRESSES[5:]
+    assert client.get("/api/v1/jobs/missing").status_code == 404
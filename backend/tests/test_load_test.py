@@ -0,0 +1,26 @@
+import pytest
+from app.scripts.load_test import build_plan, compare, parse_mix, summarize
+
+def test_parse_mix():
+    assert parse_mix("forecast=4,rental=1") == {"forecast": 4.0, "rental": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("unknown=1")
+
+def test_plan_is_reproducible():
+    weights = parse_mix("forecast=1,investment=1,areas=1,rental=1")
+    plan = build_plan(200, weights, address_pool=10, seed=7)
+
+    assert plan == build_plan(200, weights, address_pool=10, seed=7)
+    assert {route for route, *_ in plan} == set(weights)
+    assert all(path.startswith("/api/v1/") for _, _, path, _ in plan)
+
+def test_summarize_percentiles():
+    samples = [("forecast", 200, ms / 1000) for ms in range(1, 101)] + [("rental", 429, 0.001)]
+    report = summarize(samples, elapsed=2.0)
+
+    assert report["forecast"]["count"] == 100
+    assert report["forecast"]["p50_ms"] == pytest.approx(50.5)
+    assert report["forecast"]["p99_ms"] == pytest.approx(99.01)
+    assert report["rental"]["errors"] == 1
+    assert report["all"]["throughput_rps"] == 50.5
+    assert compare({"routes": report}, {"meta": {"git_commit": "abc"}, "routes": report})[0] == "vs abc:"
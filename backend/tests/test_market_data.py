@@ -0,0 +1,38 @@
+import pandas as pd
+import pytest
+from app.core.config import settings
+from app.services import market_data
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "DATA_PATH", f"{tmp_path}/")
+    return tmp_path
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow", "csv"])
+def test_dataset_round_trip_with_projection_and_filters(data_dir, monkeypatch, fmt):
+    monkeypatch.setattr(settings, "DATA_FORMAT", fmt)
+    frame = pd.DataFrame({
+        "county": ["Fresno County", "Fresno County", "Kern County"],
+        "date": ["2024-01-01", "2024-02-01", "2024-01-01"],
+        "median_price": [400000, 405000, 380000],
+        "inventory": [500, 520, 610]
+    })
+    market_data.write_dataset("prices", frame)
+    
+    result = market_data.read_dataset(
+        "prices", columns=["county", "median_price"], filters=[("county", "=", "Fresno County")]
+    )
+    assert list(result.columns) == ["county", "median_price"]
+    assert result["median_price"].tolist() == [400000, 405000]
+
+    # Filter columns need not be part of the projection
+    result = market_data.read_dataset("prices", columns=["median_price"], filters=[("county", "=", "Kern County")])
+    assert list(result.columns) == ["median_price"]
+    assert result["median_price"].tolist() == [380000]
+
+def test_parquet_keeps_timestamps(data_dir, monkeypatch):
+    monkeypatch.setattr(settings, "DATA_FORMAT", "parquet")
+    market_data.write_dataset("prices", pd.DataFrame({"county": ["Kern County"], "date": ["2024-01-01"], "median_price": [1]}))
+    
+    result = market_data.read_dataset("prices")
+    assert pd.api.types.is_datetime64_any_dtype(result["date"])
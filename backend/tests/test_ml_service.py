@@ -30,6 +30,15 @@ def test_investment_score_generation(ml_service):
     assert 0 <= analysis["investment_score"] <= 100
     assert isinstance(analysis["shap_explanations"], list)
 
+def test_precomputed_analyses_are_not_shared(ml_service):
+    first = ml_service.predict_investment_score("Fresno, CA")
+    first["key_highlights"].append("mutated")
+    first["shap_explanations"][0]["impact"] = 1e9
+    
+    second = ml_service.predict_investment_score("Fresno, CA")
+    assert "mutated" not in second["key_highlights"]
+    assert second["shap_explanations"][0]["impact"] != 1e9
+
 def test_top_areas_generation(ml_service):
     areas = ml_service.get_top_investment_areas()
     
@@ -45,8 +54,137 @@ def test_feature_extraction(ml_service):
     assert all(isinstance(f, (int, float)) for f in features)
 
 def test_chart_data_generation(ml_service):
-    chart_data = ml_service._generate_forecast_chart_data(5.0, 3.0, 7.0, [70000, 1.5, 2.5, 4.0, 30, 7.0, 300, 520, 0.0])
+    chart_data = ml_service._generate_forecast_chart_data(5.0, 3.0, 7.0, 650000)
+    
+    assert len(chart_data["dates"]) == len(chart_data["historical"]) + len(chart_data["predicted"])
+    assert len(chart_data["predicted"]) == len(chart_data["lower"]) == len(chart_data["upper"]) == 12
+    assert chart_data["historical"][-1] == 650000
+    assert (chart_data["lower"] <= chart_data["predicted"]).all()
+    assert (chart_data["predicted"] <= chart_data["upper"]).all()
+
+def test_chart_data_horizon_and_granularity(ml_service):
+    monthly = ml_service._generate_forecast_chart_data(5.0, 3.0, 7.0, 650000, horizon_months=60)
+    weekly = ml_service._generate_forecast_chart_data(5.0, 3.0, 7.0, 650000, horizon_months=12, granularity="weekly")
+    
+    assert len(monthly["predicted"]) == 60
+    assert len(weekly["predicted"]) == 52
+    assert monthly["dates"] == sorted(monthly["dates"])
+
+def test_chart_data_rows(ml_service):
+    columns = ml_service._generate_forecast_chart_data(5.0, 3.0, 7.0, 650000)
+    rows = ml_service._chart_columns_to_rows(columns)
+    
+    assert len(rows) == len(columns["dates"])
+    assert all("date" in point for point in rows)
+    assert rows[0]["predicted_price"] is None and rows[-1]["historical_price"] is None
+
+def test_price_forecast_anchored_on_property_price(ml_service):
+    forecast = ml_service.predict_price_forecast("Riverside, CA", horizon_months=24)
+    historical = [p["historical_price"] for p in forecast["chart_data"] if p["historical_price"] is not None]
+    
+    assert historical[-1] == forecast["current_value"]
+    assert len(forecast["chart_data"]) == len(historical) + 24
+
+def test_price_forecast_rejects_long_horizon(ml_service):
+    with pytest.raises(ValueError):
+        ml_service.predict_price_forecast("90210", horizon_months=61)
+
+def test_model_versions_are_set(ml_service):
+    assert ml_service.model_version
+    assert ml_service.data_version
+    assert ml_service.updated_at is not None
+
+def test_price_forecast_is_deterministic(ml_service):
+    assert ml_service.predict_price_forecast("90210") == ml_service.predict_price_forecast("90210")
+
+def test_ml_service_module_import_is_lightweight():
+    import subprocess
+    import sys
+    
+    code = "import sys, app.services.ml_service; print(any(m in sys.modules for m in ('shap', 'lightgbm', 'sklearn', 'pandas')))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+def test_similar_markets_are_sorted_by_distance(ml_service):
+    similar = ml_service.find_similar_markets("Fresno County", k=4)
+    
+    assert len(similar) == 4
+    distances = [market["distance"] for market in similar]
+    assert distances == sorted(distances)
+    assert ml_service.find_similar_markets("Atlantis") is None
+
+def test_score_addresses_batch(ml_service):
+    addresses = ["Beverly Hills, CA", "Riverside, CA", "Beverly Hills, CA", "123 Main St"]
+    result = ml_service.score_addresses(addresses, top_k=2)
+    
+    assert len(result["investment_score"]) == len(addresses)
+    assert result["shap_top_features"].shape == (4, 2)
+    assert result["investment_score"][0] == result["investment_score"][2]
+    assert ml_service.predict_investment_score("Beverly Hills, CA")["investment_score"] == result["investment_score"][0]
+
+def test_investment_table_matches_live_computation(ml_service):
+    import numpy as np
+    
+    features = ml_service._extract_investment_features("90210")
+    score = max(0, min(100, int(ml_service.investment_model.predict([features])[0])))
+    shap_values = ml_service.get_shap_explainer().shap_values(np.asarray([features]))[0]
+    live = ml_service._build_investment_analysis("90210", features, score, shap_values)
+    
+    precomputed = ml_service.predict_investment_score("90210")
+    assert ml_service.investment_table.lookup(features) is not None
+    assert {k: v for k, v in precomputed.items() if k != 'shap_explanations'} == \
+        {k: v for k, v in live.items() if k != 'shap_explanations'}
+    assert [e['impact'] for e in precomputed['shap_explanations']] == \
+        pytest.approx([e['impact'] for e in live['shap_explanations']])
+
+def test_unseen_markets_are_scored_live(ml_service):
+    import numpy as np
+    
+    unseen = np.array([[30, 5.0, 18, 1.5, 2.0, 3.0, 90000, 300, 0.14]], dtype=float)
+    known = np.array([ml_service._extract_investment_features("Riverside, CA")], dtype=float)
+    X = np.vstack([unseen, known])
+    
+    scores, shap_values = ml_service._score_investment_rows(X)
+    assert ml_service.investment_table.rows(X).tolist()[0] == -1
+    assert scores[0] == int(np.clip(ml_service.investment_model.predict(unseen), 0, 100)[0])
+    assert shap_values.shape == X.shape
+
+def test_score_markets_reads_the_investment_table(ml_service, monkeypatch):
+    import numpy as np
+    
+    markets = ml_service.get_market_features()
+    expected = np.clip(ml_service.investment_model.predict(markets[ml_service.feature_names]), 0, 100).astype(int)
+    
+    class NoLivePredictions:
+        def predict(self, X):
+            raise AssertionError("known markets must be served from the table")
+    
+    monkeypatch.setattr(ml_service, "investment_model", NoLivePredictions())
+    assert ml_service.score_markets(markets)["investment_score"].tolist() == expected.tolist()
+
+def test_fitted_counties_forecast_from_their_series(ml_service):
+    forecast = ml_service.predict_price_forecast("Fresno, CA", chart_format="columnar", horizon_months=13)
+    assert ml_service._get_series_row(forecast["county"]) is not None
+    
+    change = ml_service._series_changes()[forecast["county"]]
+    assert forecast["predicted_change"] == change
+    assert forecast["predicted_value"] == pytest.approx(forecast["current_value"] * (1 + change / 100))
+    # The chart follows the same path: its 12-month point is the predicted value
+    assert forecast["chart_data"]["predicted"][12] == pytest.approx(forecast["predicted_value"], abs=1)
+    
+    markets = ml_service.get_market_features()
+    scored = ml_service.score_markets(markets)
+    row = list(markets.index).index(forecast["county"])
+    assert scored["predicted_change"][row] == pytest.approx(change)
+
+def test_series_forecasts_are_computed_once_per_data_version(ml_service, monkeypatch):
+    markets = ml_service.get_market_features()
+    ml_service.score_markets(markets)
     
-    assert isinstance(chart_data, list)
-    assert len(chart_data) > 0
-    assert all("date" in point for point in chart_data)
+    calls = []
+    forecast_change = ml_service.series_model.forecast_change
+    monkeypatch.setattr(ml_service.series_model, "forecast_change",
+                        lambda *args, **kwargs: calls.append(1) or forecast_change(*args, **kwargs))
+    ml_service.score_markets(markets.iloc[:3])
+    ml_service.score_markets(markets.iloc[3:])
+    assert calls == []
@@ -0,0 +1,91 @@
+import os
+import pytest
+from app.core.config import settings
+from app.services import model_registry
+from app.services.ml_service import MLService, get_ml_service, swap_ml_service
+from app.services.model_reload import ModelReloader
+
+@pytest.fixture
+def model_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MODEL_PATH", f"{tmp_path}/models/")
+    return settings.MODEL_PATH
+
+@pytest.fixture
+def restore_service():
+    original = get_ml_service()
+    yield
+    swap_ml_service(original)
+
+def test_training_saves_and_promotes_a_version(model_path):
+    service = MLService()
+
+    assert model_registry.list_versions() == [service.artifact_version]
+    assert model_registry.current_version() == service.artifact_version
+    # A second service loads the promoted version instead of retraining
+    assert MLService().model_version == service.model_version
+
+def test_legacy_flat_artifacts_are_adopted(model_path):
+    service = MLService()
+    version_dir = model_registry.version_path(service.artifact_version)
+    for name in model_registry.MODEL_FILES:
+        with open(f"{version_dir}{name}", "rb") as src, open(f"{model_path}{name}", "wb") as dst:
+            dst.write(src.read())
+    os.remove(f"{model_path}{model_registry.POINTER_FILE}")
+
+    adopted = MLService()
+    assert adopted.artifact_version.startswith("legacy-")
+    assert adopted.model_version == service.model_version
+
+def test_unknown_version_is_rejected(model_path):
+    assert not model_registry.version_exists("../outside")
+    with pytest.raises(ValueError):
+        MLService("missing")
+
+def test_reload_swaps_without_touching_in_flight_service(model_path, restore_service):
+    trained = MLService()
+    swap_ml_service(trained)
+    artifacts = {name: getattr(trained, attr) for name, attr in zip(
+        model_registry.MODEL_FILES, ["price_model", "investment_model", "scaler"]
+    )}
+    new_version = model_registry.save_version(artifacts, version="v-next")
+
+    in_flight = get_ml_service()
+    result = ModelReloader().reload(new_version)
+
+    assert result["previous_version"] == trained.artifact_version
+    assert get_ml_service().artifact_version == new_version
+    assert model_registry.current_version() == new_version
+    # Requests that resolved the old service keep using it
+    assert in_flight.artifact_version == trained.artifact_version
+    assert in_flight.predict_price_forecast("90210") == get_ml_service().predict_price_forecast("90210")
+
+def test_shadow_reload_compares_without_swapping(model_path, restore_service):
+    trained = MLService()
+    swap_ml_service(trained)
+
+    reloader = ModelReloader()
+    result = reloader.reload(trained.artifact_version, shadow=True)
+
+    assert get_ml_service() is trained
+    report = result["report"]
+    assert report["markets"] > 0
+    assert report["investment_score"]["max_abs_diff"] == 0
+    assert set(report["latency_ms"]["candidate"]) == {"forecast", "investment"}
+
+def test_promotion_is_retried_while_a_reload_is_busy(model_path, restore_service, monkeypatch):
+    trained = MLService()
+    swap_ml_service(trained)
+    artifacts = {name: getattr(trained, attr) for name, attr in zip(
+        model_registry.MODEL_FILES, ["price_model", "investment_model", "scaler"]
+    )}
+    model_registry.promote(model_registry.save_version(artifacts, version="v-promoted"))
+
+    reloader = ModelReloader()
+    started = []
+    monkeypatch.setattr(reloader, "_run", lambda version, shadow: started.append(version))
+    reloader.status = {'state': 'loading'}
+    assert not reloader.reload_promoted()
+
+    reloader.status = {'state': 'swapped'}
+    assert reloader.reload_promoted()
+    assert started == ["v-promoted"]
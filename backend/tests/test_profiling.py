@@ -0,0 +1,38 @@
+import asyncio
+import time
+from app.core.profiling import SamplingProfiler, _active_profiler, profile_thread
+from app.services.singleflight import SingleFlight
+
+def busy(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+    return "done"
+
+def test_sampler_collects_collapsed_stacks():
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    busy(0.05)
+    profiler.stop()
+
+    assert profiler.samples > 0
+    assert any(line.rsplit(" ", 1)[0].endswith("test_profiling.py:busy") for line in profiler.collapsed().splitlines())
+    assert profiler.top_functions()[0]["total_samples"] <= profiler.samples
+
+def test_profile_thread_is_a_no_op_without_profiler():
+    assert profile_thread(busy) is busy
+
+def test_threadpool_work_is_sampled():
+    profiler = SamplingProfiler(interval=0.001)
+
+    async def run():
+        token = _active_profiler.set(profiler)
+        try:
+            profiler.start()
+            return await SingleFlight("test-profile").run("key", busy, 0.05)
+        finally:
+            profiler.stop()
+            _active_profiler.reset(token)
+
+    assert asyncio.run(run()) == "done"
+    assert any("busy" in stack[-1] for stack in profiler.stacks)
@@ -0,0 +1,122 @@
+import asyncio
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+from app.core.metrics import metrics
+from app.core.rate_limit import AdmissionControlMiddleware, RateLimiter, TokenBucket, route_cost
+
+async def ok(request):
+    return PlainTextResponse("ok")
+
+def make_client(**kwargs):
+    app = Starlette(routes=[
+        Route("/api/v1/investment/score", ok, methods=["POST"]),
+        Route("/api/v1/rental/calculate", ok, methods=["POST"]),
+        Route("/health", ok)
+    ])
+    app.add_middleware(AdmissionControlMiddleware, **kwargs)
+    return TestClient(app)
+
+def test_token_bucket_refills_over_time():
+    bucket = TokenBucket(capacity=10, refill_rate=2, now=0.0)
+    assert bucket.try_acquire(10, now=0.0) == (True, 0.0)
+
+    allowed, retry_after = bucket.try_acquire(4, now=0.5)
+    assert not allowed
+    assert retry_after == 1.5
+    assert bucket.try_acquire(4, now=2.0)[0]
+
+def test_rate_limiter_evicts_oldest_clients():
+    limiter = RateLimiter(capacity=5, refill_rate=1, max_clients=2, clock=lambda: 0.0)
+    for client in ["a", "b", "c"]:
+        limiter.acquire(client, 1)
+    assert list(limiter._buckets) == ["b", "c"]
+
+def test_route_costs():
+    assert route_cost("POST", "/api/v1/investment/score") == ("/api/v1/investment/score", 5, True)
+    assert route_cost("POST", "/api/v1/rental/calculate")[1] == 1
+    assert route_cost("GET", "/api/v1/unknown") == ("other", 1, False)
+
+def test_expensive_routes_exhaust_the_bucket_first():
+    client = make_client(capacity=10, refill_rate=0.001)
+
+    assert client.post("/api/v1/investment/score").status_code == 200
+    assert client.post("/api/v1/investment/score").status_code == 200
+    response = client.post("/api/v1/investment/score")
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) > 0
+    assert response.headers["x-ratelimit-remaining"] == "0"
+
+    # Health checks are never limited
+    assert client.get("/health").status_code == 200
+
+def test_clients_are_limited_independently():
+    client = make_client(capacity=5, refill_rate=0.001, api_keys=["a", "b"])
+
+    assert client.post("/api/v1/investment/score", headers={"X-API-Key": "a"}).status_code == 200
+    assert client.post("/api/v1/investment/score", headers={"X-API-Key": "a"}).status_code == 429
+    assert client.post("/api/v1/investment/score", headers={"X-API-Key": "b"}).status_code == 200
+
+def test_unknown_api_keys_share_the_ip_bucket():
+    client = make_client(capacity=5, refill_rate=0.001, api_keys=["a"])
+
+    assert client.post("/api/v1/investment/score", headers={"X-API-Key": "random-1"}).status_code == 200
+    assert client.post("/api/v1/investment/score", headers={"X-API-Key": "random-2"}).status_code == 429
+    assert client.post("/api/v1/investment/score", headers={"X-API-Key": "a"}).status_code == 200
+
+def test_inference_routes_are_shed_when_queue_is_full():
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow(scope, receive, send):
+        started.set()
+        await release.wait()
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    middleware = AdmissionControlMiddleware(slow, max_queue_depth=1)
+
+    async def request(path):
+        messages = []
+        scope = {"type": "http", "method": "POST", "path": path, "headers": [], "client": ("1.2.3.4", 1)}
+
+        async def receive():
+            return {"type": "http.request", "body": b""}
+
+        async def send(message):
+            messages.append(message)
+
+        await middleware(scope, receive, send)
+        return messages[0]["status"]
+
+    async def run():
+        first = asyncio.create_task(request("/api/v1/investment/score"))
+        await started.wait()
+        shed = await request("/api/v1/investment/score")
+        # Cheap routes are still admitted while inference is saturated
+        cheap = asyncio.create_task(request("/api/v1/rental/calculate"))
+        release.set()
+        return await first, shed, await cheap
+
+    shed_before = metrics.get("load_shed_total", route="/api/v1/investment/score")
+    assert asyncio.run(run()) == (200, 503, 200)
+    assert metrics.get("load_shed_total", route="/api/v1/investment/score") == shed_before + 1
+    assert middleware.inference_inflight == 0
+
+def test_proxied_clients_are_keyed_by_forwarded_address():
+    client = make_client(capacity=5, refill_rate=0.001, trust_proxy_headers=True)
+
+    assert client.post("/api/v1/investment/score", headers={"X-Real-IP": "10.0.0.1"}).status_code == 200
+    assert client.post("/api/v1/investment/score", headers={"X-Real-IP": "10.0.0.1"}).status_code == 429
+    assert client.post("/api/v1/investment/score", headers={"X-Real-IP": "10.0.0.2"}).status_code == 200
+    # Only the entry the proxy appended counts; a spoofed first hop does not buy a new bucket
+    spoofed = {"X-Forwarded-For": "1.1.1.1, 10.0.0.3"}
+    assert client.post("/api/v1/investment/score", headers=spoofed).status_code == 200
+    spoofed = {"X-Forwarded-For": "2.2.2.2, 10.0.0.3"}
+    assert client.post("/api/v1/investment/score", headers=spoofed).status_code == 429
+
+def test_api_keys_setting_accepts_comma_separated_env(monkeypatch):
+    monkeypatch.setenv("RATE_LIMIT_API_KEYS", "abc, def,")
+    import app.core.config as config
+
+    assert config.Settings().rate_limit_api_keys == ["abc", "def"]
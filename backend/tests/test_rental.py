@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from app.services.rental import rental_returns, scenario_arrays, solve_rental_targets
+
+SCENARIO = {
+    "purchase_price": 500000,
+    "down_payment_percent": 20,
+    "interest_rate": 7.0,
+    "loan_term_years": 30,
+    "monthly_rent": 3500,
+    "property_tax_percent": 1.2,
+    "annual_insurance": 1200,
+    "maintenance_percent": 2.0,
+    "vacancy_percent": 5.0,
+    "management_fee_percent": 8.0,
+    "capex_percent": 1.0,
+    "appreciation_percent": 3.5
+}
+SCENARIOS = [SCENARIO, {**SCENARIO, "interest_rate": 0.0, "monthly_rent": 5200}, {**SCENARIO, "purchase_price": 250000}]
+TARGETS = [0.0, 4.0, 8.0]
+
+def test_rental_returns_matches_scalar_formulas():
+    returns = rental_returns(SCENARIO)
+    loan, rate, n = 400000, 0.07 / 12, 360
+    mortgage = loan * rate * (1 + rate) ** n / ((1 + rate) ** n - 1)
+    rent = 3500 * 0.95
+    noi = rent - (500000 * (1.2 + 2.0 + 1.0) / 100 + 1200) / 12 - rent * 0.08
+    assert float(returns["monthly_cash_flow"]) == pytest.approx(noi - mortgage)
+    assert float(returns["cap_rate"]) == pytest.approx(noi * 12 / 500000 * 100)
+    assert float(returns["total_cash_invested"]) == pytest.approx(115000)
+
+def test_solutions_round_trip_through_the_calculator():
+    arrays = scenario_arrays(SCENARIOS)
+    solved = solve_rental_targets(arrays, TARGETS)
+
+    cash_flow = rental_returns({**arrays, "monthly_rent": solved["break_even_rent"]})["monthly_cash_flow"]
+    np.testing.assert_allclose(cash_flow, 0, atol=1e-6)
+
+    grid = {name: values[:, None] for name, values in arrays.items()}
+    for column in ("max_purchase_price", "min_down_payment_percent"):
+        field = "purchase_price" if column == "max_purchase_price" else "down_payment_percent"
+        solution = solved[column]
+        coc = rental_returns({**grid, field: solution})["cash_on_cash_return"]
+        targets = np.broadcast_to(TARGETS, solution.shape)
+        reached = np.isfinite(solution)
+        # Every solution meets its target; those not pinned to a bound meet it exactly
+        assert (coc[reached] >= targets[reached] - 1e-9).all()
+        interior = reached & (solution > 0)
+        np.testing.assert_allclose(coc[interior], targets[interior], atol=1e-6)
+
+def test_unreachable_targets_are_nan_and_easy_ones_need_no_down_payment():
+    solved = solve_rental_targets(scenario_arrays([SCENARIO]), [-1000.0, 8.0])
+    assert solved["min_down_payment_percent"][0, 0] == 0.0
+    # Even an all-cash purchase at this price stays below 8% cash-on-cash
+    assert np.isnan(solved["min_down_payment_percent"][0, 1])
+    # Rent that cannot cover insurance has no price at which it breaks even
+    solved = solve_rental_targets(scenario_arrays([{**SCENARIO, "monthly_rent": 50}]), [0.0])
+    assert np.isnan(solved["max_purchase_price"][0, 0])
+
+def test_bounds_are_not_reported_as_solutions():
+    # Rent below insurance: cash-on-cash improves with price, so no price is too high
+    scenario = {**SCENARIO, "monthly_rent": 50, "interest_rate": 0.0, "property_tax_percent": 0,
+                "maintenance_percent": 0, "capex_percent": 0, "down_payment_percent": 100}
+    solved = solve_rental_targets(scenario_arrays([scenario]), [-50.0], target_monthly_cash_flow=-500.0)
+    assert np.isposinf(solved["max_purchase_price"][0, 0])
+    # Cash flow at zero rent already beats a -500/month target
+    assert solved["break_even_rent"][0] == 0.0
+
+def test_solve_endpoint():
+    from app.main import app
+
+    client = TestClient(app)
+    response = client.post("/api/v1/rental/solve", json={"scenarios": SCENARIOS, "target_cash_on_cash": TARGETS})
+    assert response.status_code == 200
+    solutions = response.json()["solutions"]
+    assert len(solutions) == 3 and all(len(s["targets"]) == 3 for s in solutions)
+    calculated = client.post("/api/v1/rental/calculate", json=SCENARIO).json()
+    assert solutions[0]["current"] == calculated
+    assert solutions[0]["targets"][0]["max_purchase_price_unbounded"] is False
+    assert client.post("/api/v1/rental/solve", json={"scenarios": []}).status_code == 422
+
+@pytest.mark.parametrize("field, value", [("purchase_price", 0), ("loan_term_years", 0), ("vacancy_percent", 120)])
+def test_out_of_range_inputs_are_rejected(field, value):
+    from app.main import app
+
+    client = TestClient(app)
+    scenario = {**SCENARIO, field: value}
+    assert client.post("/api/v1/rental/solve", json={"scenarios": [scenario]}).status_code == 422
+    assert client.post("/api/v1/rental/calculate", json=scenario).status_code == 422
@@ -0,0 +1,48 @@
+import numpy as np
+from app.services.result_cache import ResultCache
+
+def make_cache(tmp_path, max_bytes=1024 * 1024):
+    return ResultCache(str(tmp_path / "cache" / "results.sqlite3"), max_bytes)
+
+def test_get_or_compute_computes_once(tmp_path):
+    cache = make_cache(tmp_path)
+    calls = []
+
+    def compute(x):
+        calls.append(x)
+        return {"value": np.array([x, x * 2])}
+
+    # Computed and cached results both come back as plain JSON values
+    assert cache.get_or_compute("route", "k", compute, 2) == {"value": [2, 4]}
+    assert cache.get_or_compute("route", "k", compute, 2) == {"value": [2, 4]}
+    assert calls == [2]
+
+def test_entries_survive_restart(tmp_path):
+    make_cache(tmp_path).set("test-restart", "hot", {"price": 650000})
+
+    # A new instance (another worker, or after a restart) sees the same file
+    restarted = make_cache(tmp_path)
+    assert restarted.get("test-restart", "hot") == {"price": 650000}
+    assert restarted.stats()["routes"]["test-restart"]["hit_rate"] == 1.0
+
+def test_wal_mode(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.set("route", "k", 1)
+    assert cache._connection().execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+def test_eviction_keeps_recent_entries(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=2000)
+    for i in range(20):
+        cache.set("route", f"k{i}", "x" * 200)
+        cache._connection().execute("UPDATE results SET accessed_at = ? WHERE key = ?", (i, f"k{i}"))
+
+    assert cache.evict() > 0
+    assert cache.stats()["bytes"] <= 2000
+    assert cache.get("route", "k19") is not None
+    assert cache.get("route", "k0") is None
+
+def test_disabled_cache_always_computes(tmp_path):
+    cache = ResultCache(str(tmp_path / "results.sqlite3"), 1024, enabled=False)
+    cache.set("route", "k", 1)
+    assert cache.get("route", "k") is None
+    assert cache.get_or_compute("route", "k", lambda: 2) == 2
@@ -0,0 +1,61 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.database import Base
+from app.models.database import PriceHistory, EconomicIndicator, CountyMonthlyStats
+from app.services.rollups import refresh_rollups, get_county_monthly_stats
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+def _add_prices(db, county_id, date, prices):
+    # One row per (county, date): spread several prices over consecutive days
+    for i, price in enumerate(prices):
+        db.add(PriceHistory(county_id=county_id, date=date + timedelta(days=i), median_price=price,
+                            price_per_sqft=price / 1000, sales_volume=10, inventory=100))
+    db.commit()
+
+def test_refresh_builds_county_month_rows(db):
+    _add_prices(db, 1, datetime(2024, 1, 5), [500000, 520000])
+    _add_prices(db, 1, datetime(2024, 2, 5), [530000])
+    db.add(EconomicIndicator(county_id=1, date=datetime(2024, 1, 20), unemployment_rate=4.0,
+                             employment_growth=2.0, population_growth=1.0, new_construction=300, mortgage_rate=6.5))
+    db.commit()
+    
+    refresh_rollups(db)
+    
+    months = get_county_monthly_stats(db, 1)
+    assert [m["month"] for m in months] == ["2024-01-01", "2024-02-01"]
+    assert months[0]["sales_volume"] == 20
+    assert months[0]["unemployment_rate"] == 4.0
+
+def test_incremental_refresh_only_touches_given_months(db):
+    _add_prices(db, 1, datetime(2024, 1, 5), [500000])
+    _add_prices(db, 1, datetime(2024, 2, 5), [530000])
+    refresh_rollups(db)
+    
+    # New rows for both months, but only February is refreshed
+    _add_prices(db, 1, datetime(2024, 1, 25), [900000])
+    _add_prices(db, 1, datetime(2024, 2, 25), [900000])
+    refresh_rollups(db, [datetime(2024, 2, 25)])
+    
+    months = {m["month"]: m for m in get_county_monthly_stats(db, 1)}
+    assert months["2024-01-01"]["sales_volume"] == 10
+    assert months["2024-02-01"]["sales_volume"] == 20
+    assert db.query(CountyMonthlyStats).count() == 2
+
+def test_sqlite_fallback_uses_plain_tables():
+    from sqlalchemy import inspect
+    from app.core.partitions import prepare_schema, ensure_partitions
+    
+    engine = create_engine("sqlite:///:memory:")
+    prepare_schema(engine)
+    assert "price_history" in inspect(engine).get_table_names()
+    with engine.connect() as connection:
+        assert ensure_partitions(connection, "price_history", [datetime(2024, 1, 1)]) == []
@@ -0,0 +1,28 @@
+from sqlalchemy import create_engine, func
+from sqlalchemy.orm import sessionmaker
+from app.core.config import settings
+from app.models.database import PriceHistory, EconomicIndicator, CountyMonthlyStats
+from app.services import market_data
+from app.scripts.seed_data import seed_database
+
+def test_seeding_twice_does_not_duplicate_rows(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(settings, "DATABASE_URL", f"sqlite:///{tmp_path}/seed.sqlite")
+    monkeypatch.setattr(settings, "DATA_PATH", f"{tmp_path}/data/")
+    monkeypatch.setattr(settings, "DATA_FORMAT", "parquet")
+    session = sessionmaker(bind=create_engine(settings.DATABASE_URL))
+
+    seed_database()
+    with session() as db:
+        counts = (db.query(PriceHistory).count(), db.query(EconomicIndicator).count())
+        volume = db.query(func.sum(CountyMonthlyStats.sales_volume)).scalar()
+
+    prices = market_data.read_dataset("prices")
+    capsys.readouterr()
+    seed_database()
+    assert capsys.readouterr().out.strip().endswith("Database already seeded")
+    with session() as db:
+        assert (db.query(PriceHistory).count(), db.query(EconomicIndicator).count()) == counts
+        assert db.query(func.sum(CountyMonthlyStats.sales_volume)).scalar() == volume
+    assert counts[0] > 0
+    # The served files are not regenerated, so ingested rows survive a restart
+    assert market_data.read_dataset("prices").equals(prices)
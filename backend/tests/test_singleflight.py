@@ -0,0 +1,44 @@
+import asyncio
+import threading
+import time
+from app.core.metrics import metrics
+from app.services.singleflight import SingleFlight
+
+def test_concurrent_calls_share_one_computation():
+    calls = []
+    lock = threading.Lock()
+    
+    def slow_double(x):
+        with lock:
+            calls.append(x)
+        time.sleep(0.1)
+        return x * 2
+    
+    async def run():
+        flight = SingleFlight("test-share")
+        return await asyncio.gather(*[flight.run("key", slow_double, 21) for _ in range(10)])
+    
+    results = asyncio.run(run())
+    assert results == [42] * 10
+    assert calls == [21]
+    assert metrics.get("singleflight_coalesced_total", group="test-share") == 9
+
+def test_distinct_keys_are_not_coalesced():
+    async def run():
+        flight = SingleFlight("test-distinct")
+        return await asyncio.gather(flight.run("a", lambda: "a"), flight.run("b", lambda: "b"))
+    
+    assert asyncio.run(run()) == ["a", "b"]
+    assert metrics.get("singleflight_executions_total", group="test-distinct") == 2
+
+def test_errors_propagate_to_all_waiters():
+    def fail():
+        time.sleep(0.05)
+        raise ValueError("boom")
+    
+    async def run():
+        flight = SingleFlight("test-error")
+        return await asyncio.gather(*[flight.run("key", fail) for _ in range(3)], return_exceptions=True)
+    
+    results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
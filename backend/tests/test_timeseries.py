@@ -0,0 +1,85 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from app.core.config import settings
+from app.services import market_data, timeseries
+from app.services.timeseries import SeriesModel, monthly_matrix
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "DATA_PATH", f"{tmp_path}/")
+    monkeypatch.setattr(settings, "DATA_FORMAT", "parquet")
+    return tmp_path
+
+def _synthetic(n_series: int = 200, n_months: int = 60, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_months)
+    trend = rng.uniform(0.001, 0.006, (n_series, 1))
+    amplitude = rng.uniform(0.01, 0.03, (n_series, 1))
+    log_prices = 12 + trend * t + amplitude * np.sin(2 * np.pi * t / 12) + rng.normal(0, 0.002, (n_series, n_months))
+    return np.exp(log_prices), trend[:, 0], amplitude[:, 0]
+
+def test_batched_fit_recovers_trend_and_season():
+    Y, trend, amplitude = _synthetic()
+    Y[np.random.default_rng(1).random(Y.shape) < 0.1] = np.nan
+    model = SeriesModel.fit([str(i) for i in range(len(Y))], 600, Y)
+
+    assert len(model) == len(Y)
+    np.testing.assert_allclose(model.coef[:, 1], trend, atol=2e-4)
+    np.testing.assert_allclose(model.coef[:, 2], amplitude, atol=2e-3)
+    # A full year ahead the seasonal swing cancels and only the trend remains
+    np.testing.assert_allclose(model.log_ratios(np.array([12.0]), seasonal_only=True)[:, 0], 0, atol=1e-9)
+
+def test_short_series_are_not_fitted():
+    Y, _, _ = _synthetic(n_series=2)
+    Y[1, :-6] = np.nan
+    model = SeriesModel.fit(["long", "short"], 600, Y)
+
+    assert model.row("long") == 0
+    assert model.row("short") is None
+
+@pytest.mark.parametrize("n_months", [0, 6])
+def test_no_fitted_series_gives_an_empty_model(data_dir, n_months):
+    prices = pd.DataFrame({
+        "county": ["Fresno County"] * n_months,
+        "date": pd.date_range("2024-01-01", periods=n_months, freq="MS"),
+        "median_price": [400000.0] * n_months
+    })
+    model = SeriesModel.fit(*monthly_matrix(prices))
+
+    assert len(model) == 0 and model.row("Fresno County") is None
+    assert model.forecast_change(12) == {}
+    assert model.log_ratios(np.array([1.0, 2.0])).shape == (0, 2)
+    model.save(f"{data_dir}/empty.npz")
+    assert len(SeriesModel.load(f"{data_dir}/empty.npz")) == 0
+
+def test_monthly_matrix_averages_within_month():
+    prices = pd.DataFrame({
+        "county": ["Kern County", "Kern County", "Kern County", "Fresno County"],
+        "date": pd.to_datetime(["2024-01-02", "2024-01-30", "2024-03-01", "2024-02-01"]),
+        "median_price": [100.0, 200.0, 300.0, 400.0]
+    })
+    keys, first, Y = monthly_matrix(prices)
+
+    assert keys == ["Fresno County", "Kern County"]
+    assert first == np.datetime64("2024-01", "M").astype(int)
+    np.testing.assert_array_equal(Y[1], [150.0, np.nan, 300.0])
+
+def test_fitted_parameters_are_cached_until_data_changes(data_dir):
+    dates = pd.date_range("2020-01-01", periods=36, freq="MS")
+    market_data.write_dataset("prices", pd.DataFrame({
+        "county": "Kern County", "date": dates, "median_price": np.linspace(300000, 360000, 36)
+    }))
+
+    model = timeseries.load_series_model()
+    path = f"{settings.DATA_PATH}{timeseries.SERIES_MODEL_FILE}"
+    cached = timeseries.load_series_model()
+    assert cached.keys == model.keys
+    np.testing.assert_array_equal(cached.coef, model.coef)
+
+    # A newer data file invalidates the cached parameters
+    os.utime(path, (0, 0))
+    refit = timeseries.load_series_model()
+    assert os.path.getmtime(path) > 0
+    np.testing.assert_allclose(refit.coef, model.coef)
@@ -0,0 +1,58 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pytest
+from app.core.config import settings
+from app.scripts import tune_models
+from app.services import model_registry
+from app.services.ml_service import MLService
+
+@pytest.fixture
+def model_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MODEL_PATH", f"{tmp_path}/models/")
+    monkeypatch.setattr(settings, "HYPERPARAMETERS_PATH", f"{tmp_path}/hyperparameters.json")
+    return settings.MODEL_PATH
+
+def test_sample_candidates_are_distinct_and_capped():
+    space = {'a': [1, 2], 'b': [None, 'x']}
+    candidates = tune_models.sample_candidates(space, 10, seed=0)
+
+    assert len(candidates) == 4
+    assert len({tuple(sorted(map(str, c.items()))) for c in candidates}) == 4
+
+def test_successive_halving_narrows_to_full_data_finalists():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(270, 3))
+    y = X[:, 0] * 2 + rng.normal(scale=0.1, size=270)
+    candidates = tune_models.sample_candidates(tune_models.SEARCH_SPACES['investment_model'], 9, seed=0)
+    for params in candidates:
+        params['n_estimators'] = 10
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        search = tune_models.successive_halving('investment_model', candidates, X, y, executor,
+                                                factor=3, min_resources=30, n_splits=3, finalists=2)
+        selected, eligible = tune_models.select_finalist('investment_model', search['finalists'], X, y, executor)
+
+    assert [r['resources'] for r in search['rounds']] == [30, 90, 270]
+    assert [r['candidates'] for r in search['rounds']] == [9, 3, 2]
+    maes = [f['cv_mae'] for f in search['finalists']]
+    assert maes == sorted(maes)
+    # Only finalists within one standard error of the best are eligible; the fastest wins
+    assert all(f['cv_mae'] <= maes[0] + search['finalists'][0]['cv_mae_sem'] for f in eligible)
+    assert selected['latency_ms'] == min(f['latency_ms'] for f in eligible)
+
+def test_successive_halving_needs_two_folds():
+    with pytest.raises(ValueError):
+        tune_models.successive_halving('investment_model', [{}], np.zeros((10, 2)), np.zeros(10), None, n_splits=1)
+
+def test_train_models_uses_saved_hyperparameters(model_path):
+    model_registry.save_hyperparameters({'models': {
+        'price_model': {'params': {'n_estimators': 20, 'num_leaves': 15}},
+        'investment_model': {'params': {'n_estimators': 15, 'min_samples_leaf': 4}}
+    }})
+
+    service = MLService()
+
+    assert service.price_model.get_params()['n_estimators'] == 20
+    assert service.price_model.get_params()['num_leaves'] == 15
+    assert service.investment_model.get_params()['n_estimators'] == 15
+    assert service.investment_model.get_params()['min_samples_leaf'] == 4
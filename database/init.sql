@@ -20,30 +20,71 @@ CREATE TABLE IF NOT EXISTS counties (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
--- Create price history table
+-- Create price history table, range-partitioned by year on date.
+-- Yearly partitions (price_history_y2024, ...) are created on demand by
+-- app.core.partitions before rows are loaded; the default partition only
+-- catches rows outside every created range.
 CREATE TABLE IF NOT EXISTS price_history (
-    id SERIAL PRIMARY KEY,
+    id BIGSERIAL,
     county_id INTEGER REFERENCES counties(id),
     zip_code VARCHAR(10),
-    date TIMESTAMP,
+    date TIMESTAMP NOT NULL,
     median_price DECIMAL(12,2),
     price_per_sqft DECIMAL(8,2),
     sales_volume INTEGER,
     inventory INTEGER,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, date),
+    -- Upsert target for app.services.ingestion (includes the partition key)
+    CONSTRAINT uq_price_history_county_date UNIQUE (county_id, date)
+) PARTITION BY RANGE (date);
 
--- Create economic indicators table
+CREATE TABLE IF NOT EXISTS price_history_default PARTITION OF price_history DEFAULT;
+
+-- Create economic indicators table, partitioned the same way
 CREATE TABLE IF NOT EXISTS economic_indicators (
-    id SERIAL PRIMARY KEY,
+    id BIGSERIAL,
     county_id INTEGER REFERENCES counties(id),
-    date TIMESTAMP,
+    date TIMESTAMP NOT NULL,
     unemployment_rate DECIMAL(4,2),
     employment_growth DECIMAL(5,2),
     population_growth DECIMAL(5,2),
     new_construction INTEGER,
     mortgage_rate DECIMAL(4,2),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (id, date),
+    CONSTRAINT uq_economic_indicators_county_date UNIQUE (county_id, date)
+) PARTITION BY RANGE (date);
+
+CREATE TABLE IF NOT EXISTS economic_indicators_default PARTITION OF economic_indicators DEFAULT;
+
+-- County-month rollups, refreshed incrementally by app.services.rollups
+CREATE TABLE IF NOT EXISTS county_monthly_stats (
+    id SERIAL PRIMARY KEY,
+    county_id INTEGER NOT NULL REFERENCES counties(id),
+    month TIMESTAMP NOT NULL,
+    median_price DECIMAL(12,2),
+    price_per_sqft DECIMAL(8,2),
+    sales_volume INTEGER,
+    inventory INTEGER,
+    unemployment_rate DECIMAL(4,2),
+    employment_growth DECIMAL(5,2),
+    population_growth DECIMAL(5,2),
+    new_construction INTEGER,
+    mortgage_rate DECIMAL(4,2),
+    refreshed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT uq_county_monthly_stats UNIQUE (county_id, month)
+);
+
+-- Per-source high-water marks for incremental ingestion (app.services.ingestion)
+CREATE TABLE IF NOT EXISTS ingestion_watermarks (
+    id SERIAL PRIMARY KEY,
+    source VARCHAR(255) UNIQUE NOT NULL,
+    dataset VARCHAR(50) NOT NULL,
+    watermark TIMESTAMP,
+    rows_ingested BIGINT DEFAULT 0,
+    last_file TEXT,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
 -- Create indexes for better performance
@@ -52,6 +93,11 @@ CREATE INDEX IF NOT EXISTS idx_price_history_county_date ON price_history(county
 CREATE INDEX IF NOT EXISTS idx_price_history_zip ON price_history(zip_code);
 CREATE INDEX IF NOT EXISTS idx_economic_county_date ON economic_indicators(county_id, date);
 
+-- BRIN indexes stay tiny on append-mostly, date-ordered data; they are
+-- created on every partition through the partitioned parent
+CREATE INDEX IF NOT EXISTS idx_price_history_date_brin ON price_history USING BRIN (date);
+CREATE INDEX IF NOT EXISTS idx_economic_date_brin ON economic_indicators USING BRIN (date);
+
 -- Insert initial California counties data
 INSERT INTO counties (name, region, population, median_income, median_home_price, price_per_sqft, rental_yield, price_growth_1yr, price_growth_5yr, inventory_months, days_on_market) VALUES
 ('Los Angeles County', 'Southern California', 10040000, 68093, 849000, 650, 4.2, 3.8, 42.1, 3.2, 28),